@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+"""
+Archive Module
+
+This module stores played hands in a compact binary file of fixed-width
+records, and reads them back through a memory map as NumPy views, so hand N
+is found by arithmetic instead of by parsing every line before it.
+
+A file starts with a header of HEADER_SIZE bytes: the magic bytes b'PITCHARC',
+the format version, the number of players and the most tricks per hand.  The
+records follow with no padding, one per hand:
+
+    trump   (uint8)  The trump index (see card_codes.trump_index()).
+    leader  (uint8)  The seat that led the first trick.
+    tricks  (uint8)  The number of tricks played.
+    cards   (uint8)  The card codes of each trick in the order played, shape
+                     (max tricks, players), card_codes.NO_PLAY for unused
+                     places.
+
+With four players and six tricks a record is 27 bytes, against about 100
+bytes for the same hand in a JSONL log (see game_log).
+
+Classes:
+    ArchiveWriter: Writes hands to an archive file.
+    ArchiveReader: Reads an archive file through a memory map.
+
+Functions:
+    record_dtype: Returns the NumPy dtype of a record.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+import mmap
+import struct
+
+import numpy as np
+
+import card_codes
+from game_log import GameRecord
+
+MAGIC = b'PITCHARC'
+VERSION = 1
+HEADER = struct.Struct('<8sHBB4x')
+HEADER_SIZE = HEADER.size
+
+
+def record_dtype(players=4, max_tricks=6):
+    """
+    Returns the NumPy dtype of an archive record.
+
+    Args:
+        players (int, optional): The number of players.
+        max_tricks (int, optional): The most tricks per hand.
+
+    Returns:
+        dtype: The structured dtype of one record.
+    """
+    return np.dtype([('trump', np.uint8), ('leader', np.uint8),
+                     ('tricks', np.uint8),
+                     ('cards', np.uint8, (max_tricks, players))])
+
+
+class ArchiveWriter:
+    """
+    A class to write hands to an archive file
+    """
+
+    def __init__(self, path, players=4, max_tricks=6):
+        """
+        Initializes an ArchiveWriter object and writes the file header.
+
+        Args:
+            path (str): The path of the archive; an existing file is replaced.
+            players (int, optional): The number of players.
+            max_tricks (int, optional): The most tricks per hand.
+        """
+        if not 0 < players < 256 or not 0 < max_tricks < 256:
+            raise ValueError(f"Invalid record shape: {players} players, "
+                             f"{max_tricks} tricks")
+        self.players = players
+        self.max_tricks = max_tricks
+        self.dtype = record_dtype(players, max_tricks)
+        self.count = 0
+        # pylint: disable-next=consider-using-with
+        self._file = open(path, 'wb')
+        self._file.write(HEADER.pack(MAGIC, VERSION, players, max_tricks))
+
+    def __enter__(self):
+        """
+        Returns the writer for a with statement.
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Closes the archive at the end of a with statement.
+        """
+        self.close()
+
+    def write(self, record):
+        """
+        Writes one hand.
+
+        Args:
+            record (GameRecord): The hand, with the cards as codes.
+        """
+        row = np.zeros(1, dtype=self.dtype)
+        row['cards'] = card_codes.NO_PLAY
+        if len(record.tricks) > self.max_tricks:
+            raise ValueError(f"A hand has more than {self.max_tricks} tricks")
+        row['trump'] = card_codes.trump_index(record.trump)
+        row['leader'] = record.leader
+        row['tricks'] = len(record.tricks)
+        for number, trick in enumerate(record.tricks):
+            if len(trick) > self.players:
+                raise ValueError(f"A trick has more than {self.players} cards")
+            row['cards'][0, number, :len(trick)] = trick
+        self._file.write(row.tobytes())
+        self.count += 1
+
+    def write_array(self, records):
+        """
+        Writes many hands at once.
+
+        Args:
+            records (ndarray): The hands, as an array of the record dtype.
+        """
+        records = np.asarray(records)
+        if records.dtype != self.dtype:
+            raise ValueError(f"Records must have dtype {self.dtype}")
+        self._file.write(np.ascontiguousarray(records).tobytes())
+        self.count += len(records)
+
+    def close(self):
+        """
+        Closes the archive file.
+        """
+        self._file.close()
+
+
+class ArchiveReader:
+    """
+    A class to read an archive file through a memory map
+    """
+
+    def __init__(self, path):
+        """
+        Initializes an ArchiveReader object and maps the file.
+
+        Args:
+            path (str): The path of the archive.
+        """
+        with open(path, 'rb') as file:
+            header = file.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE:
+                raise ValueError(f"Not an archive file: {path}")
+            magic, version, self.players, self.max_tricks = \
+                HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"Not an archive file: {path}")
+            if version != VERSION:
+                raise ValueError(f"Unsupported archive version: {version}")
+            self.dtype = record_dtype(self.players, self.max_tricks)
+            size = file.seek(0, 2)
+            if (size - HEADER_SIZE) % self.dtype.itemsize:
+                raise ValueError(f"Archive ends in a partial record: {path}")
+            self._map = (mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                         if size > HEADER_SIZE else None)
+
+        # A read-only view of every record, sharing the pages of the map
+        self.records = (np.frombuffer(self._map, dtype=self.dtype,
+                                      offset=HEADER_SIZE)
+                        if self._map is not None else
+                        np.empty(0, dtype=self.dtype))
+
+    def __enter__(self):
+        """
+        Returns the reader for a with statement.
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Closes the archive at the end of a with statement.
+        """
+        self.close()
+
+    def __len__(self):
+        """
+        Returns the number of hands in the archive.
+
+        Returns:
+            int: The number of records.
+        """
+        return len(self.records)
+
+    def __getitem__(self, index):
+        """
+        Returns hands by position without copying them.
+
+        Args:
+            index (int or slice): The position of a hand, or a slice.
+
+        Returns:
+            ndarray: A view of the records.
+        """
+        return self.records[index]
+
+    @property
+    def cards(self):
+        """
+        Returns the card codes of every hand, shape (hands, max tricks,
+        players), as a view.
+        """
+        return self.records['cards']
+
+    @property
+    def trumps(self):
+        """
+        Returns the trump index of every hand, as a view.
+        """
+        return self.records['trump']
+
+    def record(self, index):
+        """
+        Returns one hand as a GameRecord.
+
+        Args:
+            index (int): The position of the hand.
+
+        Returns:
+            GameRecord: The hand, with the cards as codes.
+        """
+        row = self.records[index]
+        cards = row['cards'][:row['tricks']].tolist()
+        return GameRecord(card_codes.TRUMP_SUITS[row['trump']],
+                          int(row['leader']),
+                          tuple(tuple(code for code in trick
+                                      if code != card_codes.NO_PLAY)
+                                for trick in cards))
+
+    def __iter__(self):
+        """
+        Iterates over the hands as GameRecords.
+
+        Yields:
+            GameRecord: The hands, in file order.
+        """
+        for index in range(len(self.records)):
+            yield self.record(index)
+
+    def close(self):
+        """
+        Releases the records and unmaps the file.  Views taken from the
+        reader must be released first.
+        """
+        self.records = np.empty(0, dtype=self.dtype)
+        if self._map is not None:
+            self._map.close()
+            self._map = None
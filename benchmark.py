@@ -0,0 +1,577 @@
+#!/usr/bin/env python
+"""
+Benchmark Module
+
+This module times the hot paths of the Card class and of the modules built
+on it.  Every Card method used in play is timed on its own.  The precomputed trump
+table is compared against applying the trump rules directly, which is what
+every call did before the table existed, bitmask hands are compared
+against lists of cards, batched trick resolution is compared against
+comparing Card objects, legal move masks are compared against is_trump()
+calls and suit comparisons, and the dealing throughput of Deck and the time
+the double-dummy Solver takes per deal are measured.  Exact card odds are
+compared against estimating them by dealing, and rendering hands in bulk
+is compared against printing them card by card.
+
+Every result is in nanoseconds per call, so lower is better.  Run from the
+command line, the results can be written as JSON and compared against a
+stored baseline, failing when any benchmark is slower than the baseline by
+more than a tolerance:
+
+    python benchmark.py --json baseline.json
+    python benchmark.py --baseline baseline.json --tolerance 0.25
+
+Functions:
+    branching_set_trump: Sets the trump suit of a card by applying the rules.
+    time_per_call: Times a function and returns nanoseconds per call.
+    bench_card: Times the Card methods one at a time.
+    bench_sort: Times sorting hands for each trump suit.
+    bench_trump: Compares the trump table against the trump rules.
+    bench_hand: Compares bitmask hands against lists of cards.
+    bench_deal: Times how long a Deck takes to deal each hand.
+    bench_tricks: Compares batched trick resolution against Card comparisons.
+    bench_legal: Compares legal move masks against Card comparisons.
+    bench_solver: Measures how long the Solver takes to solve a full deal.
+    bench_probability: Compares exact card odds against sampling deals.
+    bench_render: Compares bulk rendering against printing card by card.
+    run: Runs groups of benchmarks.
+    compare: Finds the results that are slower than a baseline.
+    write_json: Writes benchmark results as JSON.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+import argparse
+import io
+import json
+import platform
+import random
+import sys
+import timeit
+
+from card import Card, DECK, SUITS
+import card_codes
+from deck import Deck
+from hand import Hand
+from legal import legal_mask, legal_moves_by_card
+from probability import OPPONENTS, Unseen
+from render import Formatter
+from solver import Solver
+from tricks import resolve_tricks, resolve_tricks_by_card
+
+TRUMP_SUITS = (None, *SUITS)
+
+
+def branching_set_trump(card, suit=None):
+    """
+    Sets the trump suit of a card by applying the trump rules directly.
+
+    Args:
+        card (Card): The card to update.
+        suit (str, optional): The trump suit to set. If None, resets the card.
+    """
+    card.symbol, card.rank, card.points, _ = Card.trump_entry(
+        card.name, card.suit, suit)
+    card.trump_suit = suit
+
+
+def time_per_call(func, calls, repeat=5):
+    """
+    Times a function that makes a known number of calls.
+
+    Args:
+        func (callable): The function to time.
+        calls (int): The number of calls made by one run of func.
+        repeat (int, optional): The number of runs; the fastest is used.
+
+    Returns:
+        float: The time per call in nanoseconds.
+    """
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    return best * 1e9 / calls
+
+
+def bench_card(rounds=200):
+    """
+    Times the Card methods used in play, each on its own.
+
+    Args:
+        rounds (int, optional): The number of passes over the deck.
+
+    Returns:
+        dict: Nanoseconds per call, keyed by name.
+    """
+    cards = [Card(card.name, card.suit) for card in DECK]
+    pairs = list(zip(cards, cards[1:] + cards[:1]))
+    names = [(card.name, card.suit) for card in DECK]
+    calls = rounds * len(DECK)
+    trump_calls = calls * len(TRUMP_SUITS)
+
+    def init():
+        for _ in range(rounds):
+            for name, suit in names:
+                Card(name, suit)
+
+    def set_trump():
+        for _ in range(rounds):
+            for suit in TRUMP_SUITS:
+                for card in cards:
+                    card.set_trump(suit)
+
+    def is_trump():
+        for _ in range(rounds):
+            for suit in TRUMP_SUITS:
+                for card in cards:
+                    card.is_trump(suit)
+
+    def get_trump_symbol():
+        for _ in range(rounds):
+            for suit in TRUMP_SUITS:
+                for card in cards:
+                    card.get_trump_symbol(suit)
+
+    def less_than():
+        for _ in range(rounds):
+            for card, other in pairs:
+                _ = card < other
+
+    def greater_than():
+        for _ in range(rounds):
+            for card, other in pairs:
+                _ = card > other
+
+    def equal():
+        for _ in range(rounds):
+            for card, other in pairs:
+                _ = card == other
+
+    def to_str():
+        for _ in range(rounds):
+            for card in cards:
+                str(card)
+
+    return {'Card.__init__': time_per_call(init, calls),
+            'Card.set_trump': time_per_call(set_trump, trump_calls),
+            'Card.is_trump': time_per_call(is_trump, trump_calls),
+            'Card.get_trump_symbol': time_per_call(get_trump_symbol,
+                                                   trump_calls),
+            'Card.__lt__': time_per_call(less_than, calls),
+            'Card.__gt__': time_per_call(greater_than, calls),
+            'Card.__eq__': time_per_call(equal, calls),
+            'Card.__str__': time_per_call(to_str, calls)}
+
+
+def bench_sort(hands=500, seed=0):
+    """
+    Times setting the trump suit of six card hands and sorting them with the
+    Card comparison operators, for each trump suit.
+
+    Args:
+        hands (int, optional): The number of random six card hands.
+        seed (int, optional): The seed for dealing the hands.
+
+    Returns:
+        dict: Nanoseconds per hand for each trump suit, keyed by name.
+    """
+    results = {}
+    rng = random.Random(seed)
+    card_lists = [[Card(card.name, card.suit) for card in rng.sample(DECK, 6)]
+                  for _ in range(hands)]
+    for suit in TRUMP_SUITS:
+        def sort_hands(suit=suit):
+            for hand in card_lists:
+                for card in hand:
+                    card.set_trump(suit)
+                hand.sort(reverse=True)
+        results[f'sort hand ({suit or "no trump"})'] = time_per_call(
+            sort_hands, hands)
+    return results
+
+
+def bench_trump(rounds=200):
+    """
+    Compares the trump table against applying the trump rules directly.
+
+    Args:
+        rounds (int, optional): The number of passes over the deck.
+
+    Returns:
+        dict: Nanoseconds per call for each path, keyed by name.
+    """
+    hand = [Card(card.name, card.suit) for card in DECK]
+    calls = rounds * len(hand) * len(TRUMP_SUITS)
+
+    def rules_is_trump():
+        for _ in range(rounds):
+            for suit in TRUMP_SUITS:
+                for card in hand:
+                    Card.trump_entry(card.name, card.suit, suit)
+
+    def table_is_trump():
+        for _ in range(rounds):
+            for suit in TRUMP_SUITS:
+                for card in hand:
+                    card.is_trump(suit)
+
+    def rules_set_trump():
+        for _ in range(rounds):
+            for suit in TRUMP_SUITS:
+                for card in hand:
+                    branching_set_trump(card, suit)
+
+    def table_set_trump():
+        for _ in range(rounds):
+            for suit in TRUMP_SUITS:
+                for card in hand:
+                    card.set_trump(suit)
+
+    return {'is_trump (rules)': time_per_call(rules_is_trump, calls),
+            'is_trump (table)': time_per_call(table_is_trump, calls),
+            'set_trump (rules)': time_per_call(rules_set_trump, calls),
+            'set_trump (table)': time_per_call(table_set_trump, calls)}
+
+
+def bench_hand(hands=2000, seed=0):
+    """
+    Compares trump counts and points of bitmask hands against lists of cards.
+
+    Args:
+        hands (int, optional): The number of random six card hands.
+        seed (int, optional): The seed for dealing the hands.
+
+    Returns:
+        dict: Nanoseconds per hand evaluation for each path, keyed by name.
+    """
+    rng = random.Random(seed)
+    card_lists = [[Card(card.name, card.suit) for card in rng.sample(DECK, 6)]
+                  for _ in range(hands)]
+    masks = [Hand(cards) for cards in card_lists]
+    calls = hands * len(SUITS)
+
+    def list_evaluate():
+        for cards in card_lists:
+            for suit in SUITS:
+                count = points = 0
+                for card in cards:
+                    card.set_trump(suit)
+                    if card.is_trump():
+                        count += 1
+                        points += card.points
+
+    def hand_evaluate():
+        for hand in masks:
+            for suit in SUITS:
+                hand.trump_count(suit)
+                hand.trump_points(suit)
+
+    return {'hand eval (list)': time_per_call(list_evaluate, calls),
+            'hand eval (mask)': time_per_call(hand_evaluate, calls)}
+
+
+def bench_deal(tables=10000, rounds=10, seed=0):
+    """
+    Times how long a Deck takes to deal each hand, dealing four hands of six
+    cards to each of many tables per call.
+
+    Args:
+        tables (int, optional): The number of tables dealt per call.
+        rounds (int, optional): The number of calls per run.
+        seed (int, optional): The seed of the deck.
+
+    Returns:
+        dict: Nanoseconds per hand, keyed by name.
+    """
+    deck = Deck(seed)
+    hands = tables * 4 * rounds
+
+    def deal():
+        for _ in range(rounds):
+            deck.deal(hands=4, cards=6, tables=tables)
+
+    return {'deal (per hand)': time_per_call(deal, hands)}
+
+
+def bench_tricks(tricks=20000, seed=0):
+    """
+    Compares resolving a batch of four card tricks with NumPy against
+    resolving them one Card at a time.
+
+    Args:
+        tricks (int, optional): The number of tricks.
+        seed (int, optional): The seed for dealing the tricks.
+
+    Returns:
+        dict: Nanoseconds per trick for each path, keyed by name.
+    """
+    codes = Deck(seed).deal(hands=1, cards=4, tables=tricks)[:, 0, :]
+    trumps = [SUITS[index % len(SUITS)] for index in range(tricks)]
+    cards = card_codes.from_codes(codes)
+    indexes = card_codes.trump_indexes(trumps)
+
+    return {'tricks (cards)': time_per_call(
+                lambda: resolve_tricks_by_card(cards, trumps), tricks, repeat=3),
+            'tricks (batch)': time_per_call(
+                lambda: resolve_tricks(codes, indexes), tricks)}
+
+
+def bench_legal(hands=2000, seed=0):
+    """
+    Compares finding the legal plays of six card hands with precomputed
+    follow suit masks against is_trump() calls and suit comparisons.
+
+    Args:
+        hands (int, optional): The number of hands.
+        seed (int, optional): The seed for dealing the hands.
+
+    Returns:
+        dict: Nanoseconds per hand for each path, keyed by name.
+    """
+    deals = Deck(seed).deal(hands=2, cards=6, tables=hands).tolist()
+    trumps = [TRUMP_SUITS[index % len(TRUMP_SUITS)] for index in range(hands)]
+    cards = [(card_codes.from_codes(hand), DECK[other[0]], trump)
+             for (hand, other), trump in zip(deals, trumps)]
+    masks = [(Hand.from_codes(hand).mask, other[0], trump)
+             for (hand, other), trump in zip(deals, trumps)]
+
+    def card_legal():
+        for hand, led, trump in cards:
+            legal_moves_by_card(hand, led, trump)
+
+    def mask_legal():
+        for mask, led, trump in masks:
+            legal_mask(mask, led, trump)
+
+    return {'legal (cards)': time_per_call(card_legal, hands),
+            'legal (mask)': time_per_call(mask_legal, hands)}
+
+
+def bench_solver(deals=20, seed=0):
+    """
+    Measures how long the double-dummy Solver takes to solve a deal of four
+    hands of six cards, with a new transposition table for every deal.
+
+    Args:
+        deals (int, optional): The number of deals solved.
+        seed (int, optional): The seed for dealing the hands.
+
+    Returns:
+        dict: Nanoseconds per deal and per position searched, keyed by name.
+    """
+    tables = Deck(seed).deal(hands=4, cards=6, tables=deals).tolist()
+    seconds = nodes = 0
+    for number, hands in enumerate(tables):
+        result = Solver(SUITS[number % len(SUITS)]).solve(hands)
+        seconds += result.seconds
+        nodes += result.nodes
+    return {'solve (per deal)': 1e9 * seconds / deals,
+            'solve (per node)': 1e9 * seconds / nodes}
+
+
+def bench_probability(hands=50, deals=2000, seed=0):
+    """
+    Compares estimating the chance that the opponents hold the 3 of trump or
+    both jokers by dealing the unseen cards against counting it exactly.
+
+    Args:
+        hands (int, optional): The number of known hands asked about.
+        deals (int, optional): The number of deals sampled for each hand.
+        seed (int, optional): The seed for dealing the hands.
+
+    Returns:
+        dict: Nanoseconds per hand, keyed by name.
+    """
+    # The trump suits take turns, and the 3 of trump is asked about
+    cases = []
+    for number, hand in enumerate(
+            Deck(seed).deal(hands=1, cards=6, tables=hands)[:, 0].tolist()):
+        trump = SUITS[number % len(SUITS)]
+        cases.append((hand, trump, card_codes.CODES['3' + Card.suit_to_symbol[trump]]))
+    deck = Deck(seed + 1)
+    jokers = (card_codes.CODES['BJ'], card_codes.CODES['LJ'])
+
+    def sampled():
+        for hand, _, three in cases:
+            for table in deck.deal_remaining(hand, tables=deals).tolist():
+                opponents = set(table[0]) | set(table[2])
+                _ = three in opponents or set(jokers) <= opponents
+
+    def exact():
+        for hand, trump, three in cases:
+            Unseen(hand, trump).probability([three, jokers], OPPONENTS)
+
+    return {'odds (sampled)': time_per_call(sampled, hands, repeat=1),
+            'odds (exact)': time_per_call(exact, hands)}
+
+
+def bench_render(tables=500, seed=0):
+    """
+    Compares logging dealt hands with a print() per card against rendering
+    them into one buffer with a Formatter and writing it once.
+
+    Args:
+        tables (int, optional): The number of tables of four hands logged.
+        seed (int, optional): The seed for dealing the hands.
+
+    Returns:
+        dict: Nanoseconds per card, keyed by name.
+    """
+    hands = Deck(seed).deal(hands=4, cards=6, tables=tables).reshape(
+        -1, 6).tolist()
+    cards = [[DECK[code] for code in hand] for hand in hands]
+    count = len(hands) * 6
+
+    def per_card():
+        stream = io.StringIO()
+        for seat, hand in enumerate(cards):
+            print(f'Seat {seat % 4}:', file=stream)
+            for card in hand:
+                print(card, file=stream)
+
+    def bulk():
+        formatter = Formatter()
+        for seat, hand in enumerate(hands):
+            formatter.hand(hand, seat % 4)
+        formatter.write(io.StringIO())
+
+    return {'render (print)': time_per_call(per_card, count),
+            'render (bulk)': time_per_call(bulk, count)}
+
+
+def speedup(results, slow, fast):
+    """
+    Returns how many times faster one benchmark result is than another.
+
+    Args:
+        results (dict): Benchmark results keyed by name.
+        slow (str): The name of the slower result.
+        fast (str): The name of the faster result.
+
+    Returns:
+        float: The ratio of the two times.
+    """
+    return results[slow] / results[fast]
+
+
+BENCHMARKS = {'card': bench_card, 'sort': bench_sort, 'trump': bench_trump,
+              'hand': bench_hand,
+              'tricks': bench_tricks, 'legal': bench_legal,
+              'deal': bench_deal, 'solver': bench_solver,
+              'probability': bench_probability, 'render': bench_render}
+
+SPEEDUPS = (('is_trump', 'is_trump (rules)', 'is_trump (table)'),
+            ('set_trump', 'set_trump (rules)', 'set_trump (table)'),
+            ('hand eval', 'hand eval (list)', 'hand eval (mask)'),
+            ('tricks', 'tricks (cards)', 'tricks (batch)'),
+            ('legal', 'legal (cards)', 'legal (mask)'),
+            ('odds', 'odds (sampled)', 'odds (exact)'),
+            ('render', 'render (print)', 'render (bulk)'))
+
+
+def run(groups=None):
+    """
+    Runs groups of benchmarks.
+
+    Args:
+        groups (iterable, optional): The names of the groups, keys of
+               BENCHMARKS; None runs them all.
+
+    Returns:
+        dict: Nanoseconds per call, keyed by benchmark name.
+    """
+    results = {}
+    for group in groups or BENCHMARKS:
+        if group not in BENCHMARKS:
+            raise ValueError(f"Invalid benchmark group: {group}")
+        results.update(BENCHMARKS[group]())
+    return results
+
+
+def compare(results, baseline, tolerance=0.2):
+    """
+    Finds the results that are slower than a baseline by more than a
+    tolerance.  Benchmarks missing from either side are ignored.
+
+    Args:
+        results (dict): Nanoseconds per call, keyed by benchmark name.
+        baseline (dict): The baseline nanoseconds per call.
+        tolerance (float, optional): The allowed slowdown, as a fraction of
+                  the baseline.
+
+    Returns:
+        list: The (name, baseline, result, ratio) of each regression.
+    """
+    return [(name, baseline[name], nanoseconds, nanoseconds / baseline[name])
+            for name, nanoseconds in results.items()
+            if name in baseline and
+            nanoseconds > baseline[name] * (1 + tolerance)]
+
+
+def write_json(path, results):
+    """
+    Writes benchmark results as JSON, with the Python version and machine.
+
+    Args:
+        path (str): The path of the file, or '-' for stdout.
+        results (dict): Nanoseconds per call, keyed by benchmark name.
+    """
+    document = json.dumps({'python': platform.python_version(),
+                           'machine': platform.machine(),
+                           'results': results}, indent=2)
+    if path == '-':
+        print(document)
+    else:
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(document + '\n')
+
+
+def main(argv=None):
+    """
+    Main function to run the benchmarks and print the results.
+
+    Args:
+        argv (list, optional): The command line arguments; None uses
+             sys.argv.
+
+    Returns:
+        int: The exit status, 1 if any benchmark regressed.
+    """
+    parser = argparse.ArgumentParser(description="Time the Card hot paths.")
+    parser.add_argument('groups', nargs='*', metavar='group',
+                        help=f"benchmark groups to run ({', '.join(BENCHMARKS)}); "
+                             "all by default")
+    parser.add_argument('--json', metavar='FILE',
+                        help="write the results as JSON to FILE ('-' for stdout)")
+    parser.add_argument('--baseline', metavar='FILE',
+                        help="compare against the results in FILE")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="allowed slowdown against the baseline "
+                             "(default 0.2, i.e. 20%%)")
+    args = parser.parse_args(argv)
+    for group in args.groups:
+        if group not in BENCHMARKS:
+            parser.error(f"invalid benchmark group: {group}")
+
+    results = run(args.groups)
+    for name, nanoseconds in results.items():
+        print(f'{name:<24} {nanoseconds:12.1f} ns/call', file=sys.stderr)
+    for name, slow, fast in SPEEDUPS:
+        if slow in results and fast in results:
+            print(f'{name + " speedup":<24} {speedup(results, slow, fast):12.1f}x',
+                  file=sys.stderr)
+
+    if args.json:
+        write_json(args.json, results)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+        regressions = compare(results, baseline, args.tolerance)
+        for name, before, after, ratio in regressions:
+            print(f'REGRESSION {name}: {before:.1f} -> {after:.1f} ns/call '
+                  f'({ratio:.2f}x)', file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
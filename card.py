@@ -8,20 +8,92 @@ various attributes and methods to manipulate and compare cards.
 The Card class includes functionality for determining trump cards, 
 comparing card ranks, and printing card details.
 
+The trump attributes of a card depend only on the card and the trump suit,
+so they are computed once at import for every deck card and every trump
+suit; is_trump(), is_nontrump(), get_trump_symbol() and set_trump() read
+them from that table.  A second table holds an integer sort key for every
+deck card and trump suit, giving cards a total order for sorting, and two
+more hold the text str() writes for every deck card and its description for
+every trump suit (see render.py, which formats whole hands at once).
+
+Every card in the 54 card deck also exists as a single interned, read-only
+instance that is returned by Card.get().  Card(name, suit) still builds a
+private, mutable copy so that set_trump() can be used as before.  Cards
+pickle as their index in DECK (and trump suit, for a private copy), and an
+interned card unpickles as the same interned instance.
+
+The trump methods use the rules of Card.card_reference unless they are given
+a Ruleset (see rules.py), which carries its own compiled tables, so cards can
+be played under several rule variants at once.  A card whose trump suit was
+set under a Ruleset keeps it, and uses it when no other is given.
+
 Classes:
     Card: A class to hold information about individual cards.
+    TrumpEntry: The trump attributes of a card for one trump suit.
+
+Functions:
+    apply_trump_rules: Applies the trump rules of a reference dict to a card.
+
+Constants:
+    SUITS: The four standard suits, in deck order.
+    CARD_NAMES: The thirteen card names of a standard suit, in deck order.
+    JOKER_NAMES: The names of the two jokers.
+    DECK: The 54 interned cards, in deck order.
 
 Programmer: Michelle Talley
 Copyright (c) 2025 Michelle Talley
 """
+from collections import namedtuple
 from pprint import pprint
 
+TrumpEntry = namedtuple('TrumpEntry', ['symbol', 'rank', 'points', 'is_trump'])
+
+# (card suit, trump suit) pairs for which a Jack is the Off Jack
+OFF_JACK_SUITS = (('Spades', 'Clubs'), ('Clubs', 'Spades'),
+                  ('Diamonds', 'Hearts'), ('Hearts', 'Diamonds'))
 
-class Card:
+
+def apply_trump_rules(reference, name, suit, trump_suit):
+    """
+    Applies the trump rules to a card and returns its trump attributes.
+
+    Args:
+        reference (dict): The ranks, points and descriptions of the card
+                  symbols, in the form of Card.card_reference.
+        name (str): The name of the card, full or short.
+        suit (str): The suit of the card.
+        trump_suit (str): The trump suit, or None for no trump.
+
+    Returns:
+        TrumpEntry: The symbol, rank, points and trump status of the card.
+    """
+    symbol = Card.base_symbol(reference[name].get('fullname', name))
+    if trump_suit is None:
+        return TrumpEntry(symbol, reference[symbol]['rank'], 0, False)
+
+    if suit in ('Joker', trump_suit):
+        trump_symbol = symbol
+    elif symbol == 'J' and (suit, trump_suit) in OFF_JACK_SUITS:
+        trump_symbol = 'X'  # Off Jack
+    else:
+        trump_symbol = 'N'  # Not trump
+    return TrumpEntry(trump_symbol,
+                      reference[trump_symbol]['rank'],
+                      reference[trump_symbol]['points'],
+                      trump_symbol != 'N')
+
+
+# The ruleset a card's trump attributes came from is an eighth attribute, one
+# over the limit, so that copies and pickles keep the variant they were set
+# with
+class Card:  # pylint: disable=too-many-instance-attributes
     """
     A class to hold information about individual cards
     """
 
+    __slots__ = ('name', 'suit', 'short_name',
+                 'symbol', 'rank', 'points', 'trump_suit', 'ruleset')
+
     suit_to_symbol = {'Spades':   '♠',
                       'Diamonds': '♦',
                       'Clubs':    '♣',
@@ -63,6 +135,23 @@ class Card:
                       '_':      {'rank': 0,  'points': 0, 'desc': 'No play'}
                       }
 
+    # Interned read-only cards keyed by (name, suit), including short names
+    pool = {}
+
+    # Trump attributes of every deck card keyed by short name, then by
+    # trump suit (None for no trump)
+    trump_table = {}
+
+    # Sort keys of every deck card keyed by short name, then by trump suit
+    sort_keys = {}
+
+    # Text of every deck card as str() writes it, keyed by short name
+    text_table = {}
+
+    # Description of every deck card keyed by short name, then by trump
+    # suit, as desc() returns it once the trump suit is set
+    desc_table = {}
+
     def __init__(self, name, suit):
         """
         Initializes a Card object.
@@ -71,6 +160,13 @@ class Card:
             name (str): The base name of the card.
             suit (str): The suit of the card.
         """
+        # Copy the attributes of the interned card when there is one
+        template = self.pool.get((name, suit))
+        if template is not None:
+            for attr in Card.__slots__:
+                setattr(self, attr, getattr(template, attr))
+            return
+
         # Verify that name is a valid key in base_ranks
         if name not in self.card_reference:
             raise ValueError(f"Invalid card name: {name}")
@@ -90,24 +186,53 @@ class Card:
         self.rank = self.card_reference[self.symbol]['rank']
         self.points = 0
         self.trump_suit = None
+        self.ruleset = None
+
+    @classmethod
+    def get(cls, name, suit):
+        """
+        Returns the interned, read-only card for the given name and suit.
+
+        Args:
+            name (str): The name of the card, full or short (e.g. 'Ace' or 'A').
+            suit (str): The suit of the card.
+
+        Returns:
+            Card: The shared card instance.
+
+        Raises:
+            ValueError: If the name and suit do not identify one of the 54 cards.
+        """
+        try:
+            return cls.pool[name, suit]
+        except KeyError:
+            raise ValueError(f"Invalid card: {name} of {suit}") from None
 
     def __str__(self):
         """
         Returns a string representation of the card.
 
         Returns:
-            str: The short name of the card.
+            str: The short name of the card, right-justified to three
+                 characters.
         """
-        return f"{self.short_name:>3}"
+        try:
+            return self.text_table[self.short_name]
+        except KeyError:
+            return f"{self.short_name:>3}"
 
     def __repr__(self):
         """
         Returns a string representation of the card.
 
         Returns:
-            str: The short name of the card.
+            str: The short name of the card, right-justified to three
+                 characters.
         """
-        return f"{self.short_name:>3}"
+        try:
+            return self.text_table[self.short_name]
+        except KeyError:
+            return f"{self.short_name:>3}"
 
     def __lt__(self, other):
         """
@@ -146,8 +271,39 @@ class Card:
             bool: True if the short name of this card is equal to 
                   the short name of the other card, False otherwise.
         """
+        if not isinstance(other, Card):
+            return NotImplemented
         return self.short_name == other.short_name
 
+    def __hash__(self):
+        """
+        Returns the hash of the card, consistent with __eq__.
+
+        Returns:
+            int: The hash of the short name of the card.
+        """
+        return hash(self.short_name)
+
+    def __reduce__(self):
+        """
+        Returns how to pickle the card: by its index in DECK, plus its trump
+        suit and ruleset for a private copy, instead of by all of its
+        attributes.  Cards that are not in DECK pickle by their attributes.
+
+        Returns:
+            tuple: The function that rebuilds the card and its arguments.
+        """
+        code = _DECK_CODES.get(self.short_name)
+        if code is None:
+            return (_card_from_state, (self.state(),))
+        if isinstance(self, _InternedCard):
+            return (_interned_card, (code,))
+        if (self.symbol, self.rank, self.points) == \
+                tuple(self.get_trump_entry(self.trump_suit))[:3]:
+            return (_card_copy, (code, self.trump_suit, self.ruleset))
+        # Attributes changed by hand are kept as they are
+        return (_card_from_state, (self.state(),))
+
     def state(self):
         """
         Returns a string representation of the card's attributes.
@@ -155,18 +311,27 @@ class Card:
         Returns:
             str: A formatted string containing the card's attributes.
         """
-        return vars(self)
+        return {attr: getattr(self, attr) for attr in Card.__slots__}
 
-    def desc(self):
+    def desc(self, ruleset=None):
         """
         Returns a string representation of the card's description.
 
+        Args:
+            ruleset (Ruleset, optional): The rules to describe the card by.
+                 If not provided, the ruleset the trump suit was set with
+                 is used, or Card.card_reference.
+
         Returns:
             str: The description of the card.
         """
-        return self.card_reference[self.symbol]['desc']
+        if ruleset is None:
+            ruleset = self.ruleset
+        reference = self.card_reference if ruleset is None else ruleset.reference
+        return reference[self.symbol]['desc']
 
-    def base_symbol(self, name):
+    @staticmethod
+    def base_symbol(name):
         """
         Returns the base symbol for the given name.
 
@@ -182,74 +347,277 @@ class Card:
             symbol = name[:1]
         return symbol
 
-    def is_trump(self, suit=None):
+    @classmethod
+    def trump_entry(cls, name, suit, trump_suit):
+        """
+        Applies the trump rules to a card and returns its trump attributes.
+        This is the reference the precomputed trump table is built from.
+
+        Args:
+            name (str): The name of the card, full or short.
+            suit (str): The suit of the card.
+            trump_suit (str): The trump suit, or None for no trump.
+
+        Returns:
+            TrumpEntry: The symbol, rank, points and trump status of the card.
+        """
+        return apply_trump_rules(cls.card_reference, name, suit, trump_suit)
+
+    def get_trump_entry(self, suit, ruleset=None):
+        """
+        Returns the trump attributes of the card for the given trump suit.
+
+        Args:
+            suit (str): The trump suit, or None for no trump.
+            ruleset (Ruleset, optional): The rules to apply.
+                 If not provided, the ruleset the trump suit was set with
+                 is used, or Card.card_reference.
+
+        Returns:
+            TrumpEntry: The precomputed entry, or a computed one for a suit
+                        outside the table.
+        """
+        if ruleset is None:
+            ruleset = self.ruleset
+        rules = self if ruleset is None else ruleset
+        try:
+            return rules.trump_table[self.short_name][suit]
+        except KeyError:
+            return rules.trump_entry(self.name, self.suit, suit)
+
+    def sort_key(self, suit=None, ruleset=None):
+        """
+        Returns an integer sort key that orders cards by their rank for a
+        trump suit, then by their base rank, then by their place in the deck.
+        Unlike the comparison operators, which treat cards of equal rank as
+        tied, the key gives every deck card its own place.
+
+        Args:
+            suit (str, optional): The trump suit to sort by.
+                 If not provided, the trump suit of the card is used.
+            ruleset (Ruleset, optional): The rules to rank the card by.
+                 If not provided, the ruleset the trump suit was set with
+                 is used, or Card.card_reference.
+
+        Returns:
+            int: The sort key.
+        """
+        if suit is None:
+            suit = self.trump_suit
+        if ruleset is None:
+            ruleset = self.ruleset
+        try:
+            keys = self.sort_keys if ruleset is None else ruleset.sort_keys
+            return keys[self.short_name][suit]
+        except KeyError:
+            return make_sort_key(self.get_trump_entry(suit, ruleset).rank,
+                                 self.get_trump_entry(None, ruleset).rank,
+                                 SORT_KEY_LAST)
+
+    def is_trump(self, suit=None, ruleset=None):
         """
         Checks if the card is a trump card.
 
         Args:
             suit (str, optional): The suit to check against. 
                  If not provided, the trump suit of the card is used.
+            ruleset (Ruleset, optional): The rules to apply.
+                 If not provided, the ruleset the trump suit was set with
+                 is used, or Card.card_reference.
 
         Returns:
             bool: True if the card is a trump card, False otherwise.
         """
-        return False
+        if suit is None:
+            suit = self.trump_suit
+        return self.get_trump_entry(suit, ruleset).is_trump
 
-    def is_nontrump(self, suit=None):
+    def is_nontrump(self, suit=None, ruleset=None):
         """
         Checks if the card is a non-trump card.
 
         Args:
             suit (str, optional): The suit to check against.
                  If not provided, the trump suit of the card is used.
+            ruleset (Ruleset, optional): The rules to apply.
+                 If not provided, the ruleset the trump suit was set with
+                 is used, or Card.card_reference.
 
         Returns:
             bool: True if the card is a non-trump card, False otherwise.
         """
-        return True
+        return not self.is_trump(suit, ruleset)
 
-    def get_trump_symbol(self, suit):
+    def get_trump_symbol(self, suit, ruleset=None):
         """
         Determines the trump symbol for the card based on the given suit.
 
         Args:
             suit (str): The suit to check against.
+            ruleset (Ruleset, optional): The rules to apply.
+                 If not provided, the ruleset the trump suit was set with
+                 is used, or Card.card_reference.
 
         Returns:
             str: The trump symbol if the card is a trump card, otherwise 'N'.
         """
-        if self.is_trump(suit):
-            if self.base_symbol(self.name) == 'J':
-                if (self.suit, suit) in (('Spades', 'Clubs'), ('Clubs', 'Spades'),
-                                         ('Diamonds', 'Hearts'), ('Hearts', 'Diamonds')):
-                    symbol = 'X'  # Off Jack
-                else:
-                    symbol = self.base_symbol(self.name)  # Jack
-            else:
-                symbol = self.symbol
-        else:
-            symbol = 'N'  # Not trump
-        return symbol
+        if suit is None:
+            return 'N'  # Not trump
+        return self.get_trump_entry(suit, ruleset).symbol
 
-    def set_trump(self, suit=None):
+    def set_trump(self, suit=None, ruleset=None):
         """
         Sets the trump suit of the card and updates its attributes accordingly.
         If no suit is provided, it resets the card to its base attributes.
+        The ruleset is kept with the trump suit, so desc(), sort_key() and
+        the trump methods use it when they are not given one.
 
         Args:
             suit (str, optional): The trump suit to set. If None, resets the card.
+            ruleset (Ruleset, optional): The rules to apply.
+                 If not provided, Card.card_reference is used.
         """
-        # Reset the card to its base attributes
-        self.symbol = self.base_symbol(self.name)
-        self.rank = self.card_reference[self.symbol]['rank']
-        self.points = 0  # points are only for trump cards
-        self.trump_suit = None
+        if ruleset is None:
+            # Drop any earlier ruleset so that the standard rules apply
+            self.ruleset = None
+        self.symbol, self.rank, self.points, _ = self.get_trump_entry(suit,
+                                                                      ruleset)
+        self.trump_suit = suit
+        self.ruleset = ruleset
+
+
+class _InternedCard(Card):
+    """
+    A read-only Card shared by every caller of Card.get()
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, attr, value):
+        raise AttributeError(f"{self.short_name} is a shared card and cannot be "
+                             f"modified; use Card(name, suit) for a private copy")
+
+    def __delattr__(self, attr):
+        raise AttributeError(f"{self.short_name} is a shared card and cannot be "
+                             f"modified; use Card(name, suit) for a private copy")
+
+
+def _intern(name, suit):
+    """
+    Builds the interned card for the given name and suit, adds its rows to
+    Card.trump_table, Card.text_table and Card.desc_table and adds it to
+    Card.pool under its full name and every short name alias.
+
+    Args:
+        name (str): The full name of the card.
+        suit (str): The suit of the card.
+
+    Returns:
+        Card: The interned card.
+    """
+    card = Card(name, suit)
+    interned = object.__new__(_InternedCard)
+    for attr in Card.__slots__:
+        object.__setattr__(interned, attr, getattr(card, attr))
+
+    Card.trump_table[interned.short_name] = {
+        trump_suit: Card.trump_entry(name, suit, trump_suit)
+        for trump_suit in (None, *SUITS)}
+    Card.text_table[interned.short_name] = f"{interned.short_name:>3}"
+    Card.desc_table[interned.short_name] = {
+        trump_suit: Card.card_reference[entry.symbol]['desc']
+        for trump_suit, entry in Card.trump_table[interned.short_name].items()}
+
+    for alias, reference in Card.card_reference.items():
+        if reference.get('fullname', alias) == name:
+            Card.pool[alias, suit] = interned
+    return interned
+
+
+def _interned_card(code):
+    """
+    Returns the interned card with the given index in DECK, for unpickling.
+
+    Args:
+        code (int): The index of the card in DECK.
+
+    Returns:
+        Card: The interned card.
+    """
+    return DECK[code]
+
+
+def _card_copy(code, trump_suit, ruleset=None):
+    """
+    Builds a private copy of a deck card with its trump suit set, for
+    unpickling.
+
+    Args:
+        code (int): The index of the card in DECK.
+        trump_suit (str): The trump suit of the card, or None.
+        ruleset (Ruleset, optional): The ruleset the trump suit was set with.
+
+    Returns:
+        Card: The new card.
+    """
+    card = Card(DECK[code].name, DECK[code].suit)
+    if trump_suit is not None or ruleset is not None:
+        card.set_trump(trump_suit, ruleset)
+    return card
+
+
+def _card_from_state(state):
+    """
+    Builds a private card with the given attributes, for unpickling.
+
+    Args:
+        state (dict): The attributes of the card, as returned by state().
+
+    Returns:
+        Card: The new card.
+    """
+    card = Card(state['name'], state['suit'])
+    for attr, value in state.items():
+        setattr(card, attr, value)
+    return card
+
+
+SUITS = ('Spades', 'Diamonds', 'Clubs', 'Hearts')
+CARD_NAMES = ('Ace', 'King', 'Queen', 'Jack', '10',
+              '9', '8', '7', '6', '5', '4', '3', '2')
+JOKER_NAMES = ('Big', 'Little')
+
+DECK = tuple([_intern(name, suit) for suit in SUITS for name in CARD_NAMES] +
+             [_intern(name, 'Joker') for name in JOKER_NAMES])
+
+# Index in DECK of every deck card, keyed by short name
+_DECK_CODES = {card.short_name: code for code, card in enumerate(DECK)}
+
+# The last place in the deck, used for sort keys of cards outside the deck
+SORT_KEY_LAST = 63
+
+
+def make_sort_key(rank, base_rank, place):
+    """
+    Packs a rank, a base rank and a place in the deck into a sort key.
+
+    Args:
+        rank (int): The rank of the card for the trump suit.
+        base_rank (int): The rank of the card with no trump suit.
+        place (int): The index of the card in DECK.
+
+    Returns:
+        int: The sort key.
+    """
+    return rank << 11 | base_rank << 6 | place
+
 
-        if suit is not None:
-            self.symbol = self.get_trump_symbol(suit)
-            self.rank = self.card_reference[self.symbol]['rank']
-            self.points = self.card_reference[self.symbol]['points']
-            self.trump_suit = suit
+for _place, _card in enumerate(DECK):
+    Card.sort_keys[_card.short_name] = {
+        trump_suit: make_sort_key(entry.rank,
+                                  Card.trump_table[_card.short_name][None].rank,
+                                  _place)
+        for trump_suit, entry in Card.trump_table[_card.short_name].items()}
 
 
 def main():
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+"""
+Card Codes Module
+
+This module gives every card of the deck a stable integer code, its index
+in card.DECK (0-51 for the four suits in SUITS order with the card names in
+CARD_NAMES order, 52 for the Big Joker and 53 for the Little Joker), and
+evaluates NumPy arrays of card codes for a trump suit in one call.
+
+The lookup arrays are built from Card.trump_table, which is itself built from
+Card.card_reference and Card.suit_to_symbol, so the rules have a single
+source of truth.
+
+Trump suits are given to the batch functions as indexes: 0-3 for the suits
+in SUITS order and NO_TRUMP (4) for no trump.  The code NO_PLAY (54) stands
+for a seat that played no card; it is not a card, but it can be evaluated
+and has the rank and points of the '_' (No play) entry of card_reference.
+
+Functions:
+    to_code: Returns the code of a card.
+    from_code: Returns the interned card for a code.
+    to_codes: Converts a sequence of cards to an array of codes.
+    from_codes: Converts an array of codes to a list of cards.
+    trump_index: Returns the index of a trump suit.
+    trump_indexes: Converts trump suits to an array of indexes.
+    evaluate: Returns the trump attributes of an array of codes.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from card import Card, DECK, SUITS, TrumpEntry
+
+NO_TRUMP = len(SUITS)
+TRUMP_SUITS = (*SUITS, None)
+NO_PLAY = len(DECK)
+
+CODES = {card.short_name: code for code, card in enumerate(DECK)}
+
+TrumpArrays = namedtuple('TrumpArrays', ['symbol', 'rank', 'points', 'is_trump'])
+
+# Trump entries indexed by [trump index][card code], NO_PLAY last
+_ENTRIES = [[Card.trump_table[card.short_name][suit] for card in DECK] +
+            [TrumpEntry('_', Card.card_reference['_']['rank'],
+                        Card.card_reference['_']['points'], False)]
+            for suit in TRUMP_SUITS]
+
+# Lookup tables indexed by [trump index, card code]
+SYMBOL_TABLE = np.array([[entry.symbol for entry in row] for row in _ENTRIES])
+RANK_TABLE = np.array([[entry.rank for entry in row] for row in _ENTRIES],
+                      dtype=np.int8)
+POINTS_TABLE = np.array([[entry.points for entry in row] for row in _ENTRIES],
+                        dtype=np.int8)
+IS_TRUMP_TABLE = np.array([[entry.is_trump for entry in row]
+                           for row in _ENTRIES])
+
+for _table in (SYMBOL_TABLE, RANK_TABLE, POINTS_TABLE, IS_TRUMP_TABLE):
+    _table.flags.writeable = False
+
+
+def to_code(card):
+    """
+    Returns the integer code of a card.
+
+    Args:
+        card (Card): The card, interned or not.
+
+    Returns:
+        int: The code of the card.
+
+    Raises:
+        ValueError: If the card is not one of the 54 deck cards.
+    """
+    try:
+        return CODES[card.short_name]
+    except KeyError:
+        raise ValueError(f"Card is not in the deck: {card}") from None
+
+
+def from_code(code):
+    """
+    Returns the interned card for an integer code.
+
+    Args:
+        code (int): The code of the card.
+
+    Returns:
+        Card: The interned card.
+    """
+    if not 0 <= code < len(DECK):
+        raise ValueError(f"Invalid card code: {code}")
+    return DECK[code]
+
+
+def to_codes(cards):
+    """
+    Converts a sequence of cards to an array of codes.
+
+    Args:
+        cards (iterable): The cards to convert.
+
+    Returns:
+        ndarray: The codes of the cards, as uint8.
+    """
+    return np.array([to_code(card) for card in cards], dtype=np.uint8)
+
+
+def from_codes(codes):
+    """
+    Converts an array of codes to interned cards.
+
+    Args:
+        codes (array_like): The codes to convert, of any shape.
+
+    Returns:
+        list: The cards, nested to the shape of codes.
+    """
+    codes = np.asarray(codes)
+    if codes.size and (codes.min() < 0 or codes.max() >= len(DECK)):
+        raise ValueError("Invalid card code in array")
+    return np.array(DECK, dtype=object)[codes].tolist()
+
+
+def trump_index(suit):
+    """
+    Returns the index of a trump suit in the lookup tables.
+
+    Args:
+        suit (str): The trump suit, or None for no trump.
+
+    Returns:
+        int: The index of the trump suit.
+    """
+    if suit is None:
+        return NO_TRUMP
+    try:
+        return SUITS.index(suit)
+    except ValueError:
+        raise ValueError(f"Invalid trump suit: {suit}") from None
+
+
+def trump_indexes(suits):
+    """
+    Converts trump suits to an array of trump indexes.
+
+    Args:
+        suits (str, int or array_like): A trump suit, None, a trump index,
+              or an array of any of these.
+
+    Returns:
+        ndarray: The trump indexes, as intp.
+    """
+    if suits is None or isinstance(suits, str):
+        return np.asarray(trump_index(suits), dtype=np.intp)
+
+    suits = np.asarray(suits)
+    if suits.dtype.kind in 'iu':
+        indexes = suits.astype(np.intp)
+    else:
+        indexes = np.vectorize(trump_index, otypes=[np.intp])(suits)
+    if indexes.size and (indexes.min() < 0 or indexes.max() > NO_TRUMP):
+        raise ValueError("Invalid trump index in array")
+    return indexes
+
+
+def evaluate(codes, suits):
+    """
+    Returns the trump attributes of an array of card codes.
+
+    Args:
+        codes (array_like): The card codes, of any shape; NO_PLAY is allowed.
+        suits (str, int or array_like): The trump suit, or an array of trump
+              suits or trump indexes that broadcasts against codes.
+
+    Returns:
+        TrumpArrays: Arrays of trump symbols, ranks, points and trump status,
+                     with the broadcast shape of codes and suits.
+
+    Raises:
+        ValueError: If a code is not a card code or NO_PLAY.
+    """
+    codes = np.asarray(codes, dtype=np.intp)
+    if codes.size and (codes.min() < 0 or codes.max() > NO_PLAY):
+        raise ValueError("Invalid card code in array")
+    indexes = trump_indexes(suits)
+    return TrumpArrays(SYMBOL_TABLE[indexes, codes],
+                       RANK_TABLE[indexes, codes],
+                       POINTS_TABLE[indexes, codes],
+                       IS_TRUMP_TABLE[indexes, codes])
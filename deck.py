@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""
+Deck Module
+
+This module defines the Deck class, which holds the 54 card codes (see
+card_codes), or the codes of a smaller deck such as a Ruleset's, in a NumPy
+array and shuffles and deals them with a seeded NumPy random generator.
+Hands are dealt as arrays of card codes; Card objects are only created when
+from_codes() is called on them.
+
+Decks are reproducible: the same seed always deals the same hands, and
+spawn() splits a deck's seed into independent child decks, for example one
+per worker process.
+
+Classes:
+    Deck: A seeded, array-backed deck of card codes.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+import numpy as np
+
+from card import DECK
+import card_codes
+
+
+class Deck:
+    """
+    A seeded, array-backed deck of card codes
+    """
+
+    def __init__(self, seed=None, codes=None):
+        """
+        Initializes a Deck object.
+
+        Args:
+            seed (int or SeedSequence, optional): The seed of the random
+                 generator. If None, fresh entropy is used.
+            codes (array_like, optional): The card codes of the deck, for
+                  example card_codes.to_codes(ruleset.deck). If None, all
+                  54 cards are used.
+        """
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self.seed_sequence = seed
+        self.rng = np.random.Generator(np.random.PCG64(seed))
+        if codes is None:
+            self.codes = np.arange(len(DECK), dtype=np.uint8)
+        else:
+            self.codes = np.array(codes, dtype=np.uint8)
+            if len(np.unique(self.codes)) != len(self.codes) or \
+                    self.codes.size and self.codes.max() >= len(DECK):
+                raise ValueError("Invalid card codes for a deck")
+        # Rows of card codes reused by deal(), one per table
+        self._tables = np.empty((0, len(self.codes)), dtype=np.uint8)
+
+    def __len__(self):
+        """
+        Returns the number of cards in the deck.
+
+        Returns:
+            int: The number of cards.
+        """
+        return len(self.codes)
+
+    def spawn(self, count):
+        """
+        Splits the deck's seed into independent child decks.
+
+        Args:
+            count (int): The number of child decks.
+
+        Returns:
+            list: The child decks.
+        """
+        return [Deck(child, self.codes)
+                for child in self.seed_sequence.spawn(count)]
+
+    def shuffle(self):
+        """
+        Shuffles the card codes of the deck in place.
+        """
+        self.rng.shuffle(self.codes)
+
+    def cards(self):
+        """
+        Returns the cards of the deck, in their current order.
+
+        Returns:
+            list: The interned cards.
+        """
+        return card_codes.from_codes(self.codes)
+
+    def deal(self, hands=4, cards=6, tables=1):
+        """
+        Shuffles a fresh deck for each table and deals hands from it.
+
+        Args:
+            hands (int, optional): The number of hands dealt at each table.
+            cards (int, optional): The number of cards in each hand.
+            tables (int, optional): The number of tables.
+
+        Returns:
+            ndarray: The card codes of the hands, as uint8 with shape
+                     (tables, hands, cards).
+        """
+        if hands * cards > len(self.codes):
+            raise ValueError(f"Cannot deal {hands} hands of {cards} cards "
+                             f"from {len(self.codes)} cards")
+
+        if len(self._tables) != tables:
+            self._tables = np.tile(self.codes, (tables, 1))
+        self.rng.permuted(self._tables, axis=1, out=self._tables)
+        return self._tables[:, :hands * cards].reshape(tables, hands, cards).copy()
+
+    def deal_remaining(self, held, hands=3, cards=6, tables=1):
+        """
+        Deals hands from the cards that are not already held, for example
+        the other players' hands around a known hand.
+
+        Args:
+            held (array_like): The codes of the cards that are not dealt.
+            hands (int, optional): The number of hands dealt at each table.
+            cards (int, optional): The number of cards in each hand.
+            tables (int, optional): The number of tables.
+
+        Returns:
+            ndarray: The card codes of the hands, as uint8 with shape
+                     (tables, hands, cards).
+        """
+        remaining = np.setdiff1d(self.codes, np.asarray(held, dtype=np.uint8))
+        if hands * cards > len(remaining):
+            raise ValueError(f"Cannot deal {hands} hands of {cards} cards "
+                             f"from {len(remaining)} cards")
+
+        rows = np.tile(remaining, (tables, 1))
+        self.rng.permuted(rows, axis=1, out=rows)
+        return rows[:, :hands * cards].reshape(tables, hands, cards)
@@ -0,0 +1,464 @@
+#!/usr/bin/env python
+"""
+Engine Module
+
+This module runs many simulated Pitch tables at once on one asyncio event
+loop.  Each table is a coroutine that deals, takes bids, lets the bidder
+name trump and plays out the tricks, asking its four bots for their
+decisions through a transport.
+
+Tables share no mutable card state.  Hands are dealt as card codes by a Deck
+of the table's own, holding the cards of the table's ruleset, and bots see
+interned, read-only Cards (see Card.get()): instead of calling set_trump()
+on shared cards, a table passes the trump suit and its ruleset along, and
+bots read trump attributes with card.get_trump_entry(trump, ruleset).  Each
+table keeps its own ScoreTracker.
+
+An Engine runs a fixed number of table workers fed from a bounded queue, so
+a producer that starts tables faster than they finish is held back instead
+of piling up coroutines.  Every finished table is counted in the engine's
+Throughput and in the process-wide THROUGHPUT.
+
+Bots are async strategies with bid(), choose_trump() and play() coroutines;
+GreedyBot and RandomBot are provided.  The engine makes new bots for every
+table with its bot factory and calls their close() when the table ends,
+whether it finished or ended in a bot error.  The engine talks to them through a
+transport; InProcessTransport calls the bots directly, optionally after a
+simulated network latency, and stands in for a real network transport.
+
+Classes:
+    TableView: What a bot sees when it is asked for a decision.
+    TableResult: The outcome of one table.
+    BotError: Raised when a bot makes an illegal decision.
+    Bot: The base class of bot strategies.
+    GreedyBot: Bids its longest trump suit and plays greedily.
+    RandomBot: Makes random legal decisions.
+    InProcessTransport: Passes requests to bots in the same process.
+    Throughput: Counts finished tables and their rate.
+    Engine: Plays many tables concurrently.
+
+Constants:
+    MIN_BID: The lowest bid; the dealer must bid it when everyone passes.
+    THROUGHPUT: The process-wide Throughput of every engine.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+import asyncio
+import random
+import time
+from abc import ABC, abstractmethod
+from collections import namedtuple
+
+import numpy as np
+
+from card import DECK, SUITS
+import card_codes
+from deck import Deck
+from hand import Hand
+from legal import legal_mask
+from rules import STANDARD
+from score import ScoreTracker
+
+PLAYERS = 4
+CARDS = 6
+MIN_BID = 2
+PASS = 0
+
+TableView = namedtuple('TableView', ['table', 'seat', 'hand', 'bids', 'trump',
+                                     'trick', 'leader', 'legal', 'ruleset',
+                                     'tricks', 'points'],
+                       defaults=((), (0, 0)))
+TableResult = namedtuple('TableResult', ['table', 'bidder', 'bid', 'trump',
+                                         'points', 'made'])
+
+
+class BotError(ValueError):
+    """
+    Raised when a bot makes an illegal decision
+    """
+
+
+class Bot(ABC):
+    """
+    The base class of bot strategies; subclasses implement the coroutines
+    """
+
+    @abstractmethod
+    async def bid(self, view):
+        """
+        Returns a bid, higher than every bid in view.bids, or PASS.
+
+        Args:
+            view (TableView): The table as the bot sees it.
+
+        Returns:
+            int: The bid, or PASS.
+        """
+
+    @abstractmethod
+    async def choose_trump(self, view):
+        """
+        Returns the trump suit, after winning the bidding.
+
+        Args:
+            view (TableView): The table as the bot sees it.
+
+        Returns:
+            str: The trump suit.
+        """
+
+    @abstractmethod
+    async def play(self, view):
+        """
+        Returns the card to play, one of view.legal.
+
+        Args:
+            view (TableView): The table as the bot sees it.
+
+        Returns:
+            Card: The card to play.
+        """
+
+    def close(self):
+        """
+        Releases what the bot holds.  The engine calls it when the bot's
+        table ends; it may be called more than once.
+        """
+
+
+class GreedyBot(Bot):
+    """
+    A bot that bids its trump count in its longest trump suit and plays like
+    the simulator's players (see simulator.play_out())
+    """
+
+    @staticmethod
+    def _best_suit(view):
+        """
+        Returns the suit with the most trump in the bot's hand, breaking ties
+        by the ranks of the trumps.
+        """
+        def strength(suit):
+            ranks = [entry.rank for entry in
+                     (card.get_trump_entry(suit, view.ruleset)
+                      for card in view.hand) if entry.is_trump]
+            return len(ranks), sum(ranks)
+        return max(SUITS, key=strength)
+
+    async def bid(self, view):
+        suit = self._best_suit(view)
+        count = sum(card.is_trump(suit, view.ruleset) for card in view.hand)
+        high = max(view.bids, default=PASS)
+        return count if count >= MIN_BID + 1 and count > high else PASS
+
+    async def choose_trump(self, view):
+        return self._best_suit(view)
+
+    async def play(self, view):
+        def order(card):
+            entry = card.get_trump_entry(view.trump, view.ruleset)
+            return entry.rank, entry.points
+
+        if not view.trick:
+            return max(view.legal, key=order)
+        ranks = [card.get_trump_entry(view.trump, view.ruleset).rank
+                 for card in view.trick]
+        best = max(ranks)
+        winner = (view.leader + ranks.index(best)) % PLAYERS
+        if (winner - view.seat) % 2 == 0:
+            return min(view.legal, key=order)
+        winning = [card for card in view.legal if order(card)[0] > best]
+        return min(winning or view.legal, key=order)
+
+
+class RandomBot(Bot):
+    """
+    A bot that makes random legal decisions
+    """
+
+    def __init__(self, seed=None):
+        """
+        Initializes a RandomBot object.
+
+        Args:
+            seed (int, optional): The seed of the bot's decisions.
+        """
+        self.rng = random.Random(seed)
+
+    async def bid(self, view):
+        high = max(view.bids, default=PASS)
+        if high >= CARDS or self.rng.random() < 0.5:
+            return PASS
+        return max(high + 1, MIN_BID)
+
+    async def choose_trump(self, view):
+        return self.rng.choice(SUITS)
+
+    async def play(self, view):
+        return self.rng.choice(view.legal)
+
+
+class InProcessTransport:
+    """
+    A class to pass requests to bots in the same process, standing in for a
+    network transport
+    """
+
+    def __init__(self, bots, latency=None):
+        """
+        Initializes an InProcessTransport object.
+
+        Args:
+            bots (list): The bot of each seat.
+            latency (float, optional): Seconds to wait before each request,
+                    to simulate a network; None for no wait at all.
+        """
+        self.bots = bots
+        self.latency = latency
+
+    async def request(self, seat, decision, view):
+        """
+        Asks a bot for a decision.
+
+        Args:
+            seat (int): The seat of the bot.
+            decision (str): 'bid', 'choose_trump' or 'play'.
+            view (TableView): The table as the bot sees it.
+
+        Returns:
+            The bot's decision.
+        """
+        if self.latency is not None:
+            await asyncio.sleep(self.latency)
+        return await getattr(self.bots[seat], decision)(view)
+
+
+class Throughput:
+    """
+    A class to count finished tables and their rate
+    """
+
+    def __init__(self):
+        """
+        Initializes a Throughput object.
+        """
+        self.tables = 0
+        self.errors = 0
+        self.start = time.perf_counter()
+
+    def record(self, error=False):
+        """
+        Counts one finished table.
+
+        Args:
+            error (bool, optional): True if the table ended in a bot error.
+        """
+        if error:
+            self.errors += 1
+        else:
+            self.tables += 1
+
+    def tables_per_second(self):
+        """
+        Returns the rate of finished tables since the counter started.
+
+        Returns:
+            float: Tables per second.
+        """
+        elapsed = time.perf_counter() - self.start
+        return self.tables / elapsed if elapsed > 0 else 0.0
+
+    def reset(self):
+        """
+        Clears the counts and restarts the clock.
+        """
+        self.tables = self.errors = 0
+        self.start = time.perf_counter()
+
+
+THROUGHPUT = Throughput()
+
+
+async def play_table(table, transport, seed, dealer=0, ruleset=STANDARD):
+    """
+    Plays one table: deals, takes bids, lets the bidder name trump and plays
+    out the tricks.
+
+    Args:
+        table (int): The number of the table.
+        transport (InProcessTransport): The transport to the four bots.
+        seed (int or SeedSequence): The seed of the table's deck.
+        dealer (int, optional): The dealer's seat; bidding starts on its
+               left and the dealer bids last.
+        ruleset (Ruleset, optional): The rules to play by.
+
+    Returns:
+        TableResult: The outcome of the table.
+
+    Raises:
+        BotError: If a bot makes an illegal decision.
+    """
+    deck = Deck(seed, card_codes.to_codes(ruleset.deck))
+    hands = [Hand.from_codes(hand).mask
+             for hand in deck.deal(hands=PLAYERS, cards=CARDS)[0].tolist()]
+
+    played = []
+
+    def view(seat, bids=(), trump=None, trick=(), leader=None, legal=()):
+        return TableView(table, seat, _cards(hands[seat]), tuple(bids), trump,
+                         tuple(DECK[code] for code in trick), leader,
+                         _cards(legal) if legal else (), ruleset,
+                         tuple(tuple(DECK[code] for code in done)
+                               for done in played),
+                         tracker.state.points if trump else (0, 0))
+
+    # Bidding, once around from the dealer's left
+    bids = []
+    for offset in range(1, PLAYERS + 1):
+        seat = (dealer + offset) % PLAYERS
+        bid = await transport.request(seat, 'bid', view(seat, bids))
+        if bid != PASS and (bid <= max(bids, default=PASS) or bid < MIN_BID):
+            raise BotError(f"Table {table}: seat {seat} bid {bid} after {bids}")
+        bids.append(bid)
+    if max(bids) == PASS:
+        bids[-1] = MIN_BID
+    bid = max(bids)
+    bidder = (dealer + 1 + bids.index(bid)) % PLAYERS
+
+    trump = await transport.request(bidder, 'choose_trump', view(bidder, bids))
+    if trump not in SUITS:
+        raise BotError(f"Table {table}: seat {bidder} chose trump {trump}")
+
+    tracker = ScoreTracker(trump, ruleset)
+    leader = bidder
+    while hands[leader]:
+        trick = []
+        for offset in range(PLAYERS):
+            seat = (leader + offset) % PLAYERS
+            legal = legal_mask(hands[seat], trick[0] if trick else None, trump,
+                               ruleset)
+            card = await transport.request(seat, 'play', view(
+                seat, bids, trump, trick, leader, legal))
+            code = card_codes.CODES.get(getattr(card, 'short_name', None))
+            if code is None or not legal >> code & 1:
+                raise BotError(f"Table {table}: seat {seat} played {card}, "
+                               f"not one of {Hand.from_mask(legal)}")
+            hands[seat] &= ~(1 << code)
+            trick.append(code)
+        leader = tracker.play(trick, leader)
+        played.append(tuple(trick))
+
+    points = tracker.state.points
+    return TableResult(table, bidder, bid, trump, points,
+                       points[bidder % 2] >= bid)
+
+
+def _cards(mask):
+    """
+    Returns the interned cards of a hand mask, in code order.
+
+    Args:
+        mask (int): The hand mask.
+
+    Returns:
+        tuple: The cards.
+    """
+    return tuple(DECK[code] for code in Hand.from_mask(mask).codes())
+
+
+class Engine:
+    """
+    A class to play many tables concurrently on one event loop
+    """
+
+    def __init__(self, bot_factory=None, workers=1000, queue_size=None,
+                 latency=None, ruleset=STANDARD):
+        """
+        Initializes an Engine object.
+
+        Args:
+            bot_factory (callable, optional): Called as
+                        bot_factory(table, seat) to make each bot; None
+                        seats a GreedyBot everywhere.
+            workers (int, optional): The most tables played at once.
+            queue_size (int, optional): The most tables waiting to be played
+                       before the producer is held back; None for twice
+                       the workers.
+            latency (float, optional): The simulated latency of each bot
+                    request (see InProcessTransport).
+            ruleset (Ruleset, optional): The rules to play by.
+        """
+        if workers < 1:
+            raise ValueError(f"Invalid number of workers: {workers}")
+        self.bot_factory = bot_factory or (lambda table, seat: GreedyBot())
+        self.workers = workers
+        self.queue_size = 2 * workers if queue_size is None else queue_size
+        self.latency = latency
+        self.ruleset = ruleset
+        self.throughput = Throughput()
+
+    async def run(self, tables, seed=None, on_result=None):
+        """
+        Plays a number of tables.  The bots of each table are made with the
+        bot factory when the table starts and closed when it ends.
+
+        Args:
+            tables (int): The number of tables.
+            seed (int, optional): The seed of the run; table n is dealt from
+                 the n-th seed spawned from it.
+            on_result (callable, optional): A coroutine function called with
+                      each TableResult as it finishes.
+
+        Returns:
+            list: The TableResult of every table that finished without a bot
+                  error, in table order.
+        """
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        results = []
+        seeds = np.random.SeedSequence(seed)
+
+        async def produce():
+            for table, table_seed in enumerate(seeds.spawn(tables)):
+                # Waits while the queue is full: backpressure
+                await queue.put((table, table_seed))
+            for _ in range(self.workers):
+                await queue.put(None)
+
+        async def work():
+            while (item := await queue.get()) is not None:
+                table, table_seed = item
+                bots = [self.bot_factory(table, seat) for seat in range(PLAYERS)]
+                transport = InProcessTransport(bots, self.latency)
+                try:
+                    result = await play_table(table, transport, table_seed,
+                                              table % PLAYERS, self.ruleset)
+                except BotError:
+                    self.throughput.record(error=True)
+                    THROUGHPUT.record(error=True)
+                    continue
+                finally:
+                    for bot in bots:
+                        bot.close()
+                self.throughput.record()
+                THROUGHPUT.record()
+                results.append(result)
+                if on_result is not None:
+                    await on_result(result)
+
+        await asyncio.gather(produce(),
+                             *(work() for _ in range(self.workers)))
+        return sorted(results, key=lambda result: result.table)
+
+    def run_sync(self, tables, seed=None):
+        """
+        Plays a number of tables on a new event loop.
+
+        Args:
+            tables (int): The number of tables.
+            seed (int, optional): The seed of the run.
+
+        Returns:
+            list: The TableResult of every table, in table order.
+        """
+        return asyncio.run(self.run(tables, seed))
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+"""
+Evaluator Module
+
+This module defines the HandEvaluator class, which answers "what is this hand
+worth with this trump suit?" (trump count, highest and lowest trump, trump
+points) and remembers the answers in a bounded, thread-safe LRU cache.
+
+Equivalent hands share one cache entry: the key is the mask of the canonical
+hand (see symmetry.canonical()), whose trump suit is always Spades.  Every
+rule variant (see rules.Ruleset) treats the suits alike, so this holds for
+any ruleset; each evaluator uses one ruleset and has its own cache.
+
+Classes:
+    HandValue: The trump count, high and low trump ranks and trump points of
+               a hand for one trump suit.
+    CacheStats: The hit, miss and eviction counts and the size of the cache.
+    HandEvaluator: Evaluates hands with a bounded LRU cache.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+import sys
+import threading
+from collections import Counter, OrderedDict, namedtuple
+
+from card import SUITS
+from hand import Hand
+from rules import STANDARD
+from symmetry import canonical
+
+HandValue = namedtuple('HandValue', ['trump', 'trump_count', 'high', 'low',
+                                     'points'])
+CacheStats = namedtuple('CacheStats', ['hits', 'misses', 'evictions',
+                                       'entries', 'bytes'])
+
+# Approximate bytes used by one OrderedDict entry besides its key and value
+_ENTRY_OVERHEAD = 100
+
+
+class HandEvaluator:
+    """
+    A class to evaluate hands, with a bounded, thread-safe LRU cache
+    """
+
+    def __init__(self, max_entries=100000, max_bytes=None, ruleset=STANDARD):
+        """
+        Initializes a HandEvaluator object.
+
+        Args:
+            max_entries (int, optional): The most hands the cache holds.
+            max_bytes (int, optional): The most memory, in bytes, the cache
+                 may use; None for no limit besides max_entries.
+            ruleset (Ruleset, optional): The rules to evaluate hands by.
+        """
+        if max_entries < 1:
+            raise ValueError(f"Invalid cache size: {max_entries}")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # Lookup lists with Spades, the canonical trump suit, as trump
+        self.ruleset = ruleset
+        self._spades = ruleset.lists(SUITS[0])
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        # Hits, misses and evictions
+        self._counts = Counter()
+
+    def evaluate(self, hand, trump):
+        """
+        Returns the value of a hand for a trump suit.
+
+        Args:
+            hand (Hand or iterable): The hand, as a Hand or as cards.
+            trump (str): The trump suit.
+
+        Returns:
+            HandValue: The value of the hand.
+        """
+        if trump is None:
+            raise ValueError("A hand is evaluated for a trump suit")
+        key = canonical(hand, trump).hand.mask
+
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+                self._counts['hits'] += 1
+                return value._replace(trump=trump)
+            self._counts['misses'] += 1
+
+        value = self._compute(key)
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = value
+                self._bytes += self._entry_bytes(key, value)
+                self._evict()
+        return value._replace(trump=trump)
+
+    def evaluate_all(self, hand):
+        """
+        Returns the value of a hand for every trump suit.
+
+        Args:
+            hand (Hand or iterable): The hand, as a Hand or as cards.
+
+        Returns:
+            dict: The HandValue for each trump suit.
+        """
+        if not isinstance(hand, Hand):
+            hand = Hand(hand)
+        return {suit: self.evaluate(hand, suit) for suit in SUITS}
+
+    def stats(self):
+        """
+        Returns the statistics of the cache.
+
+        Returns:
+            CacheStats: The hits, misses, evictions, entries and bytes.
+        """
+        with self._lock:
+            return CacheStats(self._counts['hits'], self._counts['misses'],
+                              self._counts['evictions'], len(self._cache),
+                              self._bytes)
+
+    def clear(self):
+        """
+        Empties the cache and resets its statistics.
+        """
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+            self._counts.clear()
+
+    def _compute(self, mask):
+        """
+        Evaluates a canonical hand, whose trump suit is Spades.
+
+        Args:
+            mask (int): The mask of the canonical hand.
+
+        Returns:
+            HandValue: The value of the hand, with Spades as trump.
+        """
+        spades = self._spades
+        trumps = [code for code in Hand.from_mask(mask).codes()
+                  if spades.is_trump[code]]
+        ranks = [spades.rank[code] for code in trumps]
+        return HandValue(SUITS[0], len(ranks),
+                         max(ranks) if ranks else None,
+                         min(ranks) if ranks else None,
+                         sum(spades.points[code] for code in trumps))
+
+    @staticmethod
+    def _entry_bytes(key, value):
+        """
+        Estimates the memory used by one cache entry.
+
+        Args:
+            key (int): The key of the entry.
+            value (HandValue): The value of the entry.
+
+        Returns:
+            int: The approximate size in bytes.
+        """
+        return sys.getsizeof(key) + sys.getsizeof(value) + _ENTRY_OVERHEAD
+
+    def _evict(self):
+        """
+        Removes the least recently used entries until the cache is within
+        its limits.  The caller must hold the lock.
+        """
+        while self._cache and (
+                len(self._cache) > self.max_entries or
+                (self.max_bytes is not None and self._bytes > self.max_bytes)):
+            key, value = self._cache.popitem(last=False)
+            self._bytes -= self._entry_bytes(key, value)
+            self._counts['evictions'] += 1
@@ -0,0 +1,468 @@
+#!/usr/bin/env python
+"""
+Fuzz Module
+
+This module checks the fast representations of cards against the reference
+Card class with random, seeded cases, and times both.
+
+A case is a hand of card codes and a sequence of trump suits, None among
+them.  The reference makes a private Card for each code and, for each trump
+suit in turn, calls set_trump() on every card and records what the Card
+API reports: the symbol, rank and points attributes, get_trump_symbol(),
+is_trump() and how every pair of cards compares with < and >.  Because the
+same cards are reused from one trump suit to the next, stale state left by
+set_trump(), such as a card that keeps its trump points after
+set_trump(None), shows up as a disagreement.
+
+An implementation is registered by name with register().  It is called
+with the codes and the trump suits of a case and returns one Observation
+per trump suit; a field it leaves as None is not checked.  The trump table,
+the trump rules, TrumpContext, card_codes, the Hand masks and the STANDARD
+ruleset tables are registered here.
+
+fuzz() runs every implementation on the same cases and stops each one at
+its first disagreement, which it shrinks to a minimal reproducer: cards and
+trump suits are dropped as long as the disagreement remains.  An
+implementation that raises disagrees with an 'exception' field.  It also
+reports how long the reference and each implementation took on the cases
+they agreed on, timed once they are known to agree.
+
+    python fuzz.py --cases 5000 --seed 7
+    python fuzz.py codes mask
+
+Classes:
+    Case: A hand of card codes and a sequence of trump suits.
+    Observation: What an implementation reports for one trump suit.
+    Disagreement: The first difference between an implementation and the
+                  reference.
+    FuzzReport: The outcome of fuzzing one implementation.
+
+Functions:
+    register: Registers an implementation.
+    order_from_ranks: Returns how pairs of cards compare from their ranks.
+    reference: Observes a case through the reference Card API.
+    random_case: Returns a random case.
+    check: Finds the first disagreement on one case.
+    shrink: Reduces a disagreement to a minimal case.
+    fuzz: Checks implementations against the reference on random cases.
+
+Constants:
+    IMPLEMENTATIONS: The registered implementations, keyed by name.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+import argparse
+import random
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from card import Card, DECK
+import card_codes
+from hand import POINT_MASKS, TRUMP_MASKS
+from rules import STANDARD
+from trump import TrumpContext
+
+Case = namedtuple('Case', ['codes', 'trumps'])
+Observation = namedtuple('Observation', ['symbol', 'trump_symbol', 'rank',
+                                         'points', 'is_trump', 'order'],
+                         defaults=(None,) * 6)
+Disagreement = namedtuple('Disagreement', ['implementation', 'case', 'step',
+                                           'field', 'expected', 'actual'])
+FuzzReport = namedtuple('FuzzReport', ['implementation', 'cases',
+                                       'disagreement', 'reference_seconds',
+                                       'seconds'])
+
+IMPLEMENTATIONS = {}
+
+
+def register(name, implementation):
+    """
+    Registers an implementation to be checked against the reference.
+
+    Args:
+        name (str): The name of the implementation.
+        implementation (callable): Called with a tuple of card codes and a
+                       tuple of trump suits, it returns a sequence of
+                       Observations, one per trump suit.
+    """
+    IMPLEMENTATIONS[name] = implementation
+
+
+def order_from_ranks(ranks):
+    """
+    Returns how each pair of cards compares, from their ranks.
+
+    Args:
+        ranks (sequence): The rank of each card.
+
+    Returns:
+        tuple: For each pair (i, j) with i < j, 1 if card i ranks above
+               card j, -1 if below and 0 if they tie.
+    """
+    ranks = [int(rank) for rank in ranks]
+    return tuple((first > second) - (first < second)
+                 for index, first in enumerate(ranks)
+                 for second in ranks[index + 1:])
+
+
+def reference(codes, trumps):
+    """
+    Observes a case through the reference Card API, reusing the same cards
+    for every trump suit.
+
+    Args:
+        codes (tuple): The card codes.
+        trumps (tuple): The trump suits, None for no trump.
+
+    Returns:
+        list: One Observation per trump suit.
+    """
+    cards = [Card(DECK[code].name, DECK[code].suit) for code in codes]
+    observations = []
+    for trump in trumps:
+        for card in cards:
+            card.set_trump(trump)
+        order = tuple((card > other) - (card < other)
+                      for index, card in enumerate(cards)
+                      for other in cards[index + 1:])
+        observations.append(Observation(
+            tuple(card.symbol for card in cards),
+            tuple(card.get_trump_symbol(trump) for card in cards),
+            tuple(card.rank for card in cards),
+            tuple(card.points for card in cards),
+            tuple(card.is_trump() for card in cards), order))
+    return observations
+
+
+def _trump_symbols(symbols, trump):
+    """
+    Returns the trump symbols of get_trump_symbol() from entry symbols,
+    which hold the base symbol when there is no trump.
+    """
+    return tuple('N' for _ in symbols) if trump is None else tuple(symbols)
+
+
+def _from_entries(entries, trump):
+    """
+    Returns the Observation of a list of TrumpEntries.
+    """
+    symbols = tuple(entry.symbol for entry in entries)
+    ranks = tuple(entry.rank for entry in entries)
+    return Observation(symbols, _trump_symbols(symbols, trump), ranks,
+                       tuple(entry.points for entry in entries),
+                       tuple(entry.is_trump for entry in entries),
+                       order_from_ranks(ranks))
+
+
+def _table(codes, trumps):
+    """
+    Looks the cards up in Card.trump_table.
+    """
+    names = [DECK[code].short_name for code in codes]
+    return [_from_entries([Card.trump_table[name][trump] for name in names],
+                          trump) for trump in trumps]
+
+
+def _rules(codes, trumps):
+    """
+    Applies the trump rules with Card.trump_entry(), as before the table.
+    """
+    return [_from_entries([Card.trump_entry(DECK[code].name, DECK[code].suit,
+                                            trump) for code in codes], trump)
+            for trump in trumps]
+
+
+def _context(codes, trumps):
+    """
+    Asks a TrumpContext about the shared interned cards.
+    """
+    cards = [DECK[code] for code in codes]
+    observations = []
+    for trump in trumps:
+        context = TrumpContext(trump)
+        order = tuple(context.beats(first, second) -
+                      context.beats(second, first)
+                      for index, first in enumerate(cards)
+                      for second in cards[index + 1:])
+        observations.append(Observation(
+            tuple(context.symbol(card) for card in cards), None,
+            tuple(context.rank(card) for card in cards),
+            tuple(context.points(card) for card in cards),
+            tuple(context.is_trump(card) for card in cards), order))
+    return observations
+
+
+def _from_arrays(arrays, trumps):
+    """
+    Returns the Observations of TrumpArrays with one row per trump suit.
+    """
+    symbols, ranks, points, is_trump = (array.tolist() for array in arrays)
+    return [Observation(tuple(symbols[step]),
+                        _trump_symbols(symbols[step], trump),
+                        tuple(ranks[step]), tuple(points[step]),
+                        tuple(is_trump[step]), order_from_ranks(ranks[step]))
+            for step, trump in enumerate(trumps)]
+
+
+def _codes(codes, trumps):
+    """
+    Evaluates every trump suit of the case in one card_codes.evaluate() call.
+    """
+    indexes = card_codes.trump_indexes(list(trumps)).reshape(-1, 1)
+    return _from_arrays(card_codes.evaluate(np.array(codes, dtype=np.intp),
+                                            indexes), trumps)
+
+
+def _ruleset(codes, trumps):
+    """
+    Indexes the lookup arrays of the STANDARD ruleset.
+    """
+    indexes = card_codes.trump_indexes(list(trumps)).reshape(-1, 1)
+    codes = np.array(codes, dtype=np.intp)
+    return _from_arrays([table[indexes, codes] for table in STANDARD.tables],
+                        trumps)
+
+
+def _hand_masks(codes, trumps):
+    """
+    Tests the cards against the trump and point masks of hand.
+    """
+    observations = []
+    for trump in trumps:
+        points = [0] * len(codes)
+        for value, mask in POINT_MASKS[trump]:
+            for place, code in enumerate(codes):
+                if mask >> code & 1:
+                    points[place] = value
+        observations.append(Observation(
+            points=tuple(points),
+            is_trump=tuple(bool(TRUMP_MASKS[trump] >> code & 1)
+                           for code in codes)))
+    return observations
+
+
+register('table', _table)
+register('rules', _rules)
+register('context', _context)
+register('codes', _codes)
+register('ruleset', _ruleset)
+register('mask', _hand_masks)
+
+
+def random_case(rng, max_cards=6, max_trumps=6):
+    """
+    Returns a random case.
+
+    Args:
+        rng (Random): The random number generator.
+        max_cards (int, optional): The most cards in the hand.
+        max_trumps (int, optional): The most trump suits in the sequence.
+
+    Returns:
+        Case: The case; about a third of the trump suits are None, and the
+              off jack's suit and the jokers are dealt more often than by
+              chance.
+    """
+    special = [card_codes.CODES[name] for name in ('J♠', 'J♣', 'J♦', 'J♥',
+                                                   'BJ', 'LJ')]
+    codes = set()
+    for _ in range(rng.randint(1, max_cards)):
+        codes.add(rng.choice(special) if rng.random() < 0.3 else
+                  rng.randrange(len(DECK)))
+    trumps = tuple(None if rng.random() < 0.3 else
+                   rng.choice(card_codes.TRUMP_SUITS[:-1])
+                   for _ in range(rng.randint(1, max_trumps)))
+    return Case(tuple(codes), trumps)
+
+
+def check(case, implementation, name='', expected=None):
+    """
+    Finds the first disagreement between an implementation and the
+    reference on one case.
+
+    Args:
+        case (Case): The case.
+        implementation (callable): The implementation.
+        name (str, optional): The name of the implementation, for the report.
+        expected (list, optional): The reference observations, when already
+                 known.
+
+    Returns:
+        Disagreement: The first disagreement, by trump suit then field, or
+                      None when they agree.
+    """
+    if expected is None:
+        expected = reference(*case)
+    try:
+        actual = list(implementation(*case))
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return Disagreement(name, case, 0, 'exception', None, repr(error))
+    if len(actual) != len(expected):
+        return Disagreement(name, case, min(len(actual), len(expected)),
+                            'length', len(expected), len(actual))
+    for step, (wanted, seen) in enumerate(zip(expected, actual)):
+        for field in Observation._fields:
+            value = getattr(seen, field)
+            if value is not None and tuple(value) != getattr(wanted, field):
+                return Disagreement(name, case, step, field,
+                                    getattr(wanted, field), tuple(value))
+    return None
+
+
+def shrink(disagreement, implementation):
+    """
+    Reduces a disagreement to a minimal case by dropping trump suits after
+    the one that disagrees, then single trump suits and cards, as long as
+    the implementation still disagrees.
+
+    Args:
+        disagreement (Disagreement): The disagreement.
+        implementation (callable): The implementation.
+
+    Returns:
+        Disagreement: The disagreement on the smallest case found.
+    """
+    name = disagreement.implementation
+    codes, trumps = disagreement.case
+    found = check(Case(codes, trumps[:disagreement.step + 1]),
+                  implementation, name) or disagreement
+    changed = True
+    while changed:
+        changed = False
+        codes, trumps = found.case
+        smaller = [Case(codes, trumps[:step] + trumps[step + 1:])
+                   for step in range(len(trumps)) if len(trumps) > 1]
+        smaller += [Case(codes[:place] + codes[place + 1:], trumps)
+                    for place in range(len(codes)) if len(codes) > 1]
+        for case in smaller:
+            result = check(case, implementation, name)
+            if result is not None:
+                found, changed = result, True
+                break
+    return found
+
+
+def _timed(implementation, cases):
+    """
+    Runs an implementation on every case and times it.
+
+    Args:
+        implementation (callable): The implementation, or reference().
+        cases (list): The cases.
+
+    Returns:
+        tuple: The observations of every case and the seconds they took.
+    """
+    start = time.perf_counter()
+    observations = [implementation(*case) for case in cases]
+    return observations, time.perf_counter() - start
+
+
+def fuzz(cases=1000, seed=None, names=None):
+    """
+    Checks implementations against the reference on the same random cases.
+
+    Args:
+        cases (int, optional): The number of cases.
+        seed (int, optional): The seed of the cases.
+        names (iterable, optional): The names of the implementations to
+              check; None checks them all.
+
+    Returns:
+        list: A FuzzReport for each implementation.  An implementation stops
+              at its first disagreement, so its cases and seconds cover only
+              the cases it agreed on before then.
+    """
+    names = list(IMPLEMENTATIONS if names is None else names)
+    for name in names:
+        if name not in IMPLEMENTATIONS:
+            raise ValueError(f"Unknown implementation: {name}")
+    rng = random.Random(seed)
+    generated = [random_case(rng) for _ in range(cases)]
+    expected, reference_seconds = _timed(reference, generated)
+
+    reports = []
+    for name in names:
+        implementation = IMPLEMENTATIONS[name]
+        passed, disagreement = cases, None
+        for number, (case, wanted) in enumerate(zip(generated, expected)):
+            disagreement = check(case, implementation, name, wanted)
+            if disagreement is not None:
+                passed, disagreement = number, shrink(disagreement,
+                                                      implementation)
+                break
+        # Only cases that passed check() are timed, so none of them raises
+        _, seconds = _timed(implementation, generated[:passed])
+        reports.append(FuzzReport(name, passed, disagreement,
+                                  reference_seconds * passed / max(cases, 1),
+                                  seconds))
+    return reports
+
+
+def format_disagreement(disagreement):
+    """
+    Returns a disagreement as a reproducer that can be pasted into Python.
+
+    Args:
+        disagreement (Disagreement): The disagreement.
+
+    Returns:
+        str: The implementation, the case with its short names and the
+             field that differs.
+    """
+    codes, trumps = disagreement.case
+    names = ' '.join(DECK[code].short_name for code in codes)
+    return (f"{disagreement.implementation}: {disagreement.field} differs for "
+            f"trump {trumps[disagreement.step]!r} (step {disagreement.step})\n"
+            f"  cards  {names}\n"
+            f"  case   Case(codes={codes!r}, trumps={trumps!r})\n"
+            f"  expected {disagreement.expected!r}\n"
+            f"  actual   {disagreement.actual!r}")
+
+
+def main(argv=None):
+    """
+    Main function to fuzz the implementations and print the results.
+
+    Args:
+        argv (list, optional): The command line arguments; None uses
+             sys.argv.
+
+    Returns:
+        int: The exit status, 1 if any implementation disagrees.
+    """
+    parser = argparse.ArgumentParser(
+        description="Check fast card paths against the reference Card.")
+    parser.add_argument('names', nargs='*', metavar='implementation',
+                        help=f"implementations to check "
+                             f"({', '.join(IMPLEMENTATIONS)}); all by default")
+    parser.add_argument('--cases', type=int, default=1000,
+                        help="number of random cases (default 1000)")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="seed of the cases (default 0)")
+    args = parser.parse_args(argv)
+    for name in args.names:
+        if name not in IMPLEMENTATIONS:
+            parser.error(f"unknown implementation: {name}")
+
+    reports = fuzz(args.cases, args.seed, args.names or None)
+    failed = False
+    for report in reports:
+        speed = report.reference_seconds / report.seconds \
+            if report.seconds > 0 else float('inf')
+        status = 'ok' if report.disagreement is None else 'DISAGREES'
+        print(f'{report.implementation:<10} {report.cases:8d} cases '
+              f'{1e6 * report.seconds / max(report.cases, 1):10.1f} us/case '
+              f'{speed:8.1f}x reference  {status}', file=sys.stderr)
+        if report.disagreement is not None:
+            failed = True
+            print(format_disagreement(report.disagreement), file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
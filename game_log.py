@@ -0,0 +1,493 @@
+#!/usr/bin/env python
+"""
+Game Log Module
+
+This module streams archived hands from JSONL and CSV logs and aggregates
+statistics over them without loading whole files into memory.
+
+Every hand is a GameRecord: the trump suit, the seat that led the first trick
+and the tricks in the order they were played, with cards written the way
+Card.__str__ writes them (' A♠', '10♦', ' BJ'; the padding is optional).
+
+    JSONL: one object per line, e.g.
+        {"trump": "Spades", "leader": 0, "tricks": [[" A♠", "10♦", ...], ...]}
+    CSV: a header line, then one row per hand, cards separated by commas and
+         tricks by '|' in the tricks column, e.g.
+        trump,leader,tricks
+        Spades,0," A♠,10♦, 2♣, 9♠| K♠,..."
+
+The readers are generators over a byte range of a file, so a file can be
+split into chunks that are read on a process pool (see ingest()).  A chunk
+reads the lines that start inside its range.  Cards are parsed to codes with
+a lookup table built from card.DECK, so parsing never builds Card objects.
+
+The aggregators are updated one record at a time and merged across chunks:
+TrumpFrequency counts the trump suits, PointsDistribution counts the points
+scored by each trump symbol (A, J, X, B, L, 10, 3 and 2), and WinRates counts
+the hands won by each team for each trump suit.  A hand is scored with
+ScoreTracker.
+
+Classes:
+    GameRecord: One archived hand.
+    TrumpFrequency: Counts how often each trump suit is played.
+    PointsDistribution: Counts the points scored by each trump symbol.
+    WinRates: Counts the hands won by each team for each trump suit.
+
+Functions:
+    parse_code: Returns the card code of a card's text.
+    parse_card: Returns the interned card for a card's text.
+    read_jsonl: Streams the records of a JSONL log.
+    read_csv: Streams the records of a CSV log.
+    write_jsonl: Writes records to a JSONL log.
+    write_csv: Writes records to a CSV log.
+    aggregate: Feeds records to aggregators.
+    chunk_ranges: Splits a file into byte ranges.
+    ingest_chunk: Aggregates one byte range of a log.
+    ingest: Aggregates logs on a process pool.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+import csv
+import json
+import os
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from card import DECK
+import card_codes
+from score import ScoreTracker
+
+GameRecord = namedtuple('GameRecord', ['trump', 'leader', 'tricks'])
+
+CSV_FIELDS = ('trump', 'leader', 'tricks')
+
+# Card codes keyed by the text of each card, padded and not
+_TEXT_CODES = {**{card.short_name: code for code, card in enumerate(DECK)},
+               **{str(card): code for code, card in enumerate(DECK)}}
+
+
+@lru_cache(maxsize=1024)
+def _parse_other(text):
+    """
+    Returns the code of card text that is not in the lookup table as is.
+
+    Args:
+        text (str): The text of the card.
+
+    Returns:
+        int: The code of the card.
+    """
+    try:
+        return _TEXT_CODES[text.strip()]
+    except KeyError:
+        raise ValueError(f"Invalid card: {text!r}") from None
+
+
+def parse_code(text):
+    """
+    Returns the card code of a card's text.
+
+    Args:
+        text (str): The text of the card, as written by Card.__str__, with or
+             without padding.
+
+    Returns:
+        int: The code of the card.
+    """
+    code = _TEXT_CODES.get(text)
+    return _parse_other(text) if code is None else code
+
+
+def parse_card(text):
+    """
+    Returns the interned card for a card's text.
+
+    Args:
+        text (str): The text of the card, as written by Card.__str__, with or
+             without padding.
+
+    Returns:
+        Card: The interned card.
+    """
+    return DECK[parse_code(text)]
+
+
+def _record(trump, leader, tricks):
+    """
+    Builds a GameRecord from parsed fields.
+
+    Args:
+        trump (str): The trump suit, or None for no trump.
+        leader (int or str): The seat that led the first trick.
+        tricks (list): The text of the cards of each trick.
+
+    Returns:
+        GameRecord: The record, with the cards as codes.
+    """
+    card_codes.trump_index(trump)
+    return GameRecord(trump, int(leader),
+                      tuple(tuple(parse_code(text) for text in trick)
+                            for trick in tricks))
+
+
+def _lines(path, start=0, end=None):
+    """
+    Yields the lines of a file that start in a byte range.
+
+    Args:
+        path (str): The path of the file.
+        start (int, optional): The first byte of the range.
+        end (int, optional): The byte after the range; None for the end of
+            the file.
+
+    Yields:
+        str: The lines, without line endings.
+    """
+    with open(path, 'rb') as file:
+        if start > 0:
+            # Skip the line that started before the range
+            file.seek(start - 1)
+            file.readline()
+        while end is None or file.tell() < end:
+            line = file.readline()
+            if not line:
+                break
+            yield line.decode('utf-8').rstrip('\r\n')
+
+
+def read_jsonl(path, start=0, end=None):
+    """
+    Streams the records of a JSONL log.
+
+    Args:
+        path (str): The path of the log.
+        start (int, optional): The first byte to read from.
+        end (int, optional): The byte to stop before; None for the end.
+
+    Yields:
+        GameRecord: The records, with the cards as codes.
+    """
+    for line in _lines(path, start, end):
+        if line.strip():
+            fields = json.loads(line)
+            yield _record(fields['trump'], fields['leader'], fields['tricks'])
+
+
+def read_csv(path, start=0, end=None):
+    """
+    Streams the records of a CSV log.
+
+    Args:
+        path (str): The path of the log.
+        start (int, optional): The first byte to read from.
+        end (int, optional): The byte to stop before; None for the end.
+
+    Yields:
+        GameRecord: The records, with the cards as codes.
+    """
+    header = next(csv.reader(_lines(path, 0, 1)), None)
+    if header is None:
+        return
+    lines = _lines(path, start, end)
+    if start == 0:
+        next(lines, None)
+    for row in csv.DictReader(lines, fieldnames=header):
+        yield _record(row['trump'] or None, row['leader'],
+                      [trick.split(',') for trick in row['tricks'].split('|')])
+
+
+def write_jsonl(path, records):
+    """
+    Writes records to a JSONL log.
+
+    Args:
+        path (str): The path of the log.
+        records (iterable): The GameRecords to write.
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+        for record in records:
+            file.write(json.dumps({
+                'trump': record.trump, 'leader': record.leader,
+                'tricks': [[str(DECK[code]) for code in trick]
+                           for trick in record.tricks]},
+                ensure_ascii=False) + '\n')
+
+
+def write_csv(path, records):
+    """
+    Writes records to a CSV log.
+
+    Args:
+        path (str): The path of the log.
+        records (iterable): The GameRecords to write.
+    """
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file, lineterminator='\n')
+        writer.writerow(CSV_FIELDS)
+        for record in records:
+            writer.writerow([record.trump or '', record.leader, '|'.join(
+                ','.join(str(DECK[code]) for code in trick)
+                for trick in record.tricks)])
+
+
+class TrumpFrequency:
+    """
+    A class to count how often each trump suit is played
+    """
+
+    def __init__(self):
+        """
+        Initializes a TrumpFrequency object.
+        """
+        self.counts = Counter()
+
+    def add(self, record, score):
+        """
+        Counts the trump suit of one hand.
+
+        Args:
+            record (GameRecord): The hand.
+            score (ScoreState): The final score of the hand (unused).
+        """
+        del score
+        self.counts[record.trump] += 1
+
+    def merge(self, other):
+        """
+        Adds the counts of another TrumpFrequency.
+
+        Args:
+            other (TrumpFrequency): The counts to add.
+        """
+        self.counts.update(other.counts)
+
+    def result(self):
+        """
+        Returns the share of hands played with each trump suit.
+
+        Returns:
+            dict: The fraction of hands for each trump suit.
+        """
+        total = sum(self.counts.values())
+        return {trump: count / total for trump, count in self.counts.items()}
+
+
+class PointsDistribution:
+    """
+    A class to count the points scored by each trump symbol
+    """
+
+    def __init__(self):
+        """
+        Initializes a PointsDistribution object.
+        """
+        self.points = Counter()
+        self.hands = 0
+
+    def add(self, record, score):
+        """
+        Counts the points scored by the cards of one hand.
+
+        Args:
+            record (GameRecord): The hand.
+            score (ScoreState): The final score of the hand (unused).
+        """
+        del score
+        index = card_codes.trump_index(record.trump)
+        for trick in record.tricks:
+            for code in trick:
+                points = int(card_codes.POINTS_TABLE[index, code])
+                if points:
+                    self.points[str(card_codes.SYMBOL_TABLE[index, code])] += \
+                        points
+        self.hands += 1
+
+    def merge(self, other):
+        """
+        Adds the counts of another PointsDistribution.
+
+        Args:
+            other (PointsDistribution): The counts to add.
+        """
+        self.points.update(other.points)
+        self.hands += other.hands
+
+    def result(self):
+        """
+        Returns the average points each trump symbol scores per hand.
+
+        Returns:
+            dict: The points per hand for each trump symbol.
+        """
+        return {symbol: points / self.hands
+                for symbol, points in self.points.items()}
+
+
+class WinRates:
+    """
+    A class to count the hands won by each team for each trump suit
+    """
+
+    def __init__(self):
+        """
+        Initializes a WinRates object.
+        """
+        self.hands = Counter()
+        self.wins = Counter()
+
+    def add(self, record, score):
+        """
+        Counts the winner of one hand; a tied hand has no winner.
+
+        Args:
+            record (GameRecord): The hand.
+            score (ScoreState): The final score of the hand.
+        """
+        self.hands[record.trump] += 1
+        team_0, team_1 = score.points
+        if team_0 != team_1:
+            self.wins[record.trump, 0 if team_0 > team_1 else 1] += 1
+
+    def merge(self, other):
+        """
+        Adds the counts of another WinRates.
+
+        Args:
+            other (WinRates): The counts to add.
+        """
+        self.hands.update(other.hands)
+        self.wins.update(other.wins)
+
+    def result(self):
+        """
+        Returns the win rate of each team for each trump suit.
+
+        Returns:
+            dict: The (team 0, team 1) win rates for each trump suit.
+        """
+        return {trump: (self.wins[trump, 0] / hands,
+                        self.wins[trump, 1] / hands)
+                for trump, hands in self.hands.items()}
+
+
+def _default_aggregators():
+    """
+    Returns a new set of the standard aggregators.
+
+    Returns:
+        dict: The aggregators, keyed by name.
+    """
+    return {'trumps': TrumpFrequency(), 'points': PointsDistribution(),
+            'wins': WinRates()}
+
+
+def aggregate(records, aggregators=None):
+    """
+    Scores each record and feeds it to the aggregators.
+
+    Args:
+        records (iterable): The GameRecords.
+        aggregators (dict, optional): The aggregators, keyed by name; None
+                    for the standard ones.
+
+    Returns:
+        dict: The aggregators.
+    """
+    if aggregators is None:
+        aggregators = _default_aggregators()
+    # A tracker and its empty score for each trump suit, reused across hands
+    trackers = {}
+    for record in records:
+        if record.trump not in trackers:
+            tracker = ScoreTracker(record.trump)
+            trackers[record.trump] = (tracker, tracker.snapshot())
+        tracker, empty = trackers[record.trump]
+        tracker.restore(empty)
+        leader = record.leader
+        for trick in record.tricks:
+            leader = tracker.play(trick, leader)
+        for aggregator in aggregators.values():
+            aggregator.add(record, tracker.state)
+    return aggregators
+
+
+def chunk_ranges(path, chunk_size):
+    """
+    Splits a file into byte ranges of about the same size.
+
+    Args:
+        path (str): The path of the file.
+        chunk_size (int): The number of bytes per range.
+
+    Returns:
+        list: The (start, end) byte ranges.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size: {chunk_size}")
+    size = os.path.getsize(path)
+    return [(start, min(start + chunk_size, size))
+            for start in range(0, size, chunk_size)]
+
+
+def ingest_chunk(path, start=0, end=None):
+    """
+    Aggregates one byte range of a log with the standard aggregators.
+
+    Args:
+        path (str): The path of the log; a name ending in .csv is read as
+             CSV, anything else as JSONL.
+        start (int, optional): The first byte to read from.
+        end (int, optional): The byte to stop before; None for the end.
+
+    Returns:
+        dict: The aggregators, keyed by name.
+    """
+    reader = read_csv if path.lower().endswith('.csv') else read_jsonl
+    return aggregate(reader(path, start, end))
+
+
+def _merge(results):
+    """
+    Merges the aggregators of several chunks.
+
+    Args:
+        results (iterable): The aggregators of each chunk.
+
+    Returns:
+        dict: The merged aggregators.
+    """
+    merged = _default_aggregators()
+    for aggregators in results:
+        for name, aggregator in aggregators.items():
+            merged[name].merge(aggregator)
+    return merged
+
+
+def ingest(paths, workers=None, chunk_size=1 << 26):
+    """
+    Aggregates logs with the standard aggregators, splitting each file into
+    chunks that are read on a process pool.
+
+    Args:
+        paths (iterable): The paths of the logs.
+        workers (int, optional): The number of worker processes; None uses
+            every core and 1 runs in this process.
+        chunk_size (int, optional): The number of bytes per chunk.
+
+    Returns:
+        dict: The merged aggregators, keyed by name.
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    chunks = [(os.fspath(path), start, end) for path in paths
+              for start, end in chunk_ranges(path, chunk_size)]
+    arguments = tuple(zip(*chunks)) if chunks else ((), (), ())
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1 or len(chunks) <= 1:
+        return _merge(map(ingest_chunk, *arguments))
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        return _merge(pool.map(ingest_chunk, *arguments))
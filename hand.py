@@ -0,0 +1,508 @@
+#!/usr/bin/env python
+"""
+Hand Module
+
+This module defines the Hand class, which holds a set of cards as a single
+54 bit integer, bit n being set when the hand holds the card with code n (see
+card_codes).  Set operations are integer operations, and trump counts and
+trump points are popcounts against masks precomputed for every trump suit.
+The masks follow the standard rules only (see rules.STANDARD); the follow and
+ruff masks of other variants are in the legal module.
+
+Known limitation: benchmark.py hand measures a trump count and trump points
+lookup at about 6-7x faster than the same evaluation over a list of Cards,
+short of the order of magnitude that was asked for.  The popcounts are
+cheap; what remains is the cost of the Python method calls themselves, so
+callers that need more should evaluate many hands at once with NumPy, as
+card_codes.evaluate() does, rather than one Hand at a time.
+
+It also defines the SortedHand class, which keeps a hand sorted by the sort
+keys of a trump suit (see Card.sort_key()) so that cards can be inserted and
+removed with bisect, and the highest and lowest trump found without sorting.
+
+Classes:
+    Hand: An immutable set of cards backed by a bitmask.
+    SortedHand: A hand kept in sort key order for a trump suit.
+
+Functions:
+    codes_to_mask: Returns the mask of a set of card codes.
+    mask_to_codes: Returns the card codes of a mask.
+
+Constants:
+    TRUMP_MASKS: The trump cards of each trump suit, as masks.
+    POINT_MASKS: For each trump suit, (points, mask) pairs of the cards that
+                 score, grouped by their points.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+from bisect import bisect_left
+
+from card import DECK
+import card_codes
+from trump import TrumpContext
+
+
+def codes_to_mask(codes):
+    """
+    Returns the mask with the bits of the given codes set.
+
+    Args:
+        codes (iterable): The card codes.
+
+    Returns:
+        int: The mask.
+    """
+    mask = 0
+    for code in codes:
+        mask |= 1 << int(code)
+    return mask
+
+
+def mask_to_codes(mask):
+    """
+    Returns the codes of the bits set in a mask.
+
+    Args:
+        mask (int): The mask.
+
+    Returns:
+        list: The card codes, in code order.
+    """
+    codes = []
+    while mask:
+        low = mask & -mask
+        codes.append(low.bit_length() - 1)
+        mask ^= low
+    return codes
+
+
+FULL_MASK = (1 << len(DECK)) - 1
+
+TRUMP_MASKS = {suit: codes_to_mask(code for code in range(len(DECK))
+                           if card_codes.IS_TRUMP_TABLE[index, code])
+               for index, suit in enumerate(card_codes.TRUMP_SUITS)}
+
+POINT_MASKS = {suit: tuple((points, codes_to_mask(
+    code for code in range(len(DECK))
+    if card_codes.POINTS_TABLE[index, code] == points))
+    for points in sorted(set(card_codes.POINTS_TABLE[index].tolist()) - {0}))
+    for index, suit in enumerate(card_codes.TRUMP_SUITS)}
+
+# Card codes from the highest base rank to the lowest, in code order on ties
+RANK_ORDER = tuple(sorted(range(len(DECK)),
+                          key=lambda code: (-DECK[code].rank, code)))
+
+
+class Hand:
+    """
+    An immutable set of cards backed by a 54 bit mask
+    """
+
+    __slots__ = ('mask',)
+
+    def __init__(self, cards=()):
+        """
+        Initializes a Hand object.
+
+        Args:
+            cards (iterable, optional): The cards in the hand.
+        """
+        self.mask = codes_to_mask(card_codes.to_code(card) for card in cards)
+
+    @classmethod
+    def from_mask(cls, mask):
+        """
+        Returns the hand for a mask.
+
+        Args:
+            mask (int): The mask, bit n set for the card with code n.
+
+        Returns:
+            Hand: The hand.
+        """
+        if not 0 <= mask <= FULL_MASK:
+            raise ValueError(f"Invalid hand mask: {mask:#x}")
+        hand = cls.__new__(cls)
+        hand.mask = mask
+        return hand
+
+    @classmethod
+    def from_codes(cls, codes):
+        """
+        Returns the hand holding the cards with the given codes.
+
+        Args:
+            codes (iterable): The card codes.
+
+        Returns:
+            Hand: The hand.
+        """
+        return cls.from_mask(codes_to_mask(codes))
+
+    def __str__(self):
+        """
+        Returns a string representation of the hand.
+
+        Returns:
+            str: The cards of the hand, in rank order.
+        """
+        return ' '.join(str(card) for card in self)
+
+    def __repr__(self):
+        """
+        Returns a string representation of the hand.
+
+        Returns:
+            str: The mask of the hand.
+        """
+        return f"Hand.from_mask({self.mask:#x})"
+
+    def __eq__(self, other):
+        """
+        Checks if the hand holds the same cards as another hand.
+
+        Args:
+            other (Hand): The other hand to compare with.
+
+        Returns:
+            bool: True if both hands hold the same cards, False otherwise.
+        """
+        if not isinstance(other, Hand):
+            return NotImplemented
+        return self.mask == other.mask
+
+    def __hash__(self):
+        """
+        Returns the hash of the hand.
+
+        Returns:
+            int: The hash of the mask.
+        """
+        return hash(self.mask)
+
+    def __len__(self):
+        """
+        Returns the number of cards in the hand.
+
+        Returns:
+            int: The number of cards.
+        """
+        return self.mask.bit_count()
+
+    def __bool__(self):
+        """
+        Checks if the hand holds any cards.
+
+        Returns:
+            bool: True if the hand is not empty, False otherwise.
+        """
+        return self.mask != 0
+
+    def __contains__(self, card):
+        """
+        Checks if the hand holds a card.
+
+        Args:
+            card (Card): The card to look for.
+
+        Returns:
+            bool: True if the hand holds the card, False otherwise.
+        """
+        code = card_codes.CODES.get(card.short_name)
+        return code is not None and self.mask >> code & 1 == 1
+
+    def __iter__(self):
+        """
+        Iterates over the cards of the hand, from the highest base rank to
+        the lowest.
+
+        Yields:
+            Card: The interned cards of the hand.
+        """
+        mask = self.mask
+        for code in RANK_ORDER:
+            if mask >> code & 1:
+                yield DECK[code]
+
+    def __or__(self, other):
+        """
+        Returns the union of two hands.
+        """
+        if not isinstance(other, Hand):
+            return NotImplemented
+        return Hand.from_mask(self.mask | other.mask)
+
+    def __and__(self, other):
+        """
+        Returns the intersection of two hands.
+        """
+        if not isinstance(other, Hand):
+            return NotImplemented
+        return Hand.from_mask(self.mask & other.mask)
+
+    def __sub__(self, other):
+        """
+        Returns the cards of this hand that are not in another hand.
+        """
+        if not isinstance(other, Hand):
+            return NotImplemented
+        return Hand.from_mask(self.mask & ~other.mask)
+
+    def add(self, card):
+        """
+        Returns the hand with a card added.
+
+        Args:
+            card (Card): The card to add.
+
+        Returns:
+            Hand: The new hand.
+        """
+        return Hand.from_mask(self.mask | 1 << card_codes.to_code(card))
+
+    def remove(self, card):
+        """
+        Returns the hand with a card removed.
+
+        Args:
+            card (Card): The card to remove.
+
+        Returns:
+            Hand: The new hand.
+
+        Raises:
+            KeyError: If the hand does not hold the card.
+        """
+        if card not in self:
+            raise KeyError(card)
+        return Hand.from_mask(self.mask & ~(1 << card_codes.to_code(card)))
+
+    def codes(self):
+        """
+        Returns the codes of the cards in the hand.
+
+        Returns:
+            list: The card codes, in code order.
+        """
+        return mask_to_codes(self.mask)
+
+    def trumps(self, suit):
+        """
+        Returns the trump cards of the hand.
+
+        Args:
+            suit (str): The trump suit.
+
+        Returns:
+            Hand: The trump cards.
+        """
+        return Hand.from_mask(self.mask & TRUMP_MASKS[suit])
+
+    def trump_count(self, suit):
+        """
+        Returns the number of trump cards in the hand.
+
+        Args:
+            suit (str): The trump suit.
+
+        Returns:
+            int: The number of trump cards.
+        """
+        return (self.mask & TRUMP_MASKS[suit]).bit_count()
+
+    def trump_points(self, suit):
+        """
+        Returns the total points of the trump cards in the hand.
+
+        Args:
+            suit (str): The trump suit.
+
+        Returns:
+            int: The total points.
+        """
+        mask = self.mask
+        total = 0
+        for points, point_mask in POINT_MASKS[suit]:
+            total += points * (mask & point_mask).bit_count()
+        return total
+
+
+# The smallest sort key of a trump card for each trump suit
+_LOWEST_TRUMP_KEYS = {suit: min((context.key(card) for card in DECK
+                                 if context.is_trump(card)), default=None)
+                      for suit in card_codes.TRUMP_SUITS
+                      for context in (TrumpContext(suit),)}
+
+
+class SortedHand:
+    """
+    A hand kept in sort key order for a trump suit
+    """
+
+    def __init__(self, cards=(), suit=None):
+        """
+        Initializes a SortedHand object.
+
+        Args:
+            cards (iterable, optional): The cards in the hand.
+            suit (str, optional): The trump suit to sort by, or None.
+        """
+        self.context = TrumpContext(suit)
+        self._keys, self._cards = self._sort(cards)
+
+    def __str__(self):
+        """
+        Returns a string representation of the hand.
+
+        Returns:
+            str: The cards of the hand, from lowest to highest.
+        """
+        return ' '.join(str(card) for card in self._cards)
+
+    def __repr__(self):
+        """
+        Returns a string representation of the hand.
+
+        Returns:
+            str: The cards and the trump suit of the hand.
+        """
+        return f"SortedHand({self._cards!r}, suit={self.context.suit!r})"
+
+    def __len__(self):
+        """
+        Returns the number of cards in the hand.
+
+        Returns:
+            int: The number of cards.
+        """
+        return len(self._cards)
+
+    def __iter__(self):
+        """
+        Iterates over the cards of the hand, from lowest to highest.
+
+        Returns:
+            iterator: The cards.
+        """
+        return iter(self._cards)
+
+    def __getitem__(self, index):
+        """
+        Returns the card at a position in sort order.
+
+        Args:
+            index (int or slice): The position.
+
+        Returns:
+            Card: The card, or a list of cards for a slice.
+        """
+        return self._cards[index]
+
+    def __contains__(self, card):
+        """
+        Checks if the hand holds a card.
+
+        Args:
+            card (Card): The card to look for.
+
+        Returns:
+            bool: True if the hand holds the card, False otherwise.
+        """
+        return self._find(card) is not None
+
+    def _sort(self, cards):
+        """
+        Sorts cards by their sort keys for the trump suit of the hand.
+
+        Args:
+            cards (iterable): The cards to sort.
+
+        Returns:
+            tuple: The sorted list of keys and the list of cards in the
+                   same order.
+        """
+        keyed = sorted(((self.context.key(card), card) for card in cards),
+                       key=lambda pair: pair[0])
+        return [key for key, _ in keyed], [card for _, card in keyed]
+
+    def _find(self, card):
+        """
+        Returns the position of a card in the hand.
+
+        Args:
+            card (Card): The card to look for.
+
+        Returns:
+            int: The position of the card, or None if it is not held.
+        """
+        key = self.context.key(card)
+        index = bisect_left(self._keys, key)
+        while index < len(self._keys) and self._keys[index] == key:
+            if self._cards[index] == card:
+                return index
+            index += 1
+        return None
+
+    def insert(self, card):
+        """
+        Adds a card to the hand, keeping it sorted.
+
+        Args:
+            card (Card): The card to add.
+        """
+        key = self.context.key(card)
+        index = bisect_left(self._keys, key)
+        self._keys.insert(index, key)
+        self._cards.insert(index, card)
+
+    def remove(self, card):
+        """
+        Removes a card from the hand.
+
+        Args:
+            card (Card): The card to remove.
+
+        Raises:
+            ValueError: If the hand does not hold the card.
+        """
+        index = self._find(card)
+        if index is None:
+            raise ValueError(f"{card} is not in the hand")
+        del self._keys[index]
+        del self._cards[index]
+
+    def set_trump(self, suit=None):
+        """
+        Changes the trump suit of the hand and re-sorts it.
+
+        Args:
+            suit (str, optional): The trump suit to sort by, or None.
+        """
+        self.context = TrumpContext(suit)
+        self._keys, self._cards = self._sort(self._cards)
+
+    def highest_trump(self):
+        """
+        Returns the highest trump card of the hand.
+
+        Returns:
+            Card: The highest trump card, or None if there is none.
+        """
+        lowest_key = _LOWEST_TRUMP_KEYS[self.context.suit]
+        if lowest_key is None or not self._keys or self._keys[-1] < lowest_key:
+            return None
+        return self._cards[-1]
+
+    def lowest_trump(self):
+        """
+        Returns the lowest trump card of the hand.
+
+        Returns:
+            Card: The lowest trump card, or None if there is none.
+        """
+        lowest_key = _LOWEST_TRUMP_KEYS[self.context.suit]
+        if lowest_key is None:
+            return None
+        index = bisect_left(self._keys, lowest_key)
+        return self._cards[index] if index < len(self._cards) else None
@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+"""
+Instrument Module
+
+This module counts the calls of the Card methods, the time spent in them and
+the lookups in Card.card_reference, for finding which callers do the most
+card work.
+
+Instrumentation costs nothing while it is off: enable() replaces the Card
+methods listed in METHODS with counting wrappers and Card.card_reference
+with a counting copy, and disable() puts the originals back, so the
+uninstrumented class is the class as defined in card.py.
+
+Calls are recorded in the Metrics of the innermost instrument() block of the
+running thread or task (a contextvars.ContextVar), or in the global Metrics
+returned by global_metrics() outside of any block.  A block adds its metrics
+to the enclosing one when it ends.  Times are inclusive: a set_trump() call
+also counts the time of the get_trump_entry() call it makes.
+
+    with instrument() as metrics:
+        handle_request()
+    send_to_metrics_pipeline(metrics.snapshot())
+
+Classes:
+    Metrics: Call counts and times of the Card methods.
+
+Functions:
+    enable: Turns instrumentation on.
+    disable: Turns instrumentation off.
+    is_enabled: Checks if instrumentation is on.
+    instrument: A context manager that records the calls made inside it.
+    global_metrics: Returns the metrics recorded outside instrument() blocks.
+
+Constants:
+    METHODS: The names of the Card methods that are instrumented.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+import functools
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from card import Card
+
+METHODS = ('__init__', 'get', '__str__', '__repr__', '__lt__', '__gt__',
+           '__eq__', '__hash__', 'state', 'desc', 'trump_entry',
+           'get_trump_entry', 'sort_key', 'is_trump', 'is_nontrump',
+           'get_trump_symbol', 'set_trump')
+
+# The name card_reference lookups are counted under
+LOOKUP = 'card_reference'
+
+
+class Metrics:
+    """
+    A class to hold call counts and times of the Card methods
+    """
+
+    def __init__(self):
+        """
+        Initializes a Metrics object.
+        """
+        self.calls = Counter()
+        self.nanoseconds = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, name, nanoseconds=0):
+        """
+        Records one call.
+
+        Args:
+            name (str): The name of the method, or LOOKUP.
+            nanoseconds (int, optional): The time the call took.
+        """
+        with self._lock:
+            self.calls[name] += 1
+            self.nanoseconds[name] += nanoseconds
+
+    def merge(self, other):
+        """
+        Adds the counts and times of another Metrics.
+
+        Args:
+            other (Metrics): The metrics to add.
+        """
+        with self._lock:
+            self.calls.update(other.calls)
+            self.nanoseconds.update(other.nanoseconds)
+
+    def reset(self):
+        """
+        Clears the counts and times.
+        """
+        with self._lock:
+            self.calls.clear()
+            self.nanoseconds.clear()
+
+    def snapshot(self):
+        """
+        Returns the counts and times as plain data.
+
+        Returns:
+            dict: For each name, a dict of its 'calls' and its total
+                  'seconds'; lookups have no time and report 0.
+        """
+        with self._lock:
+            return {name: {'calls': calls,
+                           'seconds': self.nanoseconds[name] / 1e9}
+                    for name, calls in sorted(self.calls.items())}
+
+
+_GLOBAL = Metrics()
+_current = ContextVar('card_metrics', default=None)
+
+# The original class attributes while instrumentation is on
+_originals = {}
+_enabled_lock = threading.Lock()
+_enabled_count = [0]
+
+
+def _metrics():
+    """
+    Returns the metrics calls are recorded in.
+
+    Returns:
+        Metrics: The metrics of the innermost instrument() block, or the
+                 global metrics.
+    """
+    metrics = _current.get()
+    return _GLOBAL if metrics is None else metrics
+
+
+def _wrap(name, func):
+    """
+    Returns a wrapper that records the calls of a function.
+
+    Args:
+        name (str): The name calls are recorded under.
+        func (callable): The function to wrap.
+
+    Returns:
+        callable: The wrapper.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _metrics().record(name, time.perf_counter_ns() - start)
+    return wrapper
+
+
+class _CountingReference(dict):
+    """
+    A copy of Card.card_reference that counts its lookups
+    """
+
+    def __getitem__(self, key):
+        _metrics().record(LOOKUP)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        _metrics().record(LOOKUP)
+        return super().get(key, default)
+
+
+def enable():
+    """
+    Turns instrumentation on.  Calls nest: instrumentation stays on until
+    disable() has been called as many times as enable().
+    """
+    with _enabled_lock:
+        _enabled_count[0] += 1
+        if _enabled_count[0] > 1:
+            return
+        for name in METHODS:
+            attribute = Card.__dict__[name]
+            _originals[name] = attribute
+            if isinstance(attribute, classmethod):
+                wrapped = classmethod(_wrap(name, attribute.__func__))
+            elif isinstance(attribute, staticmethod):
+                wrapped = staticmethod(_wrap(name, attribute.__func__))
+            else:
+                wrapped = _wrap(name, attribute)
+            setattr(Card, name, wrapped)
+        _originals[LOOKUP] = Card.card_reference
+        Card.card_reference = _CountingReference(Card.card_reference)
+
+
+def disable():
+    """
+    Turns instrumentation off, putting the original Card attributes back.
+    """
+    with _enabled_lock:
+        if _enabled_count[0] == 0:
+            raise RuntimeError("Instrumentation is not enabled")
+        _enabled_count[0] -= 1
+        if _enabled_count[0] > 0:
+            return
+        for name in METHODS:
+            setattr(Card, name, _originals.pop(name))
+        Card.card_reference = _originals.pop(LOOKUP)
+
+
+def is_enabled():
+    """
+    Checks if instrumentation is on.
+
+    Returns:
+        bool: True if the Card methods are instrumented, False otherwise.
+    """
+    return _enabled_count[0] > 0
+
+
+@contextmanager
+def instrument():
+    """
+    Turns instrumentation on for a block and records the calls made in it.
+
+    Yields:
+        Metrics: The metrics of the block, complete when the block ends.
+    """
+    metrics = Metrics()
+    parent = _current.get()
+    enable()
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
+        disable()
+        (_GLOBAL if parent is None else parent).merge(metrics)
+
+
+def global_metrics():
+    """
+    Returns the metrics recorded outside of instrument() blocks, including
+    those of every block that has ended.
+
+    Returns:
+        Metrics: The global metrics.
+    """
+    return _GLOBAL
@@ -0,0 +1,447 @@
+#!/usr/bin/env python
+"""
+ISMCTS Module
+
+This module defines a search player that bids, names trump and plays cards
+with information set Monte Carlo tree search (single observer ISMCTS).  The
+searching player cannot see the other hands, so every iteration deals the
+unseen cards at random into hands of the right sizes (a determinization),
+walks down one shared tree choosing among the moves that are legal in that
+deal with UCB1 (each child counting how often it was available), adds one
+node, plays the deal out with random legal moves and scores it.  Each node
+holds the mean share of the points taken by the team that made its move, so
+the players of both teams search for their own side.
+
+Positions are card codes and hand masks (see hand.Hand), and legal moves
+come from the follow masks of legal, which follow Card.is_trump() and
+Card.get_trump_symbol(), so the off jack and the jokers follow trump and a
+playout never builds a Card.  Ranks, points and follow masks come from the
+tables of a ruleset (see rules.Ruleset).
+
+The search uses root parallelism: each worker process grows its own tree
+from its own seed, and the visit counts and points of the root moves are
+added up; the most visited move is played.  The budget is a number of
+iterations, shared among the workers, or a time limit that each worker
+searches for, or both.  The results depend only on the seed and the number
+of workers when the budget is a number of iterations.  An IsmctsBot starts
+its process pool on its first parallel search and keeps it until close(),
+so that pool startup does not eat into each decision's time limit.  The
+engine closes every bot when its table ends, so bots made for many tables
+should share one pool, passed in with pool= and shut down by the caller.
+
+A bid is the points the bidder's team is expected to take with its best
+trump suit, the value of the best first lead of a search for each suit.
+
+Classes:
+    Position: A position as the searching player sees it.
+    SearchResult: The outcome of a search.
+    IsmctsBot: A bot (see engine.Bot) that decides by search.
+
+Functions:
+    position_from_view: Returns the position a bot sees at a table.
+    search_tree: Grows one search tree and returns the root statistics.
+    search: Searches a position with root parallelism.
+
+Constants:
+    RESULTS_KEPT: The number of recent search results an IsmctsBot keeps.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+import asyncio
+import math
+import os
+import random
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from card import SUITS
+import card_codes
+from engine import Bot, MIN_BID, PASS, PLAYERS
+from hand import codes_to_mask, mask_to_codes
+from legal import follow_masks
+
+Position = namedtuple('Position', ['seat', 'hand', 'trump', 'leader', 'trick',
+                                   'played', 'points', 'deck', 'ranks',
+                                   'card_points', 'follow'])
+SearchResult = namedtuple('SearchResult', ['move', 'visits', 'values',
+                                           'playouts', 'seconds',
+                                           'playouts_per_second'])
+
+RESULTS_KEPT = 100
+
+# Iterations between checks of the time limit
+_CLOCK_INTERVAL = 64
+
+
+def position_from_view(view, trump=None):
+    """
+    Returns the position a bot sees at a table.
+
+    Args:
+        view (TableView): The table as the bot sees it.
+        trump (str, optional): The trump suit, when view.trump is not set
+              yet (for bidding); the bot then leads the first trick.
+
+    Returns:
+        Position: The position.
+    """
+    trump = view.trump if trump is None else trump
+    tables = view.ruleset.lists(trump)
+    played = codes_to_mask(card_codes.to_code(card)
+                           for trick in view.tricks for card in trick)
+    return Position(view.seat, codes_to_mask(card_codes.to_codes(view.hand)),
+                    trump, view.seat if view.leader is None else view.leader,
+                    tuple(card_codes.to_code(card) for card in view.trick),
+                    played, tuple(view.points),
+                    codes_to_mask(card_codes.to_codes(view.ruleset.deck)),
+                    tuple(tables.rank), tuple(tables.points),
+                    follow_masks(trump, view.ruleset))
+
+
+def _deal(position, rng):
+    """
+    Deals the cards the searching player cannot see into the other hands.
+
+    Args:
+        position (Position): The position.
+        rng (Random): The random number generator.
+
+    Returns:
+        list: The mask of each seat's hand.
+    """
+    seat, leader, trick = position.seat, position.leader, position.trick
+    in_trick = {(leader + offset) % PLAYERS for offset in range(len(trick))}
+    # The cards each seat holds before playing to the current trick
+    cards = position.hand.bit_count() + (seat in in_trick)
+    unseen = mask_to_codes(position.deck & ~position.hand &
+                           ~position.played & ~codes_to_mask(trick))
+    rng.shuffle(unseen)
+    hands = [0] * PLAYERS
+    hands[seat] = position.hand
+    start = 0
+    for other in range(PLAYERS):
+        if other == seat:
+            continue
+        size = cards - (other in in_trick)
+        hands[other] = codes_to_mask(unseen[start:start + size])
+        start += size
+    return hands
+
+
+def _points_in_play(position):
+    """
+    Returns the points of the cards not taken yet, including the current
+    trick.
+
+    Args:
+        position (Position): The position.
+
+    Returns:
+        int: The points.
+    """
+    return sum(position.card_points[code]
+               for code in mask_to_codes(position.deck & ~position.played))
+
+
+class _Node:
+    """
+    A node of the search tree
+    """
+
+    __slots__ = ('move', 'parent', 'team', 'children', 'visits', 'total',
+                 'available')
+
+    def __init__(self, move=None, parent=None, team=None):
+        self.move = move
+        self.parent = parent
+        self.team = team
+        self.children = {}
+        self.visits = 0
+        self.total = 0.0
+        self.available = 1
+
+
+def search_tree(position, iterations=None, time_limit=None, seed=None,
+                exploration=0.7):
+    """
+    Grows one search tree from a position.
+
+    Args:
+        position (Position): The position to search.
+        iterations (int, optional): The number of iterations.
+        time_limit (float, optional): The most seconds to search.
+        seed (int, optional): The seed of the search.
+        exploration (float, optional): The UCB1 exploration constant.
+
+    Returns:
+        tuple: The (visits, total share of the points) of each root move,
+               keyed by card code, and the number of playouts.
+    """
+    rng = random.Random(seed)
+    follow, ruff = position.follow
+    ranks, card_points = position.ranks, position.card_points
+    # Rewards are shares of the points still in play, between 0 and 1
+    scale = 1 / max(_points_in_play(position), 1)
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    root = _Node()
+    playouts = 0
+
+    while iterations is None or playouts < iterations:
+        if deadline is not None and playouts % _CLOCK_INTERVAL == 0 and \
+                time.perf_counter() >= deadline and playouts:
+            break
+        hands = _deal(position, rng)
+        trick = list(position.trick)
+        leader = position.leader
+        taken = [0, 0]
+        node = root
+        expanding = True
+
+        while hands[leader] or trick:
+            seat = (leader + len(trick)) % PLAYERS
+            mask = hands[seat]
+            if trick:
+                held = mask & follow[trick[0]]
+                if held:
+                    mask = held | mask & ruff[trick[0]]
+            moves = mask_to_codes(mask)
+
+            if expanding:
+                untried = [code for code in moves if code not in node.children]
+                for code in moves:
+                    child = node.children.get(code)
+                    if child is not None:
+                        child.available += 1
+                if untried:
+                    code = rng.choice(untried)
+                    node.children[code] = node = _Node(code, node, seat % 2)
+                    expanding = False
+                else:
+                    node = max((node.children[code] for code in moves),
+                               key=lambda child: child.total / child.visits +
+                               exploration * math.sqrt(math.log(child.available) /
+                                                       child.visits))
+                    code = node.move
+            else:
+                code = rng.choice(moves)
+
+            hands[seat] &= ~(1 << code)
+            trick.append(code)
+            if len(trick) == PLAYERS:
+                best = max(trick, key=ranks.__getitem__)
+                leader = (leader + trick.index(best)) % PLAYERS
+                taken[leader % 2] += sum(card_points[card] for card in trick)
+                trick = []
+
+        playouts += 1
+        while node is not root:
+            node.visits += 1
+            node.total += taken[node.team] * scale
+            node = node.parent
+
+    stats = {code: (child.visits, child.total)
+             for code, child in root.children.items()}
+    return stats, playouts
+
+
+def _search_tree(arguments):
+    """
+    Calls search_tree() with a tuple of arguments, for a process pool.
+    """
+    return search_tree(*arguments)
+
+
+def search(position, iterations=None, time_limit=None, workers=1, seed=None,
+           exploration=0.7, pool=None):
+    """
+    Searches a position with root parallelism and picks the most visited
+    move.
+
+    Args:
+        position (Position): The position to search.
+        iterations (int, optional): The number of iterations, shared among
+                   the workers.
+        time_limit (float, optional): The most seconds to search.
+        workers (int, optional): The number of worker processes, each with
+                its own tree; None uses every core and 1 runs in this
+                process.
+        seed (int, optional): The seed of the search.
+        exploration (float, optional): The UCB1 exploration constant.
+        pool (ProcessPoolExecutor, optional): The pool to run the workers
+             on, kept open by the caller between searches; None starts one
+             for this search.
+
+    Returns:
+        SearchResult: The move and the statistics of every root move.
+    """
+    if iterations is None and time_limit is None:
+        raise ValueError("A search needs an iteration or a time budget")
+    if iterations is not None and iterations < 1:
+        raise ValueError(f"Invalid number of iterations: {iterations}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if iterations is not None:
+        workers = min(workers, iterations)
+    seeds = [int(sequence.generate_state(1)[0]) for sequence in
+             np.random.SeedSequence(seed).spawn(workers)]
+    arguments = [(position,
+                  None if iterations is None else
+                  iterations // workers + (number < iterations % workers),
+                  time_limit, tree_seed, exploration)
+                 for number, tree_seed in enumerate(seeds)]
+
+    start = time.perf_counter()
+    if workers == 1:
+        trees = [search_tree(*arguments[0])]
+    elif pool is not None:
+        trees = list(pool.map(_search_tree, arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            trees = list(executor.map(_search_tree, arguments))
+    seconds = time.perf_counter() - start
+
+    visits, totals = {}, {}
+    for stats, _ in trees:
+        for code, (count, total) in stats.items():
+            visits[code] = visits.get(code, 0) + count
+            totals[code] = totals.get(code, 0.0) + total
+    in_play = _points_in_play(position)
+    values = {code: totals[code] / count * in_play
+              for code, count in visits.items()}
+    playouts = sum(count for _, count in trees)
+    move = max(visits, key=lambda code: (visits[code], values[code]))
+    return SearchResult(move, visits, values, playouts, seconds,
+                        playouts / seconds if seconds > 0 else 0.0)
+
+
+# Besides its budget, the bot keeps its pool, the lock that guards the pool
+# and the evaluation of the hand being bid on
+class IsmctsBot(Bot):  # pylint: disable=too-many-instance-attributes
+    """
+    A bot that bids, names trump and plays by ISMCTS; close it, or use it
+    in a with statement, to stop its worker processes
+    """
+
+    def __init__(self, iterations=None, time_limit=None, workers=1,
+                 seed=None, pool=None):
+        """
+        Initializes an IsmctsBot object.  The budget is for each decision;
+        a bid shares it among the four suits.
+
+        Args:
+            iterations (int, optional): The iterations per decision; 1000
+                       when neither budget is given.
+            time_limit (float, optional): The most seconds per decision.
+            workers (int, optional): The number of worker processes; None
+                    uses every core.
+            seed (int, optional): The seed of the bot's searches.
+            pool (ProcessPoolExecutor, optional): A pool shared with other
+                 bots, which close() leaves open; None starts the bot's own
+                 pool on its first parallel search.
+        """
+        if iterations is None and time_limit is None:
+            iterations = 1000
+        self.iterations = iterations
+        self.time_limit = time_limit
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.workers = workers
+        self.rng = random.Random(seed)
+        # The most recent searches
+        self.results = deque(maxlen=RESULTS_KEPT)
+        # The evaluation of the hand being bid on, as ((table, seat), value)
+        self._evaluation = None
+        self._shared_pool = pool
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """
+        Returns the bot for a with statement.
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Closes the bot at the end of a with statement.
+        """
+        self.close()
+
+    def close(self):
+        """
+        Shuts down the bot's own process pool, if it has started one.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def _search(self, position, share=1):
+        """
+        Searches a position with a share of the budget, off the event loop.
+        """
+        iterations = None if self.iterations is None else \
+            max(1, self.iterations // share)
+        time_limit = None if self.time_limit is None else \
+            self.time_limit / share
+        with self._lock:
+            pool = self._shared_pool
+            if pool is None and self.workers > 1:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(max_workers=self.workers)
+                pool = self._pool
+            seed = self.rng.getrandbits(64)
+        result = search(position, iterations, time_limit, self.workers, seed,
+                        pool=pool)
+        self.results.append(result)
+        return result
+
+    async def _evaluate(self, view):
+        """
+        Returns the best trump suit for the bot's hand and the points its
+        team is expected to take with it, leading the first trick.
+        """
+        key = (view.table, view.seat)
+        if self._evaluation is None or self._evaluation[0] != key:
+            values = {}
+            for suit in SUITS:
+                result = await asyncio.to_thread(
+                    self._search, position_from_view(view, suit), len(SUITS))
+                values[suit] = result.values[result.move]
+            self._evaluation = (key, max(values.items(),
+                                         key=lambda item: item[1]))
+        return self._evaluation[1]
+
+    async def bid(self, view):
+        _, points = await self._evaluate(view)
+        high = max(view.bids, default=PASS)
+        bid = int(points)
+        return bid if bid >= MIN_BID and bid > high else PASS
+
+    async def choose_trump(self, view):
+        suit, _ = await self._evaluate(view)
+        self._evaluation = None
+        return suit
+
+    async def play(self, view):
+        if len(view.legal) == 1:
+            return view.legal[0]
+        result = await asyncio.to_thread(self._search,
+                                         position_from_view(view))
+        return card_codes.from_code(result.move)
+
+    def playouts_per_second(self):
+        """
+        Returns the playout rate of the bot's last RESULTS_KEPT searches.
+
+        Returns:
+            float: Playouts per second.
+        """
+        seconds = sum(result.seconds for result in self.results)
+        playouts = sum(result.playouts for result in self.results)
+        return playouts / seconds if seconds > 0 else 0.0
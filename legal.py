@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+"""
+Legal Module
+
+This module works out which cards of a hand may be played to a trick.
+
+A player leading a trick may play any card.  Otherwise the led card decides
+the suit to follow: when it is trump, a player holding trump must play trump;
+when it is not, a player holding the led suit must play that suit or a trump.
+A player who cannot follow may play any card.  Trump cards, including the
+off jack and the jokers, belong to the trump suit and not to their own suit,
+following Card.get_trump_symbol(), so the Jack of Clubs does not follow a
+Clubs lead when Spades are trump.
+
+The cards that follow each (led suit, trump suit) pair are precomputed as
+masks (see hand.Hand) from the trump tables of a Ruleset (the standard rules
+by default), so a legal move is found with two mask operations instead of
+is_trump() calls and suit comparisons.  Which cards are trump is fixed by the
+rules up to whether the deck has jokers, so the masks are compiled at most
+twice, the first time each kind of deck is used.
+
+Classes:
+    FollowMasks: The follow and ruff masks of one trump suit.
+
+Functions:
+    effective_suit: Returns the suit a card belongs to for a trump suit.
+    follow_masks: Returns the follow and ruff masks of a trump suit.
+    legal_mask: Returns the legal plays of a hand mask.
+    legal_moves: Returns the legal plays of a hand, a mask or card codes.
+    legal_masks: Returns the legal plays of a batch of hand masks.
+    legal_codes: Flags the legal plays of a batch of hands of card codes.
+    legal_moves_by_card: Returns the legal plays of Cards (reference).
+
+Constants:
+    LED_SUITS: The suits a trick can be led in without trump.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from card import Card, DECK, SUITS
+import card_codes
+from hand import Hand
+from rules import STANDARD
+
+LED_SUITS = (*SUITS, 'Joker')
+
+FollowMasks = namedtuple('FollowMasks', ['follow', 'ruff'])
+
+
+def effective_suit(card, trump, ruleset=None):
+    """
+    Returns the suit a card belongs to when following suit.
+
+    Args:
+        card (Card): The card.
+        trump (str): The trump suit, or None for no trump.
+        ruleset (Ruleset, optional): The rules to apply.
+
+    Returns:
+        str: The trump suit for a trump card, otherwise the card's own suit.
+    """
+    return trump if card.is_trump(trump, ruleset) else card.suit
+
+
+def _compile(ruleset):
+    """
+    Builds the follow and ruff masks of a ruleset for every trump suit.
+
+    Args:
+        ruleset (Ruleset): The rules to apply.
+
+    Returns:
+        tuple: The follow and ruff masks as lists indexed by [trump index]
+               [led code], NO_PLAY last, and the same masks as uint64 arrays.
+    """
+    follow, ruff = [], []
+    for index, trump in enumerate(card_codes.TRUMP_SUITS):
+        is_trump = ruleset.tables.is_trump[index, :len(DECK)].tolist()
+        suits = [trump if flag else card.suit
+                 for card, flag in zip(DECK, is_trump)]
+        by_suit = {suit: Hand.from_codes(code for code, other in
+                                         enumerate(suits) if other == suit).mask
+                   for suit in LED_SUITS}
+        trumps = Hand.from_codes(code for code, flag in enumerate(is_trump)
+                                 if flag).mask
+        # The cards that follow the led card, and the trump cards that may
+        # be played instead
+        follow.append([by_suit[suit] for suit in suits] + [0])
+        ruff.append([0 if flag else trumps for flag in is_trump] + [0])
+    return (follow, ruff, np.array(follow, dtype=np.uint64),
+            np.array(ruff, dtype=np.uint64))
+
+
+# Compiled masks keyed by whether the deck has jokers; the ranks and points
+# of a ruleset do not change which cards follow suit
+_TABLES = {STANDARD.jokers: _compile(STANDARD)}
+
+
+def _tables(ruleset):
+    """
+    Returns the compiled follow and ruff masks of a ruleset.
+
+    Args:
+        ruleset (Ruleset): The rules to apply.
+
+    Returns:
+        tuple: The masks, see _compile().
+    """
+    tables = _TABLES.get(ruleset.jokers)
+    if tables is None:
+        tables = _TABLES[ruleset.jokers] = _compile(ruleset)
+    return tables
+
+
+def follow_masks(trump, ruleset=STANDARD):
+    """
+    Returns the follow and ruff masks of a trump suit, for callers that find
+    legal plays one mask at a time.  A hand holding cards of
+    follow[led code] must play one of them or one of ruff[led code];
+    otherwise it may play any card.  NO_PLAY has empty masks.
+
+    Args:
+        trump (str): The trump suit, or None for no trump.
+        ruleset (Ruleset, optional): The rules to apply.
+
+    Returns:
+        FollowMasks: The follow and ruff masks, lists indexed by led code.
+    """
+    follow, ruff, _, _ = _tables(ruleset)
+    index = card_codes.trump_index(trump)
+    return FollowMasks(follow[index], ruff[index])
+
+
+def _led_code(led):
+    """
+    Returns the code of a led card.
+
+    Args:
+        led (Card, int or None): The led card, its code, or None (or
+            card_codes.NO_PLAY) when the player is leading.
+
+    Returns:
+        int: The code of the led card, or card_codes.NO_PLAY.
+    """
+    if led is None:
+        return card_codes.NO_PLAY
+    if isinstance(led, Card):
+        return card_codes.to_code(led)
+    if not 0 <= led <= card_codes.NO_PLAY:
+        raise ValueError(f"Invalid card code: {led}")
+    return int(led)
+
+
+def legal_mask(mask, led, trump, ruleset=STANDARD):
+    """
+    Returns the cards of a hand that may be played to a trick.
+
+    Args:
+        mask (int): The mask of the hand.
+        led (Card, int or None): The led card or its code; None when the
+            player is leading.
+        trump (str): The trump suit, or None for no trump.
+        ruleset (Ruleset, optional): The rules to apply.
+
+    Returns:
+        int: The mask of the legal plays.
+    """
+    follow, ruff, _, _ = _tables(ruleset)
+    index = card_codes.trump_index(trump)
+    code = _led_code(led)
+    held = mask & follow[index][code]
+    if not held:
+        return mask
+    return held | mask & ruff[index][code]
+
+
+def legal_moves(hand, led, trump, ruleset=STANDARD):
+    """
+    Returns the cards of a hand that may be played to a trick.
+
+    Args:
+        hand (Hand, int or iterable): The hand, as a Hand, a mask or card
+             codes.
+        led (Card, int or None): The led card or its code; None when the
+            player is leading.
+        trump (str): The trump suit, or None for no trump.
+        ruleset (Ruleset, optional): The rules to apply.
+
+    Returns:
+        Hand, int or list: The legal plays, as a Hand, a mask or a list of
+                           codes in hand order, matching the hand given.
+    """
+    if isinstance(hand, Hand):
+        return Hand.from_mask(legal_mask(hand.mask, led, trump, ruleset))
+    if isinstance(hand, int):
+        return legal_mask(hand, led, trump, ruleset)
+    codes = [int(code) for code in hand]
+    legal = legal_mask(Hand.from_codes(codes).mask, led, trump, ruleset)
+    return [code for code in codes if legal >> code & 1]
+
+
+def legal_masks(masks, leds, trumps, ruleset=STANDARD):
+    """
+    Returns the legal plays of a batch of hands.
+
+    Args:
+        masks (array_like): The masks of the hands, shape (n,).
+        leds (array_like): The code of the card led to each hand, with
+             card_codes.NO_PLAY for a player who is leading.
+        trumps (str, int or array_like): The trump suit, or one trump suit
+               or trump index per hand.
+        ruleset (Ruleset, optional): The rules to apply.
+
+    Returns:
+        ndarray: The masks of the legal plays, as uint64.
+    """
+    masks = np.asarray(masks, dtype=np.uint64)
+    leds = np.asarray(leds, dtype=np.intp)
+    if leds.size and (leds.min() < 0 or leds.max() > card_codes.NO_PLAY):
+        raise ValueError("Invalid card code in led cards")
+    indexes = card_codes.trump_indexes(trumps)
+    _, _, follow, ruff = _tables(ruleset)
+
+    held = masks & follow[indexes, leds]
+    return np.where(held != 0, held | masks & ruff[indexes, leds], masks)
+
+
+def legal_codes(codes, leds, trumps, ruleset=STANDARD):
+    """
+    Flags the legal plays of a batch of hands given as card codes.
+
+    Args:
+        codes (array_like): The card codes of the hands, shape (n, cards),
+              with card_codes.NO_PLAY for cards already played.
+        leds (array_like): The code of the card led to each hand, with
+             card_codes.NO_PLAY for a player who is leading.
+        trumps (str, int or array_like): The trump suit, or one trump suit
+               or trump index per hand.
+        ruleset (Ruleset, optional): The rules to apply.
+
+    Returns:
+        ndarray: A bool array shaped like codes, True for the legal plays.
+    """
+    codes = np.asarray(codes, dtype=np.intp)
+    if codes.ndim != 2:
+        raise ValueError(f"Hands must be a 2-D array, not {codes.ndim}-D")
+    if codes.size and (codes.min() < 0 or codes.max() > card_codes.NO_PLAY):
+        raise ValueError("Invalid card code in hands")
+
+    # NO_PLAY is not a card, so it sets no bit and is never legal
+    bits = np.where(codes == card_codes.NO_PLAY, np.uint64(0),
+                    np.uint64(1) << codes.astype(np.uint64))
+    masks = np.bitwise_or.reduce(bits, axis=1)
+    legal = legal_masks(masks, leds, trumps, ruleset)
+    return (legal[:, np.newaxis] & bits) != 0
+
+
+def legal_moves_by_card(cards, led, trump, ruleset=None):
+    """
+    Returns the legal plays of a hand of Cards with is_trump() and suit
+    comparisons.  This is the reference for legal_mask().
+
+    Args:
+        cards (list): The cards of the hand.
+        led (Card): The led card, or None when the player is leading.
+        trump (str): The trump suit, or None for no trump.
+        ruleset (Ruleset, optional): The rules to apply.
+
+    Returns:
+        list: The cards that may be played, in hand order.
+    """
+    if led is None:
+        return list(cards)
+    if led.is_trump(trump, ruleset):
+        follow = [card for card in cards if card.is_trump(trump, ruleset)]
+        return follow or list(cards)
+    if any(card.is_nontrump(trump, ruleset) and card.suit == led.suit
+           for card in cards):
+        return [card for card in cards if card.is_trump(trump, ruleset) or
+                card.suit == led.suit]
+    return list(cards)
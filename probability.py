@@ -0,0 +1,329 @@
+#!/usr/bin/env python
+"""
+Probability Module
+
+This module answers questions about the cards a player cannot see exactly,
+by counting instead of dealing: "with this hand and Spades as trump, what is
+the probability that the opponents hold the Ace, the 3 or both jokers?", "who
+holds the high trump?", "how are the other trumps split?".
+
+Every deal of the unseen cards around a known hand is equally likely, so the
+chance that a set of k unseen cards all lie in places holding g of the n
+unseen cards is the hypergeometric ratio g(g-1)...(g-k+1) / n(n-1)...(n-k+1),
+and a split of the unseen trumps is counted as a product of binomials.  The
+ratios and the split counts are memoized, so they are computed once for each
+shape of deal and shared by every hand and trump suit with that shape.
+
+The cards go to places: place 0 is the player whose hand is known, places 1
+to hands are the other seats in play order (with four players, 2 is the
+partner and 1 and 3 are the opponents), and the last place holds the cards
+that are not dealt.  Trump status, ranks and points come from the lookup
+tables of a ruleset (see rules.Ruleset), which follow Card.is_trump(),
+Card.get_trump_symbol() and Card.card_reference.  Probabilities are exact
+Fractions.
+
+    unseen = Unseen(hand, 'Spades')
+    unseen.probability(['A♠', '3♠', ('BJ', 'LJ')], OPPONENTS)
+
+Classes:
+    Unseen: Exact probabilities of where the unseen cards are.
+
+Constants:
+    PARTNER: The partner's place at a table of four.
+    OPPONENTS: The opponents' places at a table of four.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+from fractions import Fraction
+from functools import lru_cache
+from itertools import combinations
+from math import comb, perm
+
+from card import Card, DECK
+import card_codes
+from hand import Hand
+from rules import STANDARD
+
+PARTNER = 2
+OPPONENTS = (1, 3)
+
+
+@lru_cache(maxsize=None)
+def _all_in(inside, unseen, count):
+    """
+    Returns the probability that given unseen cards are all in some places.
+
+    Args:
+        inside (int): The number of unseen cards the places hold.
+        unseen (int): The number of unseen cards.
+        count (int): The number of given cards.
+
+    Returns:
+        Fraction: The probability.
+    """
+    return Fraction(perm(inside, count), perm(unseen, count))
+
+
+@lru_cache(maxsize=None)
+def _split_counts(trumps, sizes, rest):
+    """
+    Counts the ways each split of unseen trumps over hands can be dealt.
+
+    Args:
+        trumps (int): The number of unseen trumps.
+        sizes (tuple): The number of unseen cards each hand holds.
+        rest (int): The number of unseen cards that are not dealt.
+
+    Returns:
+        dict: The number of ways, keyed by the tuple of the trump counts of
+              the hands; the trumps left over are not dealt.
+    """
+    if not sizes:
+        return {(): comb(rest, trumps)} if trumps <= rest else {}
+    counts = {}
+    for count in range(min(trumps, sizes[0]) + 1):
+        ways = comb(sizes[0], count)
+        for split, more in _split_counts(trumps - count, sizes[1:],
+                                         rest).items():
+            counts[(count, *split)] = ways * more
+    return counts
+
+
+def _code(card):
+    """
+    Returns the code of a card.
+
+    Args:
+        card (Card, str or int): The card, its short name or its code.
+
+    Returns:
+        int: The code of the card.
+
+    Raises:
+        ValueError: If the card is not one of the 54 deck cards.
+    """
+    if isinstance(card, Card):
+        return card_codes.to_code(card)
+    if isinstance(card, str):
+        if card not in card_codes.CODES:
+            raise ValueError(f"Invalid card: {card}")
+        return card_codes.CODES[card]
+    if not 0 <= card < len(DECK):
+        raise ValueError(f"Invalid card code: {card}")
+    return int(card)
+
+
+class Unseen:
+    """
+    A class to work out exact probabilities of where the unseen cards are
+    """
+
+    def __init__(self, hand, trump, seen=(), hands=3, cards=6,
+                 ruleset=STANDARD):
+        """
+        Initializes an Unseen object.
+
+        Args:
+            hand (Hand or iterable): The known hand, as a Hand or as Cards,
+                 short names or codes.
+            trump (str): The trump suit, or None for no trump.
+            seen (iterable, optional): Other cards known to be out of play.
+            hands (int, optional): The number of other hands dealt.
+            cards (int, optional): The number of cards in each other hand.
+            ruleset (Ruleset, optional): The rules to classify cards by.
+
+        Raises:
+            ValueError: If the unseen cards cannot fill the other hands.
+        """
+        codes = hand.codes() if isinstance(hand, Hand) else \
+            [_code(card) for card in hand]
+        self.trump = trump
+        self.hand = frozenset(codes)
+        self.seen = frozenset(_code(card) for card in seen) - self.hand
+        self.tables = ruleset.lists(trump)
+        in_deck = {card_codes.CODES[card.short_name] for card in ruleset.deck}
+        self.unseen = tuple(sorted(in_deck - self.hand - self.seen))
+        if hands * cards > len(self.unseen):
+            raise ValueError(f"Cannot deal {hands} hands of {cards} cards "
+                             f"from {len(self.unseen)} cards")
+        # The number of unseen cards in each place
+        self.sizes = (0,) + (cards,) * hands + \
+            (len(self.unseen) - hands * cards,)
+        self.undealt = hands + 1
+
+    def _places(self, places):
+        """
+        Returns places as a tuple.
+
+        Args:
+            places (int or iterable): A place or places.
+
+        Returns:
+            tuple: The places.
+        """
+        places = (places,) if isinstance(places, int) else tuple(places)
+        for place in places:
+            if not 0 <= place < len(self.sizes):
+                raise ValueError(f"Invalid place: {place}")
+        return places
+
+    def owners(self, card):
+        """
+        Returns the probability of each place holding a card.
+
+        Args:
+            card (Card, str or int): The card, its short name or its code.
+
+        Returns:
+            tuple: The probability of each place, as Fractions.
+
+        Raises:
+            ValueError: If the card is known to be out of play.
+        """
+        code = _code(card)
+        if code in self.hand:
+            return (Fraction(1),) + (Fraction(0),) * (len(self.sizes) - 1)
+        if code not in self.unseen:
+            raise ValueError(f"{DECK[code].short_name} is out of play")
+        return tuple(Fraction(size, len(self.unseen)) for size in self.sizes)
+
+    def probability(self, groups, places):
+        """
+        Returns the probability that some places hold every card of at least
+        one group of cards.
+
+        Args:
+            groups (iterable): The groups; each is a card, or an iterable of
+                   cards that must all be held (Cards, short names or codes).
+            places (int or iterable): The places that must hold them, e.g.
+                   OPPONENTS.
+
+        Returns:
+            Fraction: The probability.
+        """
+        places = self._places(places)
+        inside = sum(self.sizes[place] for place in set(places))
+        wanted = []
+        for group in groups:
+            codes = {_code(card) for card in
+                     ((group,) if isinstance(group, (Card, str, int))
+                      else group)}
+            if codes & self.seen or (codes & self.hand and 0 not in places):
+                continue
+            codes -= self.hand
+            if not codes:
+                return Fraction(1)
+            wanted.append(frozenset(codes))
+
+        # Inclusion-exclusion over the groups
+        total = Fraction(0)
+        for count in range(1, len(wanted) + 1):
+            for chosen in combinations(wanted, count):
+                union = len(frozenset().union(*chosen))
+                term = _all_in(inside, len(self.unseen), union)
+                total += term if count % 2 else -term
+        return total
+
+    def point_cards(self):
+        """
+        Returns the probability of each place holding each card that scores
+        points for the trump suit.
+
+        Returns:
+            dict: The probabilities of each place, as returned by owners(),
+                  keyed by card code, for the cards in play.
+        """
+        return {code: self.owners(code)
+                for code in sorted(self.hand | set(self.unseen))
+                if self.tables.points[code]}
+
+    def _extreme(self, highest):
+        """
+        Returns the probability of each place holding the highest or lowest
+        trump that is dealt.
+
+        Args:
+            highest (bool): True for the highest trump, False for the lowest.
+
+        Returns:
+            tuple: The probability of each place, as Fractions; the last
+                   place is the chance that no trump is dealt.
+        """
+        ranks, is_trump = self.tables.rank, self.tables.is_trump
+        trumps = sorted((code for code in self.hand | set(self.unseen)
+                         if is_trump[code]),
+                        key=ranks.__getitem__, reverse=highest)
+        result = [Fraction(0)] * len(self.sizes)
+        unseen = len(self.unseen)
+        undealt = self.sizes[-1]
+        passed = 0
+        for code in trumps:
+            # Every trump before this one is not dealt
+            before = _all_in(undealt, unseen, passed)
+            if code in self.hand:
+                result[0] += before
+                return tuple(result)
+            for place in range(1, self.undealt):
+                result[place] += before * \
+                    Fraction(self.sizes[place], unseen - passed)
+            passed += 1
+        result[-1] += _all_in(undealt, unseen, passed)
+        return tuple(result)
+
+    def high(self):
+        """
+        Returns the probability of each place holding the high trump, the
+        highest trump that is dealt.
+
+        Returns:
+            tuple: The probability of each place, as Fractions; the last
+                   place is the chance that no trump is dealt.
+        """
+        return self._extreme(True)
+
+    def low(self):
+        """
+        Returns the probability of each place holding the low trump, the
+        lowest trump that is dealt.
+
+        Returns:
+            tuple: The probability of each place, as Fractions; the last
+                   place is the chance that no trump is dealt.
+        """
+        return self._extreme(False)
+
+    def trump_split(self):
+        """
+        Returns the probability of each split of the unseen trumps over the
+        other hands.
+
+        Returns:
+            dict: The probability of each split, keyed by the tuple of the
+                  trump counts of places 1 to hands.
+        """
+        trumps = sum(1 for code in self.unseen if self.tables.is_trump[code])
+        deals = comb(len(self.unseen), trumps)
+        counts = _split_counts(trumps, self.sizes[1:-1], self.sizes[-1])
+        return {split: Fraction(ways, deals) for split, ways in counts.items()}
+
+    def trump_length(self, places):
+        """
+        Returns the probability of each number of unseen trumps held by some
+        places together.
+
+        Args:
+            places (int or iterable): A place or places, e.g. OPPONENTS.
+
+        Returns:
+            dict: The probability of each trump count.
+        """
+        places = self._places(places)
+        inside = sum(self.sizes[place] for place in set(places))
+        unseen = len(self.unseen)
+        trumps = sum(1 for code in self.unseen if self.tables.is_trump[code])
+        deals = comb(unseen, trumps)
+        return {count: Fraction(comb(inside, count) *
+                                comb(unseen - inside, trumps - count), deals)
+                for count in range(min(trumps, inside) + 1)
+                if trumps - count <= unseen - inside}
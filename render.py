@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+"""
+Render Module
+
+This module formats hands, tricks and scores for high-volume logs.  A
+Formatter appends the lines of many hands to one buffer and writes the
+buffer with a single write() call, instead of printing card by card.  The
+text of every card comes from Card.text_table and its description for each
+trump suit from Card.desc_table, which are both filled in at import, so no
+card is formatted twice.
+
+A Formatter writes readable lines by default:
+
+    Seat 0 (Spades):  A♠  J♣ 10♦  3♠
+    Trick 1 (lead 0):  A♠  K♠  2♣  9♠ -> seat 0
+    Score 4-1 high A♠ low 3♠
+
+A seat that has not played (card_codes.NO_PLAY, None or the '_' no play
+card) is written as '--' in readable and compact lines alike, and parse()
+reads it back as None.
+
+With compact=True it writes one record per line in a form that parse()
+reads back, with the cards as their short names separated by commas and '-'
+for no value:
+
+    H 0 Spades A♠,J♣,10♦,3♠
+    T 1 0 0 A♠,K♠,2♣,9♠
+    S 4 1 A♠ 0 3♠ 0
+
+Classes:
+    HandLine: A hand read back from a compact line.
+    TrickLine: A trick read back from a compact line.
+    ScoreLine: A score read back from a compact line.
+    Formatter: Renders hands, tricks and scores into one buffer.
+
+Functions:
+    parse: Reads compact lines back into hands, tricks and scores.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+from collections import namedtuple
+
+from card import Card, DECK
+import card_codes
+from game_log import parse_card
+from hand import Hand
+
+HandLine = namedtuple('HandLine', ['seat', 'trump', 'cards'])
+TrickLine = namedtuple('TrickLine', ['number', 'leader', 'winner', 'cards'])
+ScoreLine = namedtuple('ScoreLine', ['points', 'high', 'high_team', 'low',
+                                     'low_team'])
+
+# What lines write for a seat that has not played, and for no value
+_NO_PLAY = '--'
+_NONE = '-'
+
+# Text, short name and description of every card code, for each trump suit,
+# NO_PLAY last
+_TEXTS = (*(Card.text_table[card.short_name] for card in DECK),
+          f"{_NO_PLAY:>3}")
+_NAMES = (*(card.short_name for card in DECK), _NO_PLAY)
+_DESCS = {trump: (*(f"{Card.text_table[card.short_name]} "
+                    f"({Card.desc_table[card.short_name][trump]})"
+                    for card in DECK),
+                  f"{_NO_PLAY:>3} ({Card.card_reference['_']['desc']})")
+          for trump in card_codes.TRUMP_SUITS}
+
+
+def _codes(cards):
+    """
+    Returns the codes of cards.
+
+    Args:
+        cards (Hand or iterable): A Hand, or Cards or card codes, with
+              card_codes.NO_PLAY, None or the '_' card for no play.
+
+    Returns:
+        list: The card codes.
+
+    Raises:
+        ValueError: If a card is not in the deck or a code is invalid.
+    """
+    if isinstance(cards, Hand):
+        return cards.codes()
+    codes = []
+    for card in cards:
+        if card is None or isinstance(card, Card) and card.symbol == '_':
+            code = card_codes.NO_PLAY
+        elif isinstance(card, Card):
+            code = card_codes.to_code(card)
+        elif 0 <= card <= card_codes.NO_PLAY:
+            code = int(card)
+        else:
+            raise ValueError(f"Invalid card code: {card}")
+        codes.append(code)
+    return codes
+
+
+def _names(codes):
+    """
+    Returns the compact text of cards: their short names separated by commas.
+    """
+    return ','.join(map(_NAMES.__getitem__, codes)) or _NONE
+
+
+def _field(value):
+    """
+    Returns the compact text of a value that may be None.
+    """
+    return _NONE if value is None else str(value)
+
+
+def _value(text, kind=str):
+    """
+    Returns the value of compact text that may stand for None.
+    """
+    return None if text == _NONE else kind(text)
+
+
+class Formatter:
+    """
+    A class to render hands, tricks and scores into one buffer
+    """
+
+    def __init__(self, compact=False):
+        """
+        Initializes a Formatter object.
+
+        Args:
+            compact (bool, optional): True to write compact lines that
+                    parse() reads back, False for readable lines.
+        """
+        self.compact = compact
+        self._parts = []
+
+    def hand(self, cards, seat=0, trump=None, descs=False):
+        """
+        Renders a hand.
+
+        Args:
+            cards (Hand or iterable): The cards, as a Hand, Cards or codes.
+            seat (int, optional): The seat that holds the hand.
+            trump (str, optional): The trump suit, or None for no trump.
+            descs (bool, optional): True to add the description of each card
+                  for the trump suit to readable lines.
+        """
+        card_codes.trump_index(trump)
+        codes = _codes(cards)
+        if self.compact:
+            self._parts.append(f"H {seat} {_field(trump)} {_names(codes)}\n")
+            return
+        texts = _DESCS[trump] if descs else _TEXTS
+        suffix = '' if trump is None else f" ({trump})"
+        self._parts.append(f"Seat {seat}{suffix}: "
+                           f"{' '.join(map(texts.__getitem__, codes))}\n")
+
+    def trick(self, cards, number, leader=0, winner=None):
+        """
+        Renders a trick.
+
+        Args:
+            cards (iterable): The cards in the order played, as Cards or
+                  codes, with card_codes.NO_PLAY or None for a seat that
+                  has not played.
+            number (int): The number of the trick in the hand.
+            leader (int, optional): The seat that led the trick.
+            winner (int, optional): The seat that took the trick, if known.
+        """
+        codes = _codes(cards)
+        if self.compact:
+            self._parts.append(f"T {number} {leader} {_field(winner)} "
+                               f"{_names(codes)}\n")
+            return
+        taken = '' if winner is None else f" -> seat {winner}"
+        self._parts.append(f"Trick {number} (lead {leader}): "
+                           f"{' '.join(map(_TEXTS.__getitem__, codes))}"
+                           f"{taken}\n")
+
+    def score(self, state):
+        """
+        Renders a score.
+
+        Args:
+            state (ScoreState): The score, e.g. ScoreTracker.state.
+        """
+        high = None if state.high is None else _NAMES[state.high]
+        low = None if state.low is None else _NAMES[state.low]
+        if self.compact:
+            self._parts.append(
+                f"S {state.points[0]} {state.points[1]} {_field(high)} "
+                f"{_field(state.high_team)} {_field(low)} "
+                f"{_field(state.low_team)}\n")
+            return
+        self._parts.append(f"Score {state.points[0]}-{state.points[1]} "
+                           f"high {_field(high)} low {_field(low)}\n")
+
+    def line(self, text):
+        """
+        Adds a line of text as it is.
+
+        Args:
+            text (str): The text, without a line break.
+        """
+        self._parts.append(f"{text}\n")
+
+    def getvalue(self):
+        """
+        Returns the text rendered so far.
+
+        Returns:
+            str: The text of the buffer.
+        """
+        return ''.join(self._parts)
+
+    def write(self, file):
+        """
+        Writes the buffer to a file with one write() call and clears it.
+
+        Args:
+            file (file object): The file or stream to write to.
+        """
+        file.write(self.getvalue())
+        self.clear()
+
+    def clear(self):
+        """
+        Empties the buffer.
+        """
+        self._parts = []
+
+
+def _cards(text):
+    """
+    Returns the interned cards of compact card text, with None for no play.
+    """
+    if text == _NONE:
+        return ()
+    return tuple(None if name == _NO_PLAY else parse_card(name)
+                 for name in text.split(','))
+
+
+def parse(text):
+    """
+    Reads compact lines back into hands, tricks and scores.
+
+    Args:
+        text (str or iterable): The text written by a compact Formatter, or
+             its lines.
+
+    Yields:
+        HandLine, TrickLine or ScoreLine: The record of each line, with the
+        cards as interned Cards and None for no play.
+
+    Raises:
+        ValueError: If a line is not a compact record.
+    """
+    lines = text.splitlines() if isinstance(text, str) else text
+    for line in lines:
+        fields = line.split()
+        if not fields:
+            continue
+        kind = fields[0]
+        if kind == 'H' and len(fields) == 4:
+            yield HandLine(int(fields[1]), _value(fields[2]),
+                           _cards(fields[3]))
+        elif kind == 'T' and len(fields) == 5:
+            yield TrickLine(int(fields[1]), int(fields[2]),
+                            _value(fields[3], int), _cards(fields[4]))
+        elif kind == 'S' and len(fields) == 7:
+            yield ScoreLine((int(fields[1]), int(fields[2])),
+                            _value(fields[3], parse_card),
+                            _value(fields[4], int),
+                            _value(fields[5], parse_card),
+                            _value(fields[6], int))
+        else:
+            raise ValueError(f"Invalid compact line: {line!r}")
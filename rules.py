@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+"""
+Rules Module
+
+This module defines the Ruleset class, which holds the rules of one Pitch
+variant.  A variant is given as a reference dict in the form of
+Card.card_reference (the rank, points and description of every card symbol,
+with the full names as aliases), validated once, and compiled into the same
+tables the standard rules use: a trump table and sort keys keyed by short
+name (see Card.trump_table and Card.sort_keys), and flat NumPy lookup arrays
+indexed by [trump index, card code] (see card_codes).
+
+Card methods, HandEvaluator, ScoreTracker, Solver, simulator.play_out(),
+the legal module and the Engine take a ruleset explicitly, so several
+variants can be played in one process without changing Card.card_reference.
+STANDARD holds the rules of Card.card_reference as they were at import.
+trump.TrumpContext, the trump and point masks of hand.Hand and SortedHand,
+and the module tables of card_codes only follow STANDARD.
+
+    no_jokers = Ruleset.variant('no jokers', jokers=False)
+    low_three = Ruleset.variant('3 for 1', points={'3': 1})
+    card.set_trump('Spades', low_three)
+
+Classes:
+    Ruleset: The validated, compiled rules of a Pitch variant.
+
+Constants:
+    SYMBOLS: The card symbols every variant must define.
+    JOKER_SYMBOLS: The symbols of the jokers.
+    STANDARD: The standard rules, from Card.card_reference.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+import copy
+from types import MappingProxyType
+
+import numpy as np
+
+from card import (Card, DECK, SUITS, TrumpEntry, apply_trump_rules,
+                  make_sort_key)
+import card_codes
+
+SYMBOLS = ('A', 'K', 'Q', 'J', 'X', '10', '9', '8', '7', '6', '5', '4', '3',
+           '2', 'N', '_')
+JOKER_SYMBOLS = ('B', 'L')
+
+# The symbols of cards that can be trump, besides the jokers
+_TRUMP_SYMBOLS = SYMBOLS[:-2]
+
+# Ranks and points are stored as int8 in the lookup arrays
+_LIMIT = np.iinfo(np.int8).max
+
+
+def _symbol(reference, key):
+    """
+    Returns the symbol a reference key stands for.
+
+    Args:
+        reference (dict): The reference dict.
+        key (str): A symbol or a full name.
+
+    Returns:
+        str: The symbol.
+    """
+    return Card.base_symbol(reference[key].get('fullname', key))
+
+
+class Ruleset:
+    """
+    A class to hold the validated, compiled rules of a Pitch variant
+    """
+
+    def __init__(self, name, reference, jokers=True):
+        """
+        Initializes a Ruleset object, validating and compiling the reference.
+
+        Args:
+            name (str): The name of the variant.
+            reference (dict): The rank, points and description of every card
+                      symbol and full name, in the form of
+                      Card.card_reference.
+            jokers (bool, optional): Whether the deck has the two jokers.
+
+        Raises:
+            ValueError: If the reference is incomplete or inconsistent.
+        """
+        self.name = name
+        self.jokers = jokers
+        self.reference = MappingProxyType(self._validate(reference, jokers))
+        self.deck = tuple(card for card in DECK
+                          if jokers or card.suit != 'Joker')
+
+        self.trump_table = {}
+        self.sort_keys = {}
+        for place, card in enumerate(DECK):
+            if card.suit == 'Joker' and not jokers:
+                continue
+            entries = {suit: self.trump_entry(card.name, card.suit, suit)
+                       for suit in (None, *SUITS)}
+            self.trump_table[card.short_name] = entries
+            self.sort_keys[card.short_name] = {
+                suit: make_sort_key(entry.rank, entries[None].rank, place)
+                for suit, entry in entries.items()}
+
+        # Entries indexed by [trump index][card code]; cards outside the
+        # deck and NO_PLAY have the '_' (No play) entry
+        no_play = TrumpEntry('_', self.reference['_']['rank'],
+                             self.reference['_']['points'], False)
+        rows = [[self.trump_table.get(card.short_name, {}).get(suit, no_play)
+                 for card in DECK] + [no_play]
+                for suit in card_codes.TRUMP_SUITS]
+        tables = card_codes.TrumpArrays(
+            np.array([[entry.symbol for entry in row] for row in rows]),
+            np.array([[entry.rank for entry in row] for row in rows],
+                     dtype=np.int8),
+            np.array([[entry.points for entry in row] for row in rows],
+                     dtype=np.int8),
+            np.array([[entry.is_trump for entry in row] for row in rows]))
+        for table in tables:
+            table.flags.writeable = False
+        self.tables = tables
+
+    @classmethod
+    def variant(cls, name, ranks=None, points=None, descs=None, jokers=True):
+        """
+        Returns a variant of the standard rules.
+
+        Args:
+            name (str): The name of the variant.
+            ranks (dict, optional): New ranks, keyed by symbol.
+            points (dict, optional): New points, keyed by symbol.
+            descs (dict, optional): New descriptions, keyed by symbol.
+            jokers (bool, optional): Whether the deck has the two jokers.
+
+        Returns:
+            Ruleset: The compiled variant.
+        """
+        reference = copy.deepcopy(dict(STANDARD.reference))
+        for field, changes in (('rank', ranks), ('points', points),
+                               ('desc', descs)):
+            for symbol, value in (changes or {}).items():
+                if symbol not in reference:
+                    raise ValueError(f"Invalid card symbol: {symbol}")
+                # Change the symbol and every full name alias of it
+                for key in reference:
+                    if _symbol(reference, key) == symbol:
+                        reference[key][field] = value
+        return cls(name, reference, jokers)
+
+    @staticmethod
+    def _validate(reference, jokers):
+        """
+        Checks a reference dict and returns a private copy of it.
+
+        Args:
+            reference (dict): The reference dict.
+            jokers (bool): Whether the deck has the two jokers.
+
+        Returns:
+            dict: A deep copy of the reference.
+
+        Raises:
+            ValueError: If the reference is incomplete or inconsistent.
+        """
+        reference = copy.deepcopy(dict(reference))
+        required = SYMBOLS + (JOKER_SYMBOLS if jokers else ())
+        missing = [symbol for symbol in required if symbol not in reference]
+        if missing:
+            raise ValueError(f"Missing card symbols: {', '.join(missing)}")
+
+        for key, entry in reference.items():
+            for field, kind in (('rank', int), ('points', int), ('desc', str)):
+                if not isinstance(entry.get(field), kind) or \
+                        isinstance(entry.get(field), bool):
+                    raise ValueError(f"Invalid {field} for {key}: "
+                                     f"{entry.get(field)!r}")
+            if not 0 <= entry['rank'] <= _LIMIT or \
+                    not 0 <= entry['points'] <= _LIMIT:
+                raise ValueError(f"Rank and points of {key} must be between "
+                                 f"0 and {_LIMIT}")
+            fullname = entry.get('fullname', key)
+            if fullname not in reference:
+                raise ValueError(f"Unknown full name for {key}: {fullname}")
+            symbol = _symbol(reference, key)
+            if symbol not in reference or \
+                    reference[symbol]['rank'] != entry['rank'] or \
+                    reference[symbol]['points'] != entry['points']:
+                raise ValueError(f"{key} does not match its symbol {symbol}")
+
+        for card in DECK:
+            if card.name not in reference and (jokers or
+                                                card.suit != 'Joker'):
+                raise ValueError(f"Missing card name: {card.name}")
+
+        # Every trump must outrank an off-suit card, which must outrank
+        # no play, and trumps must not tie so that high and low are clear
+        trumps = _TRUMP_SYMBOLS + (JOKER_SYMBOLS if jokers else ())
+        ranks = [reference[symbol]['rank'] for symbol in trumps]
+        if len(set(ranks)) != len(ranks):
+            raise ValueError("Trump ranks must all be different")
+        if not min(ranks) > reference['N']['rank'] > reference['_']['rank']:
+            raise ValueError("Ranks must be trump > N (off) > _ (no play)")
+        if reference['N']['points'] or reference['_']['points']:
+            raise ValueError("N (off) and _ (no play) cannot score points")
+        return reference
+
+    def __repr__(self):
+        """
+        Returns a string representation of the ruleset.
+
+        Returns:
+            str: The name of the ruleset.
+        """
+        return f"Ruleset({self.name!r})"
+
+    def __reduce__(self):
+        """
+        Returns how to pickle the ruleset: STANDARD by name, and any other
+        ruleset by its name, reference and jokers, compiled again when it is
+        unpickled.
+
+        Returns:
+            str or tuple: The name of STANDARD, or the class and its
+                          arguments.
+        """
+        if self is STANDARD:
+            return 'STANDARD'
+        return (Ruleset, (self.name, dict(self.reference), self.jokers))
+
+    def trump_entry(self, name, suit, trump_suit):
+        """
+        Applies the trump rules of the ruleset to a card.
+
+        Args:
+            name (str): The name of the card, full or short.
+            suit (str): The suit of the card.
+            trump_suit (str): The trump suit, or None for no trump.
+
+        Returns:
+            TrumpEntry: The symbol, rank, points and trump status of the card.
+
+        Raises:
+            ValueError: If the card is not in the ruleset's deck.
+        """
+        if suit == 'Joker' and not self.jokers:
+            raise ValueError(f"{self.name} is played without jokers")
+        return apply_trump_rules(self.reference, name, suit, trump_suit)
+
+    def lists(self, trump):
+        """
+        Returns the lookup arrays of one trump suit as Python lists, for
+        callers that index them one card at a time.
+
+        Args:
+            trump (str): The trump suit, or None for no trump.
+
+        Returns:
+            TrumpArrays: Lists of the symbol, rank, points and trump status
+                         of each card code.
+        """
+        index = card_codes.trump_index(trump)
+        return card_codes.TrumpArrays(*(table[index].tolist()
+                                        for table in self.tables))
+
+
+STANDARD = Ruleset('standard', Card.card_reference)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+"""
+Score Module
+
+This module defines the ScoreTracker class, which keeps the running score of
+a hand as tricks are taken instead of summing card.points over the captured
+piles once the hand is over.
+
+Each trick updates, in constant time, the points of each team (from the
+points of a Ruleset, the standard Card.card_reference by default), the highest
+and lowest trump seen so far and the team that took each, and which team
+captured the jack, the off jack and the two jokers.  Seats 0 and 2 play for
+team 0 and seats 1 and 3 for team 1.
+
+The whole score is one immutable ScoreState, so undo() only has to pop the
+previous state off a stack, and snapshot()/restore() hand states out and take
+them back for checkpoints.
+
+Classes:
+    ScoreState: The running score of a hand.
+    ScoreTracker: Keeps the running score of a hand for one trump suit.
+
+Constants:
+    CAPTURE_SYMBOLS: The trump symbols whose capture is tracked.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+from collections import namedtuple
+
+from card import Card, DECK
+import card_codes
+from rules import STANDARD
+
+PLAYERS = 4
+TEAMS = 2
+
+# Jack, off jack, Big Joker and Little Joker, as in Card.card_reference
+CAPTURE_SYMBOLS = ('J', 'X', 'B', 'L')
+
+ScoreState = namedtuple('ScoreState', ['points', 'high', 'high_team', 'low',
+                                       'low_team', 'captured', 'tricks'])
+
+
+class ScoreTracker:
+    """
+    A class to keep the running score of a hand for one trump suit
+    """
+
+    def __init__(self, trump, ruleset=STANDARD):
+        """
+        Initializes a ScoreTracker object.
+
+        Args:
+            trump (str): The trump suit, or None for no trump.
+            ruleset (Ruleset, optional): The rules to score by.
+        """
+        symbols, self.ranks, self.card_points, is_trump = ruleset.lists(trump)
+        self.trump = trump
+        # Index in CAPTURE_SYMBOLS of each card code, None if not tracked
+        self.captures = [CAPTURE_SYMBOLS.index(symbol)
+                         if is_trump[code] and symbol in CAPTURE_SYMBOLS
+                         else None for code, symbol in enumerate(symbols)]
+        self.is_trump = is_trump
+        self.state = ScoreState((0,) * TEAMS, None, None, None, None,
+                                (None,) * len(CAPTURE_SYMBOLS), 0)
+        self._history = []
+
+    def __str__(self):
+        """
+        Returns a string representation of the score.
+
+        Returns:
+            str: The points of each team and the high and low trump seen.
+        """
+        high = '-' if self.state.high is None else str(DECK[self.state.high])
+        low = '-' if self.state.low is None else str(DECK[self.state.low])
+        return (f"{self.state.points[0]}-{self.state.points[1]} "
+                f"high {high.strip()} low {low.strip()}")
+
+    def take(self, cards, seat):
+        """
+        Scores a trick taken by a seat.
+
+        Args:
+            cards (iterable): The cards of the trick, as Cards or card codes;
+                  card_codes.NO_PLAY is skipped.
+            seat (int): The seat that took the trick.
+
+        Returns:
+            ScoreState: The new score.
+        """
+        if not 0 <= seat < PLAYERS:
+            raise ValueError(f"Invalid seat: {seat}")
+        team = seat % TEAMS
+        points, high, high_team, low, low_team, captured, tricks = self.state
+        captured = list(captured)
+        gained = 0
+        for code in cards:
+            if isinstance(code, Card):
+                code = card_codes.to_code(code)
+            elif not 0 <= code <= card_codes.NO_PLAY:
+                raise ValueError(f"Invalid card code: {code}")
+            gained += self.card_points[code]
+            if not self.is_trump[code]:
+                continue
+            if high is None or self.ranks[code] > self.ranks[high]:
+                high, high_team = code, team
+            if low is None or self.ranks[code] < self.ranks[low]:
+                low, low_team = code, team
+            if self.captures[code] is not None:
+                captured[self.captures[code]] = team
+
+        points = tuple(total + gained if number == team else total
+                       for number, total in enumerate(points))
+        self._history.append(self.state)
+        self.state = ScoreState(points, high, high_team, low, low_team,
+                                tuple(captured), tricks + 1)
+        return self.state
+
+    def play(self, cards, leader=0):
+        """
+        Finds the winner of a trick and scores it.  The highest ranked card
+        wins, and on a tie the card played first.
+
+        Args:
+            cards (list): The cards of the trick in the order played, as
+                  Cards or card codes.
+            leader (int, optional): The seat that led the trick.
+
+        Returns:
+            int: The seat that took the trick.
+        """
+        codes = [card_codes.to_code(card) if isinstance(card, Card) else card
+                 for card in cards]
+        ranks = [self.ranks[code] for code in codes]
+        seat = (leader + ranks.index(max(ranks))) % PLAYERS
+        self.take(codes, seat)
+        return seat
+
+    def undo(self):
+        """
+        Takes back the last trick scored.
+
+        Returns:
+            ScoreState: The score before that trick.
+        """
+        if not self._history:
+            raise IndexError("No trick to undo")
+        self.state = self._history.pop()
+        return self.state
+
+    def snapshot(self):
+        """
+        Returns the current score, to be restored later.
+
+        Returns:
+            ScoreState: The current score.
+        """
+        return self.state
+
+    def restore(self, state):
+        """
+        Restores a score returned by snapshot().  The undo history starts
+        again from the restored score.
+
+        Args:
+            state (ScoreState): The score to restore.
+        """
+        self._history.clear()
+        self.state = state
+
+    def captured_by(self, symbol):
+        """
+        Returns the team that captured a tracked card.
+
+        Args:
+            symbol (str): The trump symbol of the card, one of
+                  CAPTURE_SYMBOLS.
+
+        Returns:
+            int: The team that captured the card, or None if it has not been
+                 captured.
+        """
+        if symbol not in CAPTURE_SYMBOLS:
+            raise ValueError(f"Invalid capture symbol: {symbol}")
+        return self.state.captured[CAPTURE_SYMBOLS.index(symbol)]
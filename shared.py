@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""
+Shared Module
+
+This module places large arrays of card codes, such as a batch of dealt
+hands, in multiprocessing.shared_memory so that process pool workers can read
+them in place instead of receiving a pickled copy.
+
+The process that owns the batch creates a SharedHands, which copies the
+array into a new shared memory block once, and sends workers its small
+descriptor (the block name, shape and dtype).  A worker opens the descriptor
+with attach(), reads the array as a view of the block and closes it; the
+owner unlinks the block when the work is done.
+
+Cards themselves pickle as their index in DECK (see Card.__reduce__()), so
+small batches can still be sent as Cards or Hands.
+
+Classes:
+    SharedDescriptor: What a worker needs to find a shared array.
+    SharedHands: Owns an array of card codes in shared memory.
+
+Functions:
+    attach: Opens a shared array from its descriptor.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+from collections import namedtuple
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+import numpy as np
+
+SharedDescriptor = namedtuple('SharedDescriptor', ['name', 'shape', 'dtype'])
+
+
+class SharedHands:
+    """
+    A class to own an array of card codes in shared memory
+    """
+
+    def __init__(self, codes):
+        """
+        Initializes a SharedHands object by copying an array into a new
+        shared memory block.
+
+        Args:
+            codes (array_like): The card codes, of any shape, e.g. the
+                  (tables, hands, cards) array returned by Deck.deal().
+        """
+        codes = np.ascontiguousarray(codes)
+        self._memory = shared_memory.SharedMemory(create=True,
+                                                  size=max(codes.nbytes, 1))
+        self.array = np.ndarray(codes.shape, dtype=codes.dtype,
+                                buffer=self._memory.buf)
+        self.array[...] = codes
+        self.descriptor = SharedDescriptor(self._memory.name, codes.shape,
+                                           codes.dtype.str)
+
+    def __enter__(self):
+        """
+        Returns the shared hands for a with statement.
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Closes and unlinks the block at the end of a with statement.
+        """
+        self.close()
+
+    def close(self):
+        """
+        Releases the array, closes the block and unlinks it so that the
+        memory is freed once every worker has closed it too.
+        """
+        if self._memory is None:
+            return
+        self.array = None
+        self._memory.close()
+        self._memory.unlink()
+        self._memory = None
+
+
+@contextmanager
+def attach(descriptor):
+    """
+    Opens a shared array from its descriptor, in a worker.
+
+    Args:
+        descriptor (SharedDescriptor): The descriptor of the array.
+
+    Yields:
+        ndarray: A read-only view of the shared array, valid until the with
+                 statement ends.
+    """
+    memory = shared_memory.SharedMemory(name=descriptor.name)
+    array = np.ndarray(descriptor.shape, dtype=np.dtype(descriptor.dtype),
+                       buffer=memory.buf)
+    array.flags.writeable = False
+    try:
+        yield array
+    finally:
+        del array
+        memory.close()
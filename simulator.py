@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+"""
+Simulator Module
+
+This module estimates what a Pitch hand is worth by Monte Carlo simulation.
+The other three hands are dealt at random around the bidder's hand, each deal
+is played out under every candidate trump suit, and the bidder's score is
+averaged over the deals.
+
+Ranks and points come from the lookup tables of a Ruleset (the standard
+rules, the same as the card_codes tables, which are built from
+Card.card_reference through Card.trump_table), so the simulation follows the
+same rules as Card.set_trump(): the 3 is worth three points, the off jack
+and both jokers are trump, and so on.
+
+The deals are split into chunks of a fixed size, each with its own seed
+spawned from the simulation seed, and the chunks are run on a process pool.
+The results therefore depend only on the seed and the chunk size, not on the
+number of workers.
+
+Four players sit in seats 0-3; seats 0 and 2 are partners, as are seats 1
+and 3.  The bidder sits in seat 0 and leads the first trick.  Players must
+follow suit (see legal.follow_masks()), and choose among their legal cards:
+in each trick the leader plays its highest card; every other player plays
+its lowest card when its partner is winning the trick, otherwise its lowest
+card that wins the trick, or its lowest card when it cannot win.  The
+highest ranked card takes the trick, and on a tie the card played first.
+
+Classes:
+    SimulationResult: The estimated score of a hand for one trump suit.
+
+Functions:
+    play_out: Plays out one deal and returns the points of each team.
+    simulate_chunk: Simulates one chunk of deals.
+    simulate: Estimates the score of a hand for each candidate trump suit.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+import math
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from statistics import NormalDist
+
+import numpy as np
+
+from card import SUITS
+import card_codes
+from deck import Deck
+from legal import follow_masks
+from rules import STANDARD
+
+PLAYERS = 4
+
+SimulationResult = namedtuple('SimulationResult',
+                              ['trump', 'bid', 'deals', 'mean', 'stderr',
+                               'low', 'high', 'make_rate'])
+
+
+@lru_cache(maxsize=None)
+def _rules(trump, ruleset):
+    """
+    Returns the ranks, points and follow masks of a trump suit as lists.
+
+    Args:
+        trump (str): The trump suit, or None for no trump.
+        ruleset (Ruleset): The rules to play by.
+
+    Returns:
+        tuple: The rank and points of each card code, and the FollowMasks
+               of the trump suit.
+    """
+    tables = ruleset.lists(trump)
+    return tables.rank, tables.points, follow_masks(trump, ruleset)
+
+
+def play_out(hands, trump, leader=0, ruleset=STANDARD):
+    """
+    Plays out one deal and returns the points taken by each team.
+
+    Args:
+        hands (list): The card codes of each seat's hand; the lists are
+              emptied as the cards are played.
+        trump (str): The trump suit, or None for no trump.
+        leader (int, optional): The seat that leads the first trick.
+        ruleset (Ruleset, optional): The rules to play by.
+
+    Returns:
+        list: The points taken by team 0 (seats 0 and 2) and team 1.
+    """
+    ranks, points, (follow, ruff) = _rules(trump, ruleset)
+
+    def order(code):
+        return ranks[code], points[code]
+
+    team_points = [0, 0]
+    players = len(hands)
+    while hands[leader]:
+        # The leader plays its highest card
+        hand = hands[leader]
+        best = max(hand, key=order)
+        hand.remove(best)
+        winner, best_rank, total = leader, ranks[best], points[best]
+        follows, ruffs = follow[best], ruff[best]
+
+        for offset in range(1, players):
+            seat = (leader + offset) % players
+            hand = hands[seat]
+            legal = [code for code in hand if follows >> code & 1]
+            if legal:
+                legal += [code for code in hand if ruffs >> code & 1]
+            else:
+                legal = hand
+            lowest = min(legal, key=order)
+            if (winner - seat) % 2 == 0:
+                play = lowest
+            else:
+                winning = [code for code in legal if ranks[code] > best_rank]
+                play = min(winning, key=order) if winning else lowest
+            hand.remove(play)
+            total += points[play]
+            if ranks[play] > best_rank:
+                winner, best_rank = seat, ranks[play]
+
+        team_points[winner % 2] += total
+        leader = winner
+    return team_points
+
+
+def simulate_chunk(hand, bid, trumps, deals, seed):
+    """
+    Simulates one chunk of deals for every candidate trump suit.
+
+    Args:
+        hand (list): The card codes of the bidder's hand.
+        bid (int): The bid.
+        trumps (list): The trump indexes to simulate (see card_codes).
+        deals (int): The number of deals.
+        seed (SeedSequence): The seed of the chunk.
+
+    Returns:
+        dict: For each trump index, the number of deals, the sum and the sum
+              of squares of the bidder's score, and the number of deals in
+              which the bid was made.
+    """
+    others = Deck(seed).deal_remaining(hand, hands=PLAYERS - 1, cards=len(hand),
+                                       tables=deals).tolist()
+    totals = {}
+    for trump in trumps:
+        suit = card_codes.TRUMP_SUITS[trump]
+        score_sum = score_squares = made = 0
+        for table in others:
+            hands = [list(hand)] + [list(cards) for cards in table]
+            bidder_points = play_out(hands, suit)[0]
+            if bidder_points >= bid:
+                score = bidder_points
+                made += 1
+            else:
+                score = -bid
+            score_sum += score
+            score_squares += score * score
+        totals[trump] = (deals, score_sum, score_squares, made)
+    return totals
+
+
+def _merge(chunks, trumps):
+    """
+    Adds up the totals of several chunks.
+
+    Args:
+        chunks (iterable): The results of simulate_chunk().
+        trumps (list): The trump indexes that were simulated.
+
+    Returns:
+        dict: The combined totals for each trump index.
+    """
+    merged = {trump: (0, 0, 0, 0) for trump in trumps}
+    for chunk in chunks:
+        for trump, totals in chunk.items():
+            merged[trump] = tuple(a + b for a, b in zip(merged[trump], totals))
+    return merged
+
+
+def _summarize(trump, bid, totals, z_score):
+    """
+    Turns the totals of a trump suit into a SimulationResult.
+
+    Args:
+        trump (str): The trump suit.
+        bid (int): The bid.
+        totals (tuple): The merged totals of the trump suit.
+        z_score (float): The z-score of the confidence level.
+
+    Returns:
+        SimulationResult: The estimated score with its confidence interval.
+    """
+    count, score_sum, score_squares, made = totals
+    mean = score_sum / count
+    stderr = math.sqrt(max(score_squares / count - mean * mean, 0.0) / count)
+    return SimulationResult(trump, bid, count, mean, stderr,
+                            mean - z_score * stderr, mean + z_score * stderr,
+                            made / count)
+
+
+def simulate(hand, bid, trumps=SUITS, deals=10000, seed=None, workers=None,
+             chunk_size=2000, confidence=0.95):
+    """
+    Estimates the bidder's expected score for each candidate trump suit.
+
+    Args:
+        hand (iterable): The bidder's cards, as Cards or card codes.
+        bid (int): The bid; the bidder scores its points when it takes at
+            least that many, and loses the bid otherwise.
+        trumps (iterable, optional): The candidate trump suits.
+        deals (int, optional): The number of random deals.
+        seed (int, optional): The seed of the simulation.
+        workers (int, optional): The number of worker processes; None uses
+            every core and 1 runs in this process.
+        chunk_size (int, optional): The number of deals per chunk.
+        confidence (float, optional): The confidence level of the interval.
+
+    Returns:
+        list: A SimulationResult for each trump suit, best mean first.
+    """
+    if deals < 1:
+        raise ValueError(f"Invalid number of deals: {deals}")
+    hand = [int(code) if isinstance(code, (int, np.integer)) else
+            card_codes.to_code(code) for code in hand]
+    if len(set(hand)) != len(hand):
+        raise ValueError("The hand holds the same card twice")
+    trumps = [card_codes.trump_index(suit) for suit in trumps]
+
+    sizes = [chunk_size] * (deals // chunk_size)
+    if deals % chunk_size:
+        sizes.append(deals % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    arguments = ([hand] * len(sizes), [bid] * len(sizes),
+                 [trumps] * len(sizes), sizes, seeds)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1 or len(sizes) == 1:
+        merged = _merge(map(simulate_chunk, *arguments), trumps)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(sizes))) as pool:
+            merged = _merge(pool.map(simulate_chunk, *arguments), trumps)
+
+    z_score = NormalDist().inv_cdf(0.5 + confidence / 2)
+    results = [_summarize(card_codes.TRUMP_SUITS[trump], bid, merged[trump],
+                          z_score) for trump in trumps]
+    return sorted(results, key=lambda result: result.mean, reverse=True)
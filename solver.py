@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+"""
+Solver Module
+
+This module defines the Solver class, an exact double-dummy solver: given
+every player's hand, the trump suit and the leader, it finds how many points
+each side takes when both sides play perfectly.
+
+Ranks and points come from the lookup tables of a Ruleset (the standard
+rules by default, the same as the card_codes tables), and tricks are won as
+in tricks.resolve_tricks(): the highest ranked card wins, and on a tie the
+card played first.  Players must follow suit as in legal.legal_mask().
+Seats 0 and 2 play for team 0 and seats 1 and 3 for team 1.
+
+The search is alpha-beta minimax over single card plays.  Moves are ordered
+by trump rank, highest first, and cards a player holds with the same rank,
+points and suit are only tried once, since they are interchangeable.
+Positions at the start of a trick are stored in a transposition table
+indexed by a Zobrist hash of the cards still held and the leader.  The table
+has a fixed number of slots; when two positions share a slot, the 'depth'
+replacement policy keeps the one with more cards left to play and the
+'always' policy keeps the newer one.
+
+Classes:
+    SolverTimeout: Raised when a solve runs past its time limit.
+    SolveResult: The points of each team and search statistics.
+    Solver: A double-dummy solver for one trump suit.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+import random
+import time
+from collections import namedtuple
+
+from card import DECK
+import card_codes
+from hand import mask_to_codes
+from legal import follow_masks
+from rules import STANDARD
+
+PLAYERS = 4
+
+# Transposition table entry flags
+EXACT, LOWER, UPPER = 0, 1, 2
+
+REPLACEMENT_POLICIES = ('depth', 'always')
+
+SolveResult = namedtuple('SolveResult', ['points', 'nodes', 'tt_hits',
+                                         'seconds'])
+
+
+class SolverTimeout(TimeoutError):
+    """
+    Raised when a solve runs past its time limit
+    """
+
+
+class Solver:
+    """
+    A double-dummy solver for one trump suit
+    """
+
+    def __init__(self, trump, tt_size=1 << 18, replacement='depth',
+                 time_limit=None, seed=0, ruleset=STANDARD):
+        """
+        Initializes a Solver object.
+
+        Args:
+            trump (str): The trump suit, or None for no trump.
+            tt_size (int, optional): The number of transposition table slots.
+            replacement (str, optional): The replacement policy, 'depth' or
+                 'always'.
+            time_limit (float, optional): The most seconds a solve may take;
+                 None for no limit.
+            seed (int, optional): The seed of the Zobrist keys.
+            ruleset (Ruleset, optional): The rules to play by.
+        """
+        if tt_size < 1:
+            raise ValueError(f"Invalid transposition table size: {tt_size}")
+        if replacement not in REPLACEMENT_POLICIES:
+            raise ValueError(f"Invalid replacement policy: {replacement}")
+
+        tables = ruleset.lists(trump)
+        self.trump = trump
+        self.ranks = tables.rank
+        self.points = tables.points
+        self.follow = follow_masks(trump, ruleset)
+        self.tt_size = tt_size
+        self.replacement = replacement
+        self.time_limit = time_limit
+
+        rng = random.Random(seed)
+        self.card_keys = [[rng.getrandbits(64) for _ in DECK]
+                          for _ in range(PLAYERS)]
+        self.leader_keys = [rng.getrandbits(64) for _ in range(PLAYERS)]
+
+        # Each slot holds (hash, cards left, value, flag) or None
+        self.table = [None] * tt_size
+        self.stats = {'nodes': 0, 'tt_hits': 0}
+        self._deadline = None
+
+    def clear(self):
+        """
+        Empties the transposition table.
+        """
+        self.table = [None] * self.tt_size
+
+    def solve(self, hands, leader=0):
+        """
+        Finds the points each team takes with perfect play.
+
+        Args:
+            hands (list): The card codes of each seat's hand, all the same
+                  length.
+            leader (int, optional): The seat that leads the first trick.
+
+        Returns:
+            SolveResult: The points of team 0 and team 1, the number of
+                         positions searched, the transposition table hits
+                         and the time taken.
+
+        Raises:
+            SolverTimeout: If the solve runs past the time limit.
+        """
+        if len(hands) != PLAYERS:
+            raise ValueError(f"A deal has {PLAYERS} hands, not {len(hands)}")
+        if len({len(hand) for hand in hands}) != 1:
+            raise ValueError("Every hand must hold the same number of cards")
+        codes = [int(code) for hand in hands for code in hand]
+        if len(set(codes)) != len(codes):
+            raise ValueError("A card is dealt twice")
+
+        masks = [0] * PLAYERS
+        key = self.leader_keys[leader]
+        for seat, hand in enumerate(hands):
+            for code in hand:
+                masks[seat] |= 1 << int(code)
+                key ^= self.card_keys[seat][int(code)]
+
+        self.stats = {'nodes': 0, 'tt_hits': 0}
+        start = time.perf_counter()
+        self._deadline = (None if self.time_limit is None
+                          else start + self.time_limit)
+        total = sum(self.points[code] for code in codes)
+        team_0 = self._search(masks, key, leader, -1, total + 1)
+        return SolveResult((team_0, total - team_0), self.stats['nodes'],
+                           self.stats['tt_hits'], time.perf_counter() - start)
+
+    def _moves(self, mask, led=card_codes.NO_PLAY):
+        """
+        Returns the distinct legal moves of a hand, highest rank first.
+
+        Args:
+            mask (int): The mask of the hand.
+            led (int, optional): The code of the led card, or
+                card_codes.NO_PLAY when the seat is leading.
+
+        Returns:
+            list: One card code for each distinct (rank, points, suit).
+        """
+        ranks, points = self.ranks, self.points
+        follow, ruff = self.follow
+        held = mask & follow[led]
+        if held:
+            mask = held | mask & ruff[led]
+        codes = mask_to_codes(mask)
+        codes.sort(key=lambda code: (ranks[code], points[code]), reverse=True)
+
+        # Cards of the same suit follow the same cards
+        moves, seen = [], set()
+        for code in codes:
+            kind = (ranks[code], points[code], follow[code])
+            if kind not in seen:
+                seen.add(kind)
+                moves.append(code)
+        return moves
+
+    def _probe(self, key, cards_left, alpha, beta):
+        """
+        Looks a position up in the transposition table.
+
+        Args:
+            key (int): The Zobrist hash of the position.
+            cards_left (int): The number of cards still to be played.
+            alpha (int): The lower bound of the search window.
+            beta (int): The upper bound of the search window.
+
+        Returns:
+            int: The stored value if it settles the search, otherwise None.
+        """
+        entry = self.table[key % self.tt_size]
+        if entry is None or entry[0] != key or entry[1] != cards_left:
+            return None
+        _, _, value, flag = entry
+        if (flag == EXACT or (flag == LOWER and value >= beta) or
+                (flag == UPPER and value <= alpha)):
+            self.stats['tt_hits'] += 1
+            return value
+        return None
+
+    def _store(self, key, cards_left, value, flag):
+        """
+        Stores a position in the transposition table.
+
+        Args:
+            key (int): The Zobrist hash of the position.
+            cards_left (int): The number of cards still to be played.
+            value (int): The value found for the position.
+            flag (int): EXACT, LOWER or UPPER.
+        """
+        slot = key % self.tt_size
+        entry = self.table[slot]
+        if (entry is None or self.replacement == 'always' or
+                entry[0] == key or cards_left >= entry[1]):
+            self.table[slot] = (key, cards_left, value, flag)
+
+    def _search(self, masks, key, leader, alpha, beta):
+        """
+        Searches a position at the start of a trick.
+
+        Args:
+            masks (list): The masks of the cards each seat still holds.
+            key (int): The Zobrist hash of the position.
+            leader (int): The seat that leads the trick.
+            alpha (int): The lower bound of the search window.
+            beta (int): The upper bound of the search window.
+
+        Returns:
+            int: The points team 0 takes from this position on.
+        """
+        if not masks[leader]:
+            return 0
+        cards_left = sum(mask.bit_count() for mask in masks)
+        value = self._probe(key, cards_left, alpha, beta)
+        if value is not None:
+            return value
+
+        original_alpha, original_beta = alpha, beta
+        value = self._play(masks, key, leader, 0, card_codes.NO_PLAY, -1,
+                           leader, 0, alpha, beta)
+        if value <= original_alpha:
+            flag = UPPER
+        elif value >= original_beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self._store(key, cards_left, value, flag)
+        return value
+
+    def _play(self, masks, key, leader, played, led, best_rank, winner,
+              points, alpha, beta):
+        """
+        Searches the plays of the next seat in a trick.
+
+        Args:
+            masks (list): The masks of the cards each seat still holds.
+            key (int): The Zobrist hash of the cards held and the leader.
+            leader (int): The seat that led the trick.
+            played (int): The number of cards played in the trick so far.
+            led (int): The code of the led card, or card_codes.NO_PLAY.
+            best_rank (int): The highest rank played in the trick so far.
+            winner (int): The seat winning the trick so far.
+            points (int): The points of the cards played in the trick so far.
+            alpha (int): The lower bound of the search window.
+            beta (int): The upper bound of the search window.
+
+        Returns:
+            int: The points team 0 takes from this position on.
+        """
+        self.stats['nodes'] += 1
+        if (self._deadline is not None and not self.stats['nodes'] & 0x3ff and
+                time.perf_counter() > self._deadline):
+            raise SolverTimeout(f"Solve ran past {self.time_limit} seconds")
+
+        seat = (leader + played) % PLAYERS
+        maximizing = seat % 2 == 0
+        best = None
+        for code in self._moves(masks[seat], led):
+            rank = self.ranks[code]
+            if rank > best_rank:
+                new_rank, new_winner = rank, seat
+            else:
+                new_rank, new_winner = best_rank, winner
+            new_points = points + self.points[code]
+            masks[seat] ^= 1 << code
+            new_key = key ^ self.card_keys[seat][code]
+
+            if played == PLAYERS - 1:
+                gained = new_points if new_winner % 2 == 0 else 0
+                new_key ^= self.leader_keys[leader] ^ self.leader_keys[new_winner]
+                value = gained + self._search(masks, new_key, new_winner,
+                                              alpha - gained, beta - gained)
+            else:
+                value = self._play(masks, new_key, leader, played + 1,
+                                   code if played == 0 else led, new_rank,
+                                   new_winner, new_points, alpha, beta)
+            masks[seat] ^= 1 << code
+
+            if maximizing:
+                best = value if best is None else max(best, value)
+                alpha = max(alpha, value)
+            else:
+                best = value if best is None else min(best, value)
+                beta = min(beta, value)
+            if alpha >= beta:
+                break
+        return best
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+"""
+Symmetry Module
+
+This module maps a hand and trump suit to a canonical representative of
+its class of equivalent hand and trump suit pairs.
+
+The trump rules treat the suits symmetrically as long as the two colors stay
+paired: Spades with Clubs and Diamonds with Hearts, the pairs that decide
+the off jack in Card.get_trump_symbol().  Swapping the suits of a pair, or
+swapping the two pairs, changes neither which cards are trump nor their ranks
+and points.  These eight suit permutations map every hand and trump suit to
+a canonical one in which the trump suit is Spades (when there is one) and
+the hand has the smallest mask.
+
+Classes:
+    Canonical: A canonical hand, its trump suit and the permutation used.
+
+Functions:
+    permute_card: Applies a suit permutation to a card.
+    permute_hand: Applies a suit permutation to a hand.
+    invert: Returns the inverse of a suit permutation.
+    canonical: Returns the canonical form of a hand and trump suit.
+
+Constants:
+    PERMUTATIONS: The eight suit permutations, as mappings from suit to suit.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+from collections import namedtuple
+from itertools import product
+from types import MappingProxyType
+
+from card import Card, CARD_NAMES, SUITS
+from hand import Hand
+
+Canonical = namedtuple('Canonical', ['hand', 'trump', 'permutation'])
+
+# Each suit's 13 cards occupy one block of bits in a Hand mask (see card_codes)
+_BLOCK = len(CARD_NAMES)
+_BLOCK_MASK = (1 << _BLOCK) - 1
+_JOKER_MASK = ((1 << 2) - 1) << (_BLOCK * len(SUITS))
+
+
+def _permutations():
+    """
+    Returns the eight suit permutations that keep the color pairs together.
+
+    Returns:
+        tuple: The permutations, identity first, as read-only mappings from
+               suit to suit.
+    """
+    spades, diamonds, clubs, hearts = SUITS
+    permutations = []
+    for swap_colors, swap_black, swap_red in product((False, True), repeat=3):
+        black = (clubs, spades) if swap_black else (spades, clubs)
+        red = (hearts, diamonds) if swap_red else (diamonds, hearts)
+        if swap_colors:
+            black, red = red, black
+        permutations.append(MappingProxyType({
+            spades: black[0], clubs: black[1],
+            diamonds: red[0], hearts: red[1], 'Joker': 'Joker'}))
+    return tuple(permutations)
+
+
+PERMUTATIONS = _permutations()
+
+# Block shifts of each permutation, as (source shift, target shift) pairs
+_SHIFTS = [tuple((_BLOCK * SUITS.index(suit),
+                  _BLOCK * SUITS.index(permutation[suit])) for suit in SUITS)
+           for permutation in PERMUTATIONS]
+
+
+def _permute_mask(mask, shifts):
+    """
+    Moves the blocks of a hand mask to their permuted suits.
+
+    Args:
+        mask (int): The hand mask.
+        shifts (tuple): The (source shift, target shift) pair of each suit.
+
+    Returns:
+        int: The permuted mask.
+    """
+    permuted = mask & _JOKER_MASK
+    for source, target in shifts:
+        permuted |= (mask >> source & _BLOCK_MASK) << target
+    return permuted
+
+
+def permute_card(card, permutation):
+    """
+    Applies a suit permutation to a card.
+
+    Args:
+        card (Card): The card.
+        permutation (dict): The suit permutation.
+
+    Returns:
+        Card: The interned card with the permuted suit.
+    """
+    return Card.get(card.name, permutation[card.suit])
+
+
+def permute_hand(hand, permutation):
+    """
+    Applies a suit permutation to a hand.
+
+    Args:
+        hand (Hand): The hand.
+        permutation (dict): The suit permutation.
+
+    Returns:
+        Hand: The permuted hand.
+    """
+    shifts = tuple((_BLOCK * SUITS.index(suit),
+                    _BLOCK * SUITS.index(permutation[suit])) for suit in SUITS)
+    return Hand.from_mask(_permute_mask(hand.mask, shifts))
+
+
+def invert(permutation):
+    """
+    Returns the inverse of a suit permutation.
+
+    Args:
+        permutation (dict): The suit permutation.
+
+    Returns:
+        dict: The permutation that undoes it.
+    """
+    return {target: source for source, target in permutation.items()}
+
+
+def canonical(hand, trump=None):
+    """
+    Returns the canonical form of a hand and trump suit.
+
+    Args:
+        hand (Hand or iterable): The hand, as a Hand or as cards.
+        trump (str, optional): The trump suit, or None for no trump.
+
+    Returns:
+        Canonical: The canonical hand, the canonical trump suit (Spades, or
+                   None) and the permutation that maps the originals to them.
+    """
+    if not isinstance(hand, Hand):
+        hand = Hand(hand)
+    if trump is not None and trump not in SUITS:
+        raise ValueError(f"Invalid trump suit: {trump}")
+
+    mask, index = min((_permute_mask(hand.mask, _SHIFTS[index]), index)
+                      for index, permutation in enumerate(PERMUTATIONS)
+                      if trump is None or permutation[trump] == SUITS[0])
+    permutation = PERMUTATIONS[index]
+    return Canonical(Hand.from_mask(mask),
+                     None if trump is None else permutation[trump],
+                     permutation)
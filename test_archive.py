@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""
+Test Module for the Binary Hand Archive
+
+This module contains unit tests for the ArchiveWriter and ArchiveReader
+classes.
+
+Classes:
+    TestArchive: A test class containing all unit tests for the archive
+                 module.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+import card_codes
+from archive import (ArchiveReader, ArchiveWriter, HEADER_SIZE,
+                     record_dtype)
+from deck import Deck
+from game_log import GameRecord
+
+
+class TestArchive(unittest.TestCase):
+    """
+    Test class for the archive module.
+    """
+
+    def setUp(self):
+        """Set up a temporary archive path and some records."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'hands.bin')
+        deals = Deck(20).deal(tables=40).tolist()
+        self.records = [GameRecord(card_codes.TRUMP_SUITS[number % 5],
+                                   number % 4,
+                                   tuple(tuple(trick) for trick in zip(*hands)))
+                        for number, hands in enumerate(deals)]
+        # A hand cut short, with a trick of fewer cards
+        self.records.append(GameRecord('Hearts', 2, ((1, 2, 3, 4), (5, 6))))
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def write(self):
+        """Writes the records to the archive."""
+        with ArchiveWriter(self.path) as writer:
+            for record in self.records:
+                writer.write(record)
+        return writer
+
+    def test_round_trip(self):
+        """Test writing and reading back every record."""
+        self.assertEqual(self.write().count, len(self.records))
+        self.assertEqual(os.path.getsize(self.path),
+                         HEADER_SIZE + 27 * len(self.records))
+        with ArchiveReader(self.path) as reader:
+            self.assertEqual(len(reader), len(self.records))
+            self.assertEqual(list(reader), self.records)
+            self.assertEqual(reader.record(-1), self.records[-1])
+
+    def test_views(self):
+        """Test that the arrays are read-only views of the map."""
+        self.write()
+        with ArchiveReader(self.path) as reader:
+            cards = reader.cards
+            self.assertEqual(cards.shape, (len(self.records), 6, 4))
+            self.assertFalse(cards.flags.writeable)
+            self.assertFalse(cards.flags.owndata)
+            self.assertEqual(cards[7].tolist(),
+                             [list(trick) for trick in self.records[7].tricks])
+            self.assertEqual(reader.trumps.tolist()[:5], [0, 1, 2, 3, 4])
+            self.assertEqual(reader[3]['leader'], 3)
+            del cards
+
+    def test_write_array(self):
+        """Test writing a batch of records at once."""
+        self.write()
+        with ArchiveReader(self.path) as reader:
+            batch = np.array(reader[:10])
+        path = os.path.join(self.directory.name, 'copy.bin')
+        with ArchiveWriter(path) as writer:
+            writer.write_array(batch)
+            with self.assertRaises(ValueError):
+                writer.write_array(np.zeros(2, dtype=record_dtype(3, 6)))
+        with ArchiveReader(path) as reader:
+            self.assertEqual(list(reader), self.records[:10])
+
+    def test_empty(self):
+        """Test an archive with no records."""
+        with ArchiveWriter(self.path, players=3, max_tricks=8):
+            pass
+        with ArchiveReader(self.path) as reader:
+            self.assertEqual(len(reader), 0)
+            self.assertEqual(reader.cards.shape, (0, 8, 3))
+
+    def test_invalid(self):
+        """Test that bad files and records raise ValueError."""
+        with open(self.path, 'wb') as file:
+            file.write(b'not an archive at all')
+        with self.assertRaises(ValueError):
+            ArchiveReader(self.path)
+
+        self.write()
+        with open(self.path, 'ab') as file:
+            file.write(b'\x00')
+        with self.assertRaises(ValueError):
+            ArchiveReader(self.path)
+
+        with ArchiveWriter(self.path) as writer:
+            with self.assertRaises(ValueError):
+                writer.write(GameRecord('Spades', 0, ((1, 2),) * 7))
+            with self.assertRaises(ValueError):
+                writer.write(GameRecord('Spades', 0, ((1, 2, 3, 4, 5),)))
+        with self.assertRaises(ValueError):
+            ArchiveWriter(self.path, players=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+Test Module for the Benchmark Suite
+
+This module contains unit tests for the command line, JSON output and
+baseline comparison of the benchmark suite.  The timings themselves are not
+checked.
+
+Classes:
+    TestBenchmark: A test class containing all unit tests for the benchmark
+                   module.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+import benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+    """
+    Test class for the benchmark module.
+    """
+
+    def test_compare(self):
+        """Test finding regressions against a baseline."""
+        baseline = {'a': 100.0, 'b': 100.0, 'gone': 5.0}
+        results = {'a': 119.0, 'b': 130.0, 'new': 1e9}
+        self.assertEqual(benchmark.compare(results, baseline, 0.2),
+                         [('b', 100.0, 130.0, 1.3)])
+        self.assertEqual(benchmark.compare(results, baseline, 0.5), [])
+        self.assertEqual(len(benchmark.compare(results, baseline, 0.1)), 2)
+
+    def test_command_line(self):
+        """Test writing results and checking them against a baseline."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            with contextlib.redirect_stderr(io.StringIO()):
+                self.assertEqual(benchmark.main(['deal', '--json', path]), 0)
+            with open(path, encoding='utf-8') as file:
+                document = json.load(file)
+            self.assertEqual(list(document['results']), ['deal (per hand)'])
+
+            # A generous tolerance passes, an impossible baseline fails
+            with contextlib.redirect_stderr(io.StringIO()):
+                self.assertEqual(benchmark.main(['deal', '--baseline', path,
+                                                 '--tolerance', '100']), 0)
+            document['results']['deal (per hand)'] = 1e-3
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(document, file)
+            errors = io.StringIO()
+            with contextlib.redirect_stderr(errors):
+                self.assertEqual(benchmark.main(['deal', '--baseline', path]),
+                                 1)
+            self.assertIn('REGRESSION deal (per hand)', errors.getvalue())
+
+    def test_invalid_group(self):
+        """Test that unknown groups are rejected."""
+        with self.assertRaises(ValueError):
+            benchmark.run(['nothing'])
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                benchmark.main(['nothing'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,8 +13,10 @@ Programmer: Michelle Talley
 Copyright (c) 2025 Michelle Talley
 """
 
+from copy import deepcopy
+import pickle
 import unittest
-from card import Card
+from card import Card, DECK, SUITS
 
 
 class TestCard(unittest.TestCase):
@@ -324,6 +326,140 @@ class TestCard(unittest.TestCase):
                              f"Jack of {jack_suit} should have symbol 'X'\
                                when {trump_suit} is trump")
 
+    def test_get_returns_interned_card(self):
+        """Test that Card.get returns one shared card for every alias."""
+        ace = Card.get('Ace', 'Spades')
+        self.assertIs(ace, Card.get('A', 'Spades'))
+        self.assertIs(Card.get('10', 'Hearts'), Card.get('1', 'Hearts'))
+        self.assertIs(Card.get('Big', 'Joker'), Card.get('B', 'Joker'))
+        self.assertIs(Card.get('Little', 'Joker'), Card.get('L', 'Joker'))
+        self.assertEqual(ace, self.ace_spades)
+        self.assertEqual(ace.state(), self.ace_spades.state())
+
+    def test_get_invalid_card(self):
+        """Test that Card.get rejects names and suits outside the deck."""
+        for name, suit in (('Invalid', 'Spades'), ('Ace', 'InvalidSuit'),
+                           ('Ace', 'Joker'), ('X', 'Spades')):
+            with self.assertRaises(ValueError):
+                Card.get(name, suit)
+
+    def test_interned_card_is_read_only(self):
+        """Test that interned cards cannot be modified."""
+        ace = Card.get('Ace', 'Spades')
+        with self.assertRaises(AttributeError):
+            ace.set_trump('Spades')
+        with self.assertRaises(AttributeError):
+            ace.rank = 1
+        self.assertEqual(ace.rank, 17)
+        self.assertIsNone(ace.trump_suit)
+
+    def test_constructor_returns_private_copy(self):
+        """Test that Card() still returns an independent, mutable card."""
+        card = Card('A', 'Spades')
+        self.assertIsNot(card, Card.get('Ace', 'Spades'))
+        self.assertIsNot(card, Card('A', 'Spades'))
+        card.set_trump('Spades')
+        self.assertEqual(Card.get('Ace', 'Spades').trump_suit, None)
+        self.assertFalse(hasattr(card, '__dict__'))
+
+    def test_deck(self):
+        """Test that the deck holds the 54 distinct interned cards."""
+        self.assertEqual(len(DECK), 54)
+        self.assertEqual(len({card.short_name for card in DECK}), 54)
+        for card in DECK:
+            self.assertIs(card, Card.get(card.name, card.suit))
+
+    def test_trump_table(self):
+        """Test the precomputed trump table against the trump rules."""
+        for suit in SUITS:
+            trumps = [card for card in DECK if card.is_trump(suit)]
+            # 13 cards of the suit, the off jack and both jokers
+            self.assertEqual(len(trumps), 16)
+            self.assertEqual(
+                sum(Card.trump_table[card.short_name][suit].points
+                    for card in DECK), 10)
+        for card in DECK:
+            for suit in (None, *SUITS):
+                self.assertEqual(Card.trump_table[card.short_name][suit],
+                                 Card.trump_entry(card.name, card.suit, suit))
+
+    def test_trump_outside_table(self):
+        """Test cards and trump suits that are not in the trump table."""
+        self.assertTrue(self.big_joker.is_trump('Joker'))
+        self.assertFalse(self.ace_spades.is_trump('Joker'))
+        off_jack = Card('X', 'Spades')
+        off_jack.set_trump('Spades')
+        self.assertEqual(off_jack.rank, 13)
+        self.assertEqual(off_jack.points, 1)
+
+    def test_hash(self):
+        """Test that equal cards hash alike and can be used in sets."""
+        self.assertEqual(hash(self.ace_spades), hash(Card.get('A', 'Spades')))
+        cards = {self.ace_spades, Card('Ace', 'Spades'), self.king_hearts}
+        self.assertEqual(len(cards), 2)
+        self.assertIn(Card.get('King', 'Hearts'), cards)
+        self.assertNotEqual(self.ace_spades, 'A♠')
+
+    def test_sort_key(self):
+        """Test that sort keys order every deck card for each trump suit."""
+        for suit in (None, *SUITS):
+            keys = [card.sort_key(suit) for card in DECK]
+            self.assertEqual(len(set(keys)), len(DECK))
+            for card, other in zip(DECK, DECK[1:]):
+                copy, other_copy = Card(card.name, card.suit), Card(other.name,
+                                                                    other.suit)
+                copy.set_trump(suit)
+                other_copy.set_trump(suit)
+                if copy < other_copy:
+                    self.assertLess(card.sort_key(suit), other.sort_key(suit))
+
+        # Non-trump cards sort by their base rank
+        self.assertLess(Card.get('4', 'Hearts').sort_key('Spades'),
+                        Card.get('King', 'Clubs').sort_key('Spades'))
+        self.jack_clubs.set_trump('Spades')
+        self.assertEqual(self.jack_clubs.sort_key(),
+                         self.jack_clubs.sort_key('Spades'))
+
+    def test_pickle(self):
+        """Test that cards pickle as their deck index."""
+        for card in DECK:
+            self.assertIs(pickle.loads(pickle.dumps(card)), card)
+
+        self.jack_clubs.set_trump('Spades')
+        copy = pickle.loads(pickle.dumps(self.jack_clubs))
+        self.assertIsNot(copy, self.jack_clubs)
+        self.assertEqual(copy.state(), self.jack_clubs.state())
+        copy.set_trump('Hearts')
+        self.assertEqual(copy.points, 0)
+
+        # Attributes set by hand survive the round trip
+        self.ace_spades.rank = 99
+        self.assertEqual(pickle.loads(pickle.dumps(self.ace_spades)).rank, 99)
+
+        self.assertLess(len(pickle.dumps(Card('10', 'Hearts'))), 64)
+
+    def test_pickle_non_deck_cards(self):
+        """Test that cards outside DECK pickle and copy by attributes."""
+        for card in (Card('_', 'Joker'), Card('N', 'Hearts'),
+                     Card('X', 'Spades'), Card('Ace', 'Joker')):
+            for clone in (pickle.loads(pickle.dumps(card)), deepcopy(card)):
+                self.assertIsNot(clone, card)
+                self.assertEqual(clone.state(), card.state())
+
+    def test_text_and_desc_tables(self):
+        """Test the cached text and descriptions of every deck card."""
+        for card in DECK:
+            self.assertEqual(Card.text_table[card.short_name],
+                             f"{card.short_name:>3}")
+            self.assertEqual(str(card), repr(card))
+            copy = Card(card.name, card.suit)
+            for suit in (None, *SUITS):
+                copy.set_trump(suit)
+                self.assertEqual(Card.desc_table[card.short_name][suit],
+                                 copy.desc())
+        self.assertEqual(Card.desc_table['J♣']['Spades'], 'Off Jack')
+        self.assertEqual(Card.desc_table['9♥']['Spades'], 'Off')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+Test Module for Card Codes
+
+This module contains unit tests for the integer card codes and the NumPy
+batch evaluation of card codes.
+
+Classes:
+    TestCardCodes: A test class containing all unit tests for card codes.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import unittest
+import numpy as np
+from card import Card, DECK, SUITS
+import card_codes
+
+
+class TestCardCodes(unittest.TestCase):
+    """
+    Test class for the card_codes module.
+    """
+
+    def test_codes_are_stable(self):
+        """Test the documented code layout."""
+        self.assertEqual(card_codes.to_code(Card.get('Ace', 'Spades')), 0)
+        self.assertEqual(card_codes.to_code(Card.get('2', 'Spades')), 12)
+        self.assertEqual(card_codes.to_code(Card.get('Ace', 'Diamonds')), 13)
+        self.assertEqual(card_codes.to_code(Card.get('2', 'Hearts')), 51)
+        self.assertEqual(card_codes.to_code(Card.get('Big', 'Joker')), 52)
+        self.assertEqual(card_codes.to_code(Card.get('Little', 'Joker')), 53)
+
+    def test_round_trip(self):
+        """Test converting cards to codes and back."""
+        for code, card in enumerate(DECK):
+            self.assertEqual(card_codes.to_code(card), code)
+            self.assertEqual(card_codes.to_code(Card(card.name, card.suit)), code)
+            self.assertIs(card_codes.from_code(code), card)
+
+        codes = card_codes.to_codes(DECK)
+        self.assertEqual(codes.dtype, np.uint8)
+        self.assertEqual(card_codes.from_codes(codes), list(DECK))
+        self.assertEqual(card_codes.from_codes([[0, 1], [52, 53]]),
+                         [[DECK[0], DECK[1]], [DECK[52], DECK[53]]])
+
+    def test_invalid_codes(self):
+        """Test that invalid codes and cards raise ValueError."""
+        with self.assertRaises(ValueError):
+            card_codes.from_code(54)
+        with self.assertRaises(ValueError):
+            card_codes.from_codes([0, 60])
+        with self.assertRaises(ValueError):
+            card_codes.to_code(Card('X', 'Spades'))
+        with self.assertRaises(ValueError):
+            card_codes.trump_index('Joker')
+        with self.assertRaises(ValueError):
+            card_codes.evaluate([0, -1], 'Spades')
+        with self.assertRaises(ValueError):
+            card_codes.evaluate([card_codes.NO_PLAY + 1], None)
+
+    def test_evaluate_matches_set_trump(self):
+        """Test batch evaluation against Card.set_trump for every card."""
+        codes = np.arange(len(DECK))
+        for suit in (None, *SUITS):
+            result = card_codes.evaluate(codes, suit)
+            for code, card in enumerate(DECK):
+                copy = Card(card.name, card.suit)
+                copy.set_trump(suit)
+                self.assertEqual(result.symbol[code], copy.symbol)
+                self.assertEqual(result.rank[code], copy.rank)
+                self.assertEqual(result.points[code], copy.points)
+                self.assertEqual(result.is_trump[code], copy.is_trump())
+
+    def test_evaluate_broadcasts_trump_suits(self):
+        """Test per-row trump suits given as names or indexes."""
+        codes = np.tile(np.arange(len(DECK)), (5, 1))
+        by_name = card_codes.evaluate(codes, np.array([[suit] for suit in
+                                                       (*SUITS, None)]))
+        by_index = card_codes.evaluate(codes, np.arange(5)[:, None])
+        self.assertEqual(by_name.rank.shape, (5, len(DECK)))
+        np.testing.assert_array_equal(by_name.rank, by_index.rank)
+        for row, suit in enumerate((*SUITS, None)):
+            single = card_codes.evaluate(codes[row], suit)
+            np.testing.assert_array_equal(by_index.points[row], single.points)
+            np.testing.assert_array_equal(by_index.is_trump[row],
+                                          single.is_trump)
+        # 16 trump cards and 10 points per trump suit
+        np.testing.assert_array_equal(by_index.is_trump.sum(axis=1),
+                                      [16, 16, 16, 16, 0])
+        np.testing.assert_array_equal(by_index.points.sum(axis=1),
+                                      [10, 10, 10, 10, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
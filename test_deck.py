@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Test Module for Deck Class
+
+This module contains unit tests for the Deck class, including reproducible
+shuffling, spawning child decks and dealing hands to many tables.
+
+Classes:
+    TestDeck: A test class containing all unit tests for the Deck class.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import unittest
+import numpy as np
+from card import DECK
+from deck import Deck
+
+
+class TestDeck(unittest.TestCase):
+    """
+    Test class for the Deck class.
+    """
+
+    def test_shuffle_is_reproducible(self):
+        """Test that the same seed shuffles the same way."""
+        first, second = Deck(42), Deck(42)
+        first.shuffle()
+        second.shuffle()
+        np.testing.assert_array_equal(first.codes, second.codes)
+        self.assertEqual(sorted(first.codes.tolist()), list(range(len(DECK))))
+        self.assertEqual(len(first), len(DECK))
+        self.assertEqual(sorted(first.cards(), key=DECK.index), list(DECK))
+
+    def test_deal_shape_and_cards(self):
+        """Test that every table is dealt distinct cards."""
+        hands = Deck(1).deal(hands=4, cards=6, tables=100)
+        self.assertEqual(hands.shape, (100, 4, 6))
+        self.assertEqual(hands.dtype, np.uint8)
+        for table in hands:
+            self.assertEqual(len(set(table.ravel().tolist())), 24)
+        self.assertGreater(len({table.tobytes() for table in hands}), 1)
+
+    def test_deal_is_reproducible(self):
+        """Test that deals depend only on the seed."""
+        first, second = Deck(3), Deck(3)
+        for tables in (5, 5, 2):
+            np.testing.assert_array_equal(first.deal(tables=tables),
+                                          second.deal(tables=tables))
+
+    def test_deals_are_independent(self):
+        """Test that an earlier deal is not changed by a later one."""
+        deck = Deck(5)
+        hands = deck.deal(tables=3)
+        kept = hands.copy()
+        deck.deal(tables=3)
+        np.testing.assert_array_equal(hands, kept)
+
+    def test_spawn(self):
+        """Test that child decks are reproducible and independent."""
+        children = Deck(9).spawn(3)
+        again = Deck(9).spawn(3)
+        deals = [child.deal(tables=10) for child in children]
+        for child, dealt in zip(again, deals):
+            np.testing.assert_array_equal(child.deal(tables=10), dealt)
+        self.assertFalse(np.array_equal(deals[0], deals[1]))
+
+    def test_deal_remaining(self):
+        """Test dealing around cards that are already held."""
+        held = [0, 1, 2, 52, 53, 20]
+        hands = Deck(2).deal_remaining(held, hands=3, cards=6, tables=50)
+        self.assertEqual(hands.shape, (50, 3, 6))
+        self.assertFalse(np.isin(hands, held).any())
+
+    def test_deck_codes(self):
+        """Test dealing from a deck without the jokers."""
+        deck = Deck(3, range(52))
+        self.assertEqual(len(deck), 52)
+        hands = deck.deal(hands=4, cards=13, tables=20)
+        self.assertFalse(np.isin(hands, [52, 53]).any())
+        np.testing.assert_array_equal(np.sort(hands[0], axis=None),
+                                      np.arange(52))
+        self.assertEqual(len(deck.spawn(2)[1]), 52)
+        with self.assertRaises(ValueError):
+            deck.deal(hands=9, cards=6)
+        with self.assertRaises(ValueError):
+            Deck(3, [0, 0, 1])
+
+    def test_deal_too_many_cards(self):
+        """Test that dealing more cards than the deck holds raises ValueError."""
+        with self.assertRaises(ValueError):
+            Deck(0).deal(hands=10, cards=6)
+        with self.assertRaises(ValueError):
+            Deck(0).deal_remaining(range(10), hands=8, cards=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+"""
+Test Module for the Asyncio Table Engine
+
+This module contains unit tests for playing simulated tables concurrently.
+
+Classes:
+    TestEngine: A test class containing all unit tests for the engine module.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import asyncio
+import unittest
+from card import DECK
+import engine
+from engine import Bot, Engine, GreedyBot, RandomBot
+from rules import Ruleset
+
+
+class CheatingBot(GreedyBot):
+    """A bot that always plays the first card of its hand."""
+
+    async def play(self, view):
+        return view.hand[0]
+
+
+class SlowBot(GreedyBot):
+    """A bot that counts how many tables are waiting on it at once."""
+
+    active = 0
+    most = 0
+
+    async def bid(self, view):
+        SlowBot.active += 1
+        SlowBot.most = max(SlowBot.most, SlowBot.active)
+        await asyncio.sleep(0.001)
+        SlowBot.active -= 1
+        return await super().bid(view)
+
+
+class TestEngine(unittest.TestCase):
+    """
+    Test class for the engine module.
+    """
+
+    def test_results(self):
+        """Test that every table is played out and scored."""
+        results = Engine(workers=20).run_sync(200, seed=3)
+        self.assertEqual([result.table for result in results],
+                         list(range(200)))
+        for result in results:
+            self.assertGreaterEqual(result.bid, engine.MIN_BID)
+            self.assertLessEqual(sum(result.points), 10)
+            self.assertEqual(result.made,
+                             result.points[result.bidder % 2] >= result.bid)
+
+    def test_reproducible(self):
+        """Test that results depend on the seed, not on the workers."""
+        def factory(table, seat):
+            return RandomBot(table * engine.PLAYERS + seat)
+
+        one = Engine(factory, workers=1).run_sync(100, seed=4)
+        many = Engine(factory, workers=37, latency=0).run_sync(100, seed=4)
+        self.assertEqual(one, many)
+        self.assertNotEqual(one, Engine(factory).run_sync(100, seed=5))
+
+    def test_backpressure(self):
+        """Test that no more tables than workers are in play at once."""
+        SlowBot.most = 0
+        runner = Engine(lambda table, seat: SlowBot(), workers=8,
+                        queue_size=4)
+        self.assertEqual(len(runner.run_sync(40, seed=6)), 40)
+        self.assertGreater(SlowBot.most, 1)
+        self.assertLessEqual(SlowBot.most, 8)
+
+    def test_bot_errors(self):
+        """Test that tables with illegal plays are counted as errors."""
+        runner = Engine(lambda table, seat: CheatingBot(), workers=4)
+        results = runner.run_sync(50, seed=7)
+        self.assertEqual(len(results) + runner.throughput.errors, 50)
+        self.assertGreater(runner.throughput.errors, 0)
+
+    def test_bots_are_closed(self):
+        """Test that the bots of every table are closed when it ends."""
+        closed = []
+
+        class ClosingBot(CheatingBot):
+            """A cheating bot that records when it is closed."""
+
+            def close(self):
+                closed.append(self)
+
+        runner = Engine(lambda table, seat: ClosingBot(), workers=4)
+        runner.run_sync(20, seed=7)
+        self.assertGreater(runner.throughput.errors, 0)
+        self.assertEqual(len(set(map(id, closed))), 4 * 20)
+
+    def test_incomplete_bot(self):
+        """Test that a bot missing a decision cannot be made."""
+
+        class BiddingBot(Bot):  # pylint: disable=abstract-method
+            """A bot that only bids."""
+
+            async def bid(self, view):
+                return engine.PASS
+
+        with self.assertRaises(TypeError):
+            BiddingBot()  # pylint: disable=abstract-class-instantiated
+
+    def test_throughput(self):
+        """Test the engine and process-wide throughput counters."""
+        before = engine.THROUGHPUT.tables
+        runner = Engine(workers=10)
+        runner.run_sync(30, seed=8)
+        self.assertEqual(runner.throughput.tables, 30)
+        self.assertGreater(runner.throughput.tables_per_second(), 0)
+        self.assertEqual(engine.THROUGHPUT.tables - before, 30)
+
+    def test_ruleset_and_shared_cards(self):
+        """Test a variant ruleset and that no deck card is changed."""
+        states = [card.state() for card in DECK]
+        variant = Ruleset.variant('no points for 3', points={'3': 0})
+        results = Engine(workers=10, ruleset=variant).run_sync(50, seed=9)
+        self.assertTrue(all(sum(result.points) <= 7 for result in results))
+        self.assertEqual([card.state() for card in DECK], states)
+
+    def test_ruleset_without_jokers(self):
+        """Test that a variant without jokers deals no jokers."""
+        seen = set()
+
+        class WatchingBot(GreedyBot):
+            """A greedy bot that records the cards it is dealt."""
+
+            async def bid(self, view):
+                seen.update(view.hand)
+                return await super().bid(view)
+
+        variant = Ruleset.variant('nj', jokers=False)
+        runner = Engine(lambda table, seat: WatchingBot(), workers=4,
+                        ruleset=variant)
+        self.assertEqual(len(runner.run_sync(20, seed=1)), 20)
+        self.assertEqual(runner.throughput.errors, 0)
+        self.assertTrue(seen)
+        self.assertTrue(seen <= set(variant.deck))
+
+    def test_on_result(self):
+        """Test the result callback."""
+        seen = []
+
+        async def collect(result):
+            seen.append(result.table)
+
+        asyncio.run(Engine(workers=5).run(25, seed=10, on_result=collect))
+        self.assertEqual(sorted(seen), list(range(25)))
+
+
+if __name__ == '__main__':
+    unittest.main()
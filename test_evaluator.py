@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""
+Test Module for HandEvaluator Class
+
+This module contains unit tests for the HandEvaluator class, including the
+values it computes and the behavior of its LRU cache.
+
+Classes:
+    TestHandEvaluator: A test class containing all unit tests for
+                       HandEvaluator.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import random
+import threading
+import unittest
+from card import Card, DECK, SUITS
+from evaluator import HandEvaluator, HandValue
+from hand import Hand
+
+
+class TestHandEvaluator(unittest.TestCase):
+    """
+    Test class for the HandEvaluator class.
+    """
+
+    def setUp(self):
+        """
+        Set up test fixtures before each test method.
+        """
+        self.hand = [Card.get('Ace', 'Hearts'), Card.get('Jack', 'Diamonds'),
+                     Card.get('3', 'Hearts'), Card.get('King', 'Spades'),
+                     Card.get('Little', 'Joker'), Card.get('9', 'Clubs')]
+
+    def test_values(self):
+        """Test the value of a hand for each trump suit."""
+        evaluator = HandEvaluator()
+        self.assertEqual(evaluator.evaluate(self.hand, 'Hearts'),
+                         HandValue('Hearts', 4, 17, 3, 6))
+        self.assertEqual(evaluator.evaluate(self.hand, 'Clubs'),
+                         HandValue('Clubs', 2, 11, 9, 1))
+        with self.assertRaises(ValueError):
+            evaluator.evaluate(self.hand, None)
+
+    def test_values_match_cards(self):
+        """Test computed values against Card.set_trump."""
+        evaluator = HandEvaluator()
+        rng = random.Random(4)
+        for _ in range(100):
+            cards = rng.sample(DECK, 6)
+            for suit, value in evaluator.evaluate_all(cards).items():
+                copies = [Card(card.name, card.suit) for card in cards]
+                for card in copies:
+                    card.set_trump(suit)
+                ranks = [card.rank for card in copies if card.is_trump()]
+                self.assertEqual(value.trump, suit)
+                self.assertEqual(value.trump_count, len(ranks))
+                self.assertEqual(value.high, max(ranks, default=None))
+                self.assertEqual(value.low, min(ranks, default=None))
+                self.assertEqual(value.points,
+                                 sum(card.points for card in copies))
+
+    def test_equivalent_hands_share_an_entry(self):
+        """Test that suit-equivalent hands hit the same cache entry."""
+        evaluator = HandEvaluator()
+        evaluator.evaluate(self.hand, 'Hearts')
+        swapped = [Card.get(card.name, {'Hearts': 'Diamonds',
+                                        'Diamonds': 'Hearts'}.get(card.suit,
+                                                                  card.suit))
+                   for card in self.hand]
+        self.assertEqual(evaluator.evaluate(swapped, 'Diamonds').points, 6)
+        stats = evaluator.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 1, 1))
+
+    def test_eviction(self):
+        """Test that the least recently used entries are evicted."""
+        evaluator = HandEvaluator(max_entries=2)
+        hands = [Hand([card]) for card in (Card.get('Ace', 'Spades'),
+                                           Card.get('King', 'Spades'),
+                                           Card.get('Queen', 'Spades'))]
+        evaluator.evaluate(hands[0], 'Spades')
+        evaluator.evaluate(hands[1], 'Spades')
+        evaluator.evaluate(hands[0], 'Spades')
+        evaluator.evaluate(hands[2], 'Spades')
+        evaluator.evaluate(hands[0], 'Spades')
+        stats = evaluator.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions,
+                          stats.entries), (2, 3, 1, 2))
+
+        evaluator.clear()
+        self.assertEqual(evaluator.stats(), (0, 0, 0, 0, 0))
+        with self.assertRaises(ValueError):
+            HandEvaluator(max_entries=0)
+
+    def test_memory_limit(self):
+        """Test that the cache stays within its memory limit."""
+        evaluator = HandEvaluator(max_bytes=2000)
+        rng = random.Random(5)
+        for _ in range(200):
+            evaluator.evaluate(rng.sample(DECK, 6), 'Spades')
+        stats = evaluator.stats()
+        self.assertLessEqual(stats.bytes, 2000)
+        self.assertGreater(stats.evictions, 0)
+        self.assertEqual(stats.hits + stats.misses, 200)
+
+    def test_thread_safety(self):
+        """Test concurrent evaluations from several threads."""
+        evaluator = HandEvaluator(max_entries=50)
+        rng = random.Random(6)
+        hands = [rng.sample(DECK, 6) for _ in range(100)]
+
+        def work():
+            for cards in hands:
+                for suit in SUITS:
+                    evaluator.evaluate(cards, suit)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = evaluator.stats()
+        self.assertEqual(stats.hits + stats.misses, 4 * 100 * len(SUITS))
+        self.assertLessEqual(stats.entries, 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""
+Test Module for the Fuzz Harness
+
+This module contains unit tests for the differential fuzz harness, with
+implementations that are broken on purpose.
+
+Classes:
+    TestFuzz: A test class containing all unit tests for the fuzz module.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import contextlib
+import io
+import random
+import unittest
+from card import Card, DECK
+import fuzz
+from fuzz import Case, Observation
+
+
+def jokers_stay_trump(codes, trumps):
+    """An implementation that keeps the jokers trump with no trump."""
+    observations = []
+    for trump in trumps:
+        entries = [Card.trump_table[DECK[code].short_name][trump or 'Spades']
+                   if DECK[code].suit == 'Joker' else
+                   Card.trump_table[DECK[code].short_name][trump]
+                   for code in codes]
+        observations.append(Observation(
+            is_trump=tuple(entry.is_trump for entry in entries)))
+    return observations
+
+
+def keeps_points(codes, trumps):
+    """An implementation that forgets to clear the points on a reset."""
+    points = [0] * len(codes)
+    observations = []
+    for trump in trumps:
+        for place, code in enumerate(codes):
+            if trump is not None:
+                points[place] = Card.trump_table[DECK[code].short_name][
+                    trump].points
+        observations.append(Observation(points=tuple(points)))
+    return observations
+
+
+def fails_on_jokers(codes, trumps):
+    """An implementation that raises on a joker, like a table without one."""
+    table = {code: Card.trump_table[card.short_name]
+             for code, card in enumerate(DECK) if card.suit != 'Joker'}
+    return [Observation(is_trump=tuple(table[code][trump].is_trump
+                                       for code in codes))
+            for trump in trumps]
+
+
+class TestFuzz(unittest.TestCase):
+    """
+    Test class for the fuzz module.
+    """
+
+    def test_registered_agree(self):
+        """Test that every registered fast path agrees with Card."""
+        for report in fuzz.fuzz(300, seed=1):
+            self.assertIsNone(report.disagreement, report.implementation)
+            self.assertEqual(report.cases, 300)
+            self.assertGreater(report.seconds, 0)
+            self.assertGreater(report.reference_seconds, 0)
+
+    def test_first_disagreement_is_shrunk(self):
+        """Test that a disagreement is found and reduced to a reproducer."""
+        fuzz.register('broken', jokers_stay_trump)
+        try:
+            report = fuzz.fuzz(200, seed=2, names=['broken'])[0]
+        finally:
+            del fuzz.IMPLEMENTATIONS['broken']
+        found = report.disagreement
+        self.assertEqual(found.field, 'is_trump')
+        self.assertEqual(len(found.case.codes), 1)
+        self.assertEqual(found.case.trumps, (None,))
+        joker = DECK[found.case.codes[0]]
+        self.assertEqual(joker.suit, 'Joker')
+        self.assertIn(joker.short_name, fuzz.format_disagreement(found))
+
+    def test_exception_is_a_disagreement(self):
+        """Test that an implementation that raises is reported, not run."""
+        fuzz.register('raises', fails_on_jokers)
+        try:
+            report = fuzz.fuzz(200, seed=2, names=['raises'])[0]
+        finally:
+            del fuzz.IMPLEMENTATIONS['raises']
+        found = report.disagreement
+        self.assertEqual(found.field, 'exception')
+        self.assertIn('KeyError', found.actual)
+        self.assertEqual(len(found.case.codes), 1)
+        self.assertEqual(DECK[found.case.codes[0]].suit, 'Joker')
+        self.assertLess(report.cases, 200)
+        self.assertIn(DECK[found.case.codes[0]].short_name,
+                      fuzz.format_disagreement(found))
+
+    def test_stale_state(self):
+        """Test that state carried across set_trump(None) is caught."""
+        case = Case((0, 13), ('Spades', None, 'Hearts'))
+        found = fuzz.check(case, keeps_points, 'stale')
+        self.assertEqual((found.step, found.field), (1, 'points'))
+        small = fuzz.shrink(found, keeps_points)
+        self.assertEqual(small.case, Case((0,), ('Spades', None)))
+
+    def test_errors(self):
+        """Test implementations that fail or return the wrong shape."""
+        def fails(codes, trumps):
+            raise KeyError(codes)
+
+        case = Case((1, 2), ('Clubs',))
+        self.assertEqual(fuzz.check(case, fails).field, 'exception')
+        self.assertEqual(fuzz.check(case, lambda codes, trumps: []).field,
+                         'length')
+        with self.assertRaises(ValueError):
+            fuzz.fuzz(10, names=['missing'])
+
+    def test_random_case(self):
+        """Test that cases depend only on the seed."""
+        rng = random.Random(3)
+        first = [fuzz.random_case(rng) for _ in range(5)]
+        rng = random.Random(3)
+        second = [fuzz.random_case(rng) for _ in range(5)]
+        self.assertEqual(first, second)
+        for case in first:
+            self.assertEqual(len(set(case.codes)), len(case.codes))
+            self.assertTrue(case.trumps)
+
+    def test_command_line(self):
+        """Test the command line exit status."""
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(fuzz.main(['--cases', '50', 'codes']), 0)
+            with self.assertRaises(SystemExit):
+                fuzz.main(['missing'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""
+Test Module for Game Log Ingestion
+
+This module contains unit tests for parsing, streaming and aggregating
+archived hands.
+
+Classes:
+    TestGameLog: A test class containing all unit tests for the game_log
+                 module.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import os
+import tempfile
+import unittest
+from card import Card, DECK
+import card_codes
+from deck import Deck
+import game_log
+from game_log import GameRecord
+
+
+def make_records(count, seed):
+    """Returns records of random deals played out one card per seat."""
+    records = []
+    for number, hands in enumerate(Deck(seed).deal(tables=count).tolist()):
+        records.append(GameRecord(card_codes.TRUMP_SUITS[number % 5],
+                                  number % 4,
+                                  tuple(tuple(trick) for trick in zip(*hands))))
+    return records
+
+
+class TestGameLog(unittest.TestCase):
+    """
+    Test class for the game_log module.
+    """
+
+    def setUp(self):
+        """Set up a temporary directory and some records."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.records = make_records(60, 19)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def path(self, name):
+        """Returns a path in the temporary directory."""
+        return os.path.join(self.directory.name, name)
+
+    def test_parse(self):
+        """Test parsing every card, padded and not."""
+        for code, card in enumerate(DECK):
+            self.assertEqual(game_log.parse_code(str(card)), code)
+            self.assertEqual(game_log.parse_code(card.short_name), code)
+            self.assertIs(game_log.parse_card(f" {card.short_name} "), card)
+        self.assertEqual(game_log.parse_card(' A♠'), Card('Ace', 'Spades'))
+        with self.assertRaises(ValueError):
+            game_log.parse_code(' Z♠')
+
+    def test_round_trip(self):
+        """Test writing and reading both formats."""
+        game_log.write_jsonl(self.path('hands.jsonl'), self.records)
+        game_log.write_csv(self.path('hands.csv'), self.records)
+        self.assertEqual(list(game_log.read_jsonl(self.path('hands.jsonl'))),
+                         self.records)
+        self.assertEqual(list(game_log.read_csv(self.path('hands.csv'))),
+                         self.records)
+
+    def test_chunks(self):
+        """Test that chunks read every record exactly once."""
+        for name, write, read in (('hands.jsonl', game_log.write_jsonl,
+                                   game_log.read_jsonl),
+                                  ('hands.csv', game_log.write_csv,
+                                   game_log.read_csv)):
+            path = self.path(name)
+            write(path, self.records)
+            for chunk_size in (1, 97, 1000, 1 << 20):
+                records = [record for start, end in
+                           game_log.chunk_ranges(path, chunk_size)
+                           for record in read(path, start, end)]
+                self.assertEqual(records, self.records)
+
+    def test_aggregate(self):
+        """Test the aggregators against counting the records directly."""
+        results = game_log.aggregate(self.records)
+        trumps = results['trumps'].result()
+        self.assertAlmostEqual(trumps['Spades'], 12 / 60)
+        self.assertAlmostEqual(sum(trumps.values()), 1)
+
+        spades = [record for record in self.records
+                  if record.trump == 'Spades']
+        points = sum(int(card_codes.POINTS_TABLE[0, code])
+                     for record in spades for trick in record.tricks
+                     for code in trick)
+        spade_results = game_log.aggregate(spades)
+        self.assertAlmostEqual(
+            sum(spade_results['points'].result().values()), points / 12)
+        self.assertEqual(sum(spade_results['points'].points.values()), points)
+
+        wins = results['wins']
+        self.assertEqual(sum(wins.hands.values()), 60)
+        for team_0, team_1 in wins.result().values():
+            self.assertLessEqual(team_0 + team_1, 1)
+
+    def test_ingest(self):
+        """Test that chunking and workers do not change the results."""
+        game_log.write_jsonl(self.path('a.jsonl'), self.records[:25])
+        game_log.write_csv(self.path('b.csv'), self.records[25:])
+        expected = game_log.aggregate(self.records)
+        for workers, chunk_size in ((1, 1 << 20), (1, 500), (2, 500)):
+            results = game_log.ingest([self.path('a.jsonl'),
+                                       self.path('b.csv')],
+                                      workers=workers, chunk_size=chunk_size)
+            for name, aggregator in expected.items():
+                self.assertEqual(results[name].result(), aggregator.result())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+"""
+Test Module for Hand Class
+
+This module contains unit tests for the Hand class, including set operations,
+iteration order, trump counts and trump points, and for the SortedHand class.
+
+Classes:
+    TestHand: A test class containing all unit tests for the Hand class.
+    TestSortedHand: A test class containing all unit tests for the
+                    SortedHand class.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import random
+import unittest
+from card import Card, DECK, SUITS
+from hand import Hand, SortedHand, FULL_MASK
+
+
+class TestHand(unittest.TestCase):
+    """
+    Test class for the Hand class.
+    """
+
+    def setUp(self):
+        """
+        Set up test fixtures before each test method.
+        """
+        self.cards = [Card.get('Ace', 'Spades'), Card.get('Jack', 'Clubs'),
+                      Card.get('3', 'Spades'), Card.get('King', 'Hearts'),
+                      Card.get('Big', 'Joker'), Card.get('10', 'Diamonds')]
+        self.hand = Hand(self.cards)
+
+    def test_membership_and_length(self):
+        """Test len, bool and membership."""
+        self.assertEqual(len(self.hand), 6)
+        self.assertTrue(self.hand)
+        self.assertFalse(Hand())
+        self.assertIn(Card('A', 'Spades'), self.hand)
+        self.assertNotIn(Card.get('Ace', 'Hearts'), self.hand)
+        self.assertNotIn(Card('X', 'Spades'), self.hand)
+
+    def test_iteration_in_rank_order(self):
+        """Test that iteration yields the cards from highest to lowest rank."""
+        self.assertEqual([str(card) for card in self.hand],
+                         [' A♠', ' K♥', ' J♣', ' BJ', '10♦', ' 3♠'])
+        self.assertEqual(str(self.hand), ' A♠  K♥  J♣  BJ 10♦  3♠')
+
+    def test_set_operations(self):
+        """Test union, intersection, difference, add and remove."""
+        other = Hand([Card.get('Ace', 'Spades'), Card.get('2', 'Clubs')])
+        self.assertEqual(len(self.hand | other), 7)
+        self.assertEqual(list(self.hand & other), [Card.get('Ace', 'Spades')])
+        self.assertEqual(len(self.hand - other), 5)
+        self.assertEqual(self.hand.add(Card.get('2', 'Clubs')) - other,
+                         self.hand.remove(Card.get('Ace', 'Spades')))
+        with self.assertRaises(KeyError):
+            self.hand.remove(Card.get('2', 'Clubs'))
+        self.assertEqual(hash(self.hand), hash(Hand(reversed(self.cards))))
+        for operation in ('__or__', '__and__', '__sub__'):
+            self.assertIs(getattr(self.hand, operation)(3), NotImplemented)
+        with self.assertRaises(TypeError):
+            _ = self.hand | 3
+
+    def test_masks_and_codes(self):
+        """Test conversions between masks, codes and hands."""
+        self.assertEqual(Hand.from_codes(self.hand.codes()), self.hand)
+        self.assertEqual(Hand.from_mask(self.hand.mask), self.hand)
+        self.assertEqual(len(Hand.from_mask(FULL_MASK)), len(DECK))
+        with self.assertRaises(ValueError):
+            Hand.from_mask(FULL_MASK + 1)
+
+    def test_trump_counts_and_points(self):
+        """Test trump counts and points against Card.set_trump."""
+        rng = random.Random(7)
+        for _ in range(200):
+            cards = rng.sample(DECK, 6)
+            hand = Hand(cards)
+            for suit in SUITS:
+                copies = [Card(card.name, card.suit) for card in cards]
+                for card in copies:
+                    card.set_trump(suit)
+                self.assertEqual(hand.trump_count(suit),
+                                 sum(card.is_trump() for card in copies))
+                self.assertEqual(hand.trump_points(suit),
+                                 sum(card.points for card in copies))
+                self.assertEqual(len(hand.trumps(suit)), hand.trump_count(suit))
+
+        self.assertEqual(self.hand.trump_count('Spades'), 4)
+        self.assertEqual(self.hand.trump_points('Spades'), 6)
+        self.assertEqual(self.hand.trump_count(None), 0)
+        self.assertEqual(Hand(DECK).trump_points('Hearts'), 10)
+
+
+class TestSortedHand(unittest.TestCase):
+    """
+    Test class for the SortedHand class.
+    """
+
+    def setUp(self):
+        """
+        Set up test fixtures before each test method.
+        """
+        self.cards = [Card.get('4', 'Hearts'), Card.get('Ace', 'Spades'),
+                      Card.get('Jack', 'Diamonds'), Card.get('King', 'Clubs'),
+                      Card.get('Little', 'Joker'), Card.get('4', 'Spades'),
+                      Card.get('2', 'Hearts')]
+
+    def test_sorted_order(self):
+        """Test that cards are sorted by rank, then base rank, then deck."""
+        hand = SortedHand(self.cards, 'Hearts')
+        self.assertEqual(str(hand), ' 4♠  K♣  A♠  2♥  4♥  LJ  J♦')
+        self.assertEqual(len(hand), 7)
+        self.assertIs(hand[-1], Card.get('Jack', 'Diamonds'))
+        # The order does not depend on the order the cards were given in
+        self.assertEqual(list(SortedHand(reversed(self.cards), 'Hearts')),
+                         list(hand))
+
+    def test_insert_and_remove(self):
+        """Test that inserts and removals keep the hand sorted."""
+        hand = SortedHand([], 'Spades')
+        for card in self.cards:
+            hand.insert(card)
+        self.assertEqual(list(hand), sorted(self.cards,
+                                            key=lambda c: c.sort_key('Spades')))
+        hand.remove(Card('Ace', 'Spades'))
+        self.assertNotIn(Card.get('Ace', 'Spades'), hand)
+        self.assertIn(Card.get('4', 'Spades'), hand)
+        with self.assertRaises(ValueError):
+            hand.remove(Card.get('Ace', 'Spades'))
+
+    def test_highest_and_lowest_trump(self):
+        """Test the trump queries for every trump suit."""
+        hand = SortedHand(self.cards, 'Hearts')
+        self.assertIs(hand.highest_trump(), Card.get('Jack', 'Diamonds'))
+        self.assertIs(hand.lowest_trump(), Card.get('2', 'Hearts'))
+        hand.set_trump('Spades')
+        self.assertIs(hand.highest_trump(), Card.get('Ace', 'Spades'))
+        self.assertIs(hand.lowest_trump(), Card.get('4', 'Spades'))
+        hand.set_trump(None)
+        self.assertIsNone(hand.highest_trump())
+        self.assertIsNone(hand.lowest_trump())
+        no_trump = SortedHand([Card.get('King', 'Clubs')], 'Hearts')
+        self.assertIsNone(no_trump.highest_trump())
+        self.assertIsNone(no_trump.lowest_trump())
+
+    def test_matches_card_trump(self):
+        """Test the trump queries against Card.set_trump on random hands."""
+        rng = random.Random(9)
+        for _ in range(100):
+            cards = rng.sample(DECK, 6)
+            for suit in SUITS:
+                hand = SortedHand(cards, suit)
+                trumps = [card for card in cards if card.is_trump(suit)]
+                ranks = {card: Card.trump_table[card.short_name][suit].rank
+                         for card in trumps}
+                self.assertEqual(hand.highest_trump(),
+                                 max(trumps, key=ranks.get, default=None))
+                self.assertEqual(hand.lowest_trump(),
+                                 min(trumps, key=ranks.get, default=None))
+
+
+if __name__ == '__main__':
+    unittest.main()
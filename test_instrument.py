@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""
+Test Module for Card Instrumentation
+
+This module contains unit tests for counting and timing the Card methods.
+
+Classes:
+    TestInstrument: A test class containing all unit tests for the
+                    instrument module.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import json
+import threading
+import unittest
+from card import Card
+import instrument
+
+
+class TestInstrument(unittest.TestCase):
+    """
+    Test class for the instrument module.
+    """
+
+    def setUp(self):
+        """Clear the global metrics."""
+        instrument.global_metrics().reset()
+
+    def test_disabled_is_untouched(self):
+        """Test that turning instrumentation off restores the class."""
+        originals = {name: Card.__dict__[name] for name in instrument.METHODS}
+        reference = Card.card_reference
+        with instrument.instrument():
+            self.assertTrue(instrument.is_enabled())
+            self.assertIsNot(Card.__dict__['set_trump'],
+                             originals['set_trump'])
+        self.assertFalse(instrument.is_enabled())
+        for name, attribute in originals.items():
+            self.assertIs(Card.__dict__[name], attribute)
+        self.assertIs(Card.card_reference, reference)
+
+        Card('Ace', 'Spades').set_trump('Hearts')
+        self.assertEqual(instrument.global_metrics().calls['set_trump'], 0)
+        with self.assertRaises(RuntimeError):
+            instrument.disable()
+
+    def test_counts(self):
+        """Test counting calls and lookups inside a block."""
+        with instrument.instrument() as metrics:
+            card = Card('Jack', 'Clubs')
+            for suit in ('Spades', 'Hearts', None):
+                card.set_trump(suit)
+            _ = card < Card('Ace', 'Spades')
+            card.desc()
+        self.assertEqual(metrics.calls['set_trump'], 3)
+        self.assertEqual(metrics.calls['get_trump_entry'], 3)
+        self.assertEqual(metrics.calls['__init__'], 2)
+        self.assertEqual(metrics.calls['__lt__'], 1)
+        self.assertGreaterEqual(metrics.calls[instrument.LOOKUP], 1)
+        self.assertGreater(metrics.nanoseconds['set_trump'], 0)
+
+        # The results are unchanged by instrumentation
+        self.assertEqual(card.state(), Card('Jack', 'Clubs').state())
+
+    def test_snapshot(self):
+        """Test exporting the metrics as plain data."""
+        with instrument.instrument() as metrics:
+            str(Card.get('10', 'Hearts'))
+        self.assertEqual(metrics.calls['get'], 1)
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot['__str__']['calls'], 1)
+        self.assertGreater(snapshot['__str__']['seconds'], 0)
+        self.assertEqual(json.loads(json.dumps(snapshot)), snapshot)
+
+    def test_nesting(self):
+        """Test that inner blocks add their metrics to outer blocks."""
+        with instrument.instrument() as outer:
+            Card.get('2', 'Spades').is_trump('Spades')
+            with instrument.instrument() as inner:
+                Card.get('2', 'Spades').is_trump('Clubs')
+            self.assertTrue(instrument.is_enabled())
+        self.assertEqual(inner.calls['is_trump'], 1)
+        self.assertEqual(outer.calls['is_trump'], 2)
+        self.assertEqual(instrument.global_metrics().calls['is_trump'], 2)
+
+    def test_threads(self):
+        """Test that blocks in different threads are kept apart."""
+        results = {}
+
+        def work(count):
+            with instrument.instrument() as metrics:
+                for _ in range(count):
+                    Card.get('King', 'Diamonds').get_trump_symbol('Hearts')
+            results[count] = metrics.calls['get_trump_symbol']
+
+        threads = [threading.Thread(target=work, args=(count,))
+                   for count in (10, 20, 30)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, {10: 10, 20: 20, 30: 30})
+        self.assertFalse(instrument.is_enabled())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+"""
+Test Module for the ISMCTS Module
+
+This module contains unit tests for the information set Monte Carlo tree
+search player.
+
+Classes:
+    TestIsmcts: A test class containing all unit tests for the ismcts module.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import multiprocessing
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from card import DECK
+from card_codes import CODES
+from engine import Engine, GreedyBot
+from hand import codes_to_mask
+from ismcts import IsmctsBot, Position, search
+from legal import follow_masks, legal_mask
+from rules import STANDARD
+
+SPADES = STANDARD.lists('Spades')
+DECK_MASK = codes_to_mask(range(len(DECK)))
+
+
+def position(hand, trick=(), leader=0, played=()):
+    """
+    Returns a Spades position for seat 0.
+
+    Args:
+        hand (list): The short names of seat 0's cards.
+        trick (list, optional): The short names of the current trick.
+        leader (int, optional): The seat that led the trick.
+        played (list, optional): The short names of the cards of earlier
+               tricks.
+    """
+    return Position(0, codes_to_mask(CODES[name] for name in hand), 'Spades',
+                    leader, tuple(CODES[name] for name in trick),
+                    codes_to_mask(CODES[name] for name in played), (0, 0),
+                    DECK_MASK,
+                    tuple(SPADES.rank), tuple(SPADES.points),
+                    follow_masks('Spades'))
+
+
+class TestIsmcts(unittest.TestCase):
+    """
+    Test class for the ismcts module.
+    """
+
+    def test_takes_points(self):
+        """Test that the search overtrumps an opponent's 10 with the Ace."""
+        # Four tricks played; seat 3 is winning this one with the 10
+        played = ['A♥', 'K♥', 'Q♥', 'J♥', '10♥', '9♥', '8♥', '7♥', '6♥', '5♥',
+                  '4♥', '3♥', '2♥', 'A♣', 'K♣', 'Q♣']
+        result = search(position(['A♠', '2♠'], ['K♦', '7♦', '10♠'], 1,
+                                 played), iterations=2000, seed=1)
+        self.assertEqual(DECK[result.move].short_name, 'A♠')
+        self.assertEqual(result.playouts, 2000)
+        self.assertEqual(sum(result.visits.values()), 2000)
+        self.assertGreater(result.values[CODES['A♠']],
+                           result.values[CODES['2♠']])
+
+    def test_legal_moves(self):
+        """Test that only legal cards are searched."""
+        hand = ['K♠', 'J♣', '7♦', '8♦', '9♥', '4♣']
+        start = position(hand, ['Q♠'], 3)
+        result = search(start, iterations=300, seed=2)
+        legal = legal_mask(start.hand, CODES['Q♠'], 'Spades')
+        self.assertEqual(codes_to_mask(result.visits), legal)
+        self.assertEqual(set(result.visits), {CODES['K♠'], CODES['J♣']})
+
+    def test_reproducible(self):
+        """Test that an iteration budget gives the same search for a seed."""
+        start = position(['A♠', 'K♦', '7♥', '8♣', 'BJ', '3♠'])
+        first = search(start, iterations=500, seed=3)
+        self.assertEqual(first, search(start, iterations=500, seed=3)._replace(
+            seconds=first.seconds,
+            playouts_per_second=first.playouts_per_second))
+        parallel = search(start, iterations=500, workers=2, seed=3)
+        self.assertEqual(parallel.playouts, 500)
+        self.assertEqual(parallel.visits, search(
+            start, iterations=500, workers=2, seed=3).visits)
+
+    def test_time_limit(self):
+        """Test searching for a time budget."""
+        start = position(['A♠', 'K♦', '7♥', '8♣', 'BJ', '3♠'])
+        result = search(start, time_limit=0.05, seed=4)
+        self.assertGreater(result.playouts, 0)
+        self.assertLess(result.seconds, 1)
+        self.assertGreater(result.playouts_per_second, 0)
+        with self.assertRaises(ValueError):
+            search(start)
+
+    def test_search_on_a_pool(self):
+        """Test that a pool passed in gives the same search and stays open."""
+        start = position(['A♠', 'K♦', '7♥', '8♣', 'BJ', '3♠'])
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            pooled = search(start, iterations=400, workers=2, seed=6,
+                            pool=pool)
+            again = search(start, iterations=400, workers=2, seed=6,
+                           pool=pool)
+        fresh = search(start, iterations=400, workers=2, seed=6)
+        self.assertEqual(pooled.visits, fresh.visits)
+        self.assertEqual(again.visits, fresh.visits)
+
+    def test_bot_pools(self):
+        """Test that parallel bots close their own pools and not shared ones."""
+        def factory(pool):
+            def make(table, seat):
+                if seat % 2:
+                    return GreedyBot()
+                return IsmctsBot(iterations=100, workers=2, pool=pool,
+                                 seed=table * 4 + seat)
+            return make
+
+        before = set(multiprocessing.active_children())
+        results = Engine(factory(None), workers=2).run_sync(2, seed=6)
+        self.assertEqual(len(results), 2)
+        self.assertTrue(set(multiprocessing.active_children()) <= before)
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            shared = Engine(factory(pool), workers=2).run_sync(2, seed=6)
+            self.assertEqual(pool.submit(int).result(), 0)
+        self.assertEqual(shared, results)
+
+    def test_bot(self):
+        """Test the bot playing whole tables against greedy bots."""
+        bots = []
+
+        def factory(table, seat):
+            if seat % 2:
+                return GreedyBot()
+            bots.append(IsmctsBot(iterations=100, seed=table * 4 + seat))
+            return bots[-1]
+
+        runner = Engine(factory, workers=2)
+        results = runner.run_sync(4, seed=5)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(runner.throughput.errors, 0)
+        self.assertTrue(all(bot.playouts_per_second() > 0 for bot in bots))
+
+
+if __name__ == '__main__':
+    unittest.main()
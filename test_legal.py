@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+"""
+Test Module for Legal Moves
+
+This module contains unit tests for the legal move functions, checked against
+working out the legal plays one Card at a time.
+
+Classes:
+    TestLegal: A test class containing all unit tests for legal moves.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import unittest
+import numpy as np
+from card import Card
+import card_codes
+from deck import Deck
+from hand import Hand, TRUMP_MASKS
+from legal import (follow_masks, legal_codes, legal_mask,
+                   legal_masks, legal_moves, legal_moves_by_card)
+from rules import Ruleset
+
+
+def hand_of(*short_names):
+    """Returns the codes of the cards with the given short names."""
+    return [card_codes.CODES[name] for name in short_names]
+
+
+class TestLegal(unittest.TestCase):
+    """
+    Test class for the legal module.
+    """
+
+    def test_follow_suit(self):
+        """Test following a non-trump lead."""
+        hand = hand_of('K♦', '4♦', '9♠', '5♣')
+        led = Card.get('Ace', 'Diamonds')
+        self.assertEqual(legal_moves(hand, led, 'Spades'),
+                         hand_of('K♦', '4♦', '9♠'))
+        self.assertEqual(legal_moves(hand, led, 'Hearts'),
+                         hand_of('K♦', '4♦'))
+
+    def test_cannot_follow(self):
+        """Test that a player who cannot follow may play any card."""
+        hand = hand_of('K♦', '9♠', '5♣')
+        self.assertEqual(legal_moves(hand, Card.get('2', 'Hearts'), 'Clubs'),
+                         hand)
+
+    def test_trump_lead(self):
+        """Test that trump must follow a trump lead, jokers included."""
+        hand = hand_of('K♦', 'BJ', '5♣')
+        self.assertEqual(legal_moves(hand, Card.get('3', 'Clubs'), 'Clubs'),
+                         hand_of('BJ', '5♣'))
+        self.assertEqual(legal_moves(hand, Card.get('Big', 'Joker'),
+                                     'Diamonds'),
+                         hand_of('K♦', 'BJ'))
+
+    def test_off_jack(self):
+        """Test that the off jack is trump and not its own suit."""
+        hand = hand_of('J♣', '4♦')
+        # A Clubs lead cannot be followed with the off jack, but it may
+        # be played as trump
+        self.assertEqual(legal_moves(hand, Card.get('Ace', 'Clubs'), 'Spades'),
+                         hand)
+        self.assertEqual(legal_moves(hand, Card.get('4', 'Spades'), 'Spades'),
+                         hand_of('J♣'))
+        # Led as trump, the off jack must be followed with trump
+        self.assertEqual(legal_moves(hand_of('2♣', '9♠', '4♦'),
+                                     Card.get('Jack', 'Clubs'), 'Spades'),
+                         hand_of('9♠'))
+        ace = card_codes.CODES['A♣']
+        clubs = follow_masks('Spades').follow[ace]
+        self.assertFalse(clubs >> card_codes.CODES['J♣'] & 1)
+        self.assertTrue(follow_masks('Hearts').follow[ace] >>
+                        card_codes.CODES['J♣'] & 1)
+
+    def test_leading(self):
+        """Test that a leader may play any card."""
+        hand = Hand.from_codes(hand_of('J♣', '4♦', 'LJ'))
+        self.assertEqual(legal_moves(hand, None, 'Hearts'), hand)
+        self.assertEqual(legal_moves(hand.mask, card_codes.NO_PLAY, None),
+                         hand.mask)
+
+    def test_hand_types(self):
+        """Test that Hands, masks and codes give the same plays."""
+        codes = hand_of('K♦', '4♦', '9♠', '5♣')
+        led = card_codes.CODES['A♦']
+        expected = Hand.from_codes(legal_moves(codes, led, 'Spades'))
+        self.assertEqual(legal_moves(Hand.from_codes(codes), led, 'Spades'),
+                         expected)
+        self.assertEqual(legal_mask(Hand.from_codes(codes).mask, led,
+                                    'Spades'), expected.mask)
+
+    def test_matches_cards(self):
+        """Test random hands against legal_moves_by_card."""
+        deals = Deck(14).deal(hands=2, cards=6, tables=1500)
+        rng = np.random.default_rng(14)
+        trumps = rng.integers(0, card_codes.NO_TRUMP + 1, len(deals))
+        for (hand, other), index in zip(deals.tolist(), trumps.tolist()):
+            trump = card_codes.TRUMP_SUITS[index]
+            led = card_codes.from_code(other[0])
+            expected = legal_moves_by_card(card_codes.from_codes(hand), led,
+                                           trump)
+            self.assertEqual(card_codes.from_codes(
+                legal_moves(hand, other[0], trump)), expected)
+
+    def test_ruleset(self):
+        """Test a variant without jokers against legal_moves_by_card."""
+        no_jokers = Ruleset.variant('no jokers', jokers=False)
+        deals = Deck(16).deal_remaining([52, 53], hands=2, cards=6,
+                                        tables=500)
+        for number, (hand, other) in enumerate(deals.tolist()):
+            trump = card_codes.TRUMP_SUITS[number % (card_codes.NO_TRUMP + 1)]
+            led = card_codes.from_code(other[0])
+            expected = legal_moves_by_card(card_codes.from_codes(hand), led,
+                                           trump, no_jokers)
+            self.assertEqual(card_codes.from_codes(
+                legal_moves(hand, other[0], trump, no_jokers)), expected)
+            self.assertEqual(legal_codes([hand], [other[0]], trump,
+                                         no_jokers).sum(), len(expected))
+        follow, ruff = follow_masks('Hearts', no_jokers)
+        self.assertEqual(follow[card_codes.NO_PLAY], 0)
+        # Without jokers, 14 cards are trump
+        self.assertEqual(ruff[card_codes.CODES['4♠']], TRUMP_MASKS['Hearts'] &
+                         ~Hand.from_codes(hand_of('BJ', 'LJ')).mask)
+        # Rulesets with the same deck share their compiled masks
+        self.assertIs(follow_masks('Hearts', Ruleset.variant(
+            'also no jokers', points={'A': 4}, jokers=False)).follow, follow)
+
+    def test_batches(self):
+        """Test that the batch functions agree with legal_mask."""
+        deals = Deck(15).deal(hands=2, cards=6, tables=1000)
+        codes = deals[:, 0, :].astype(np.intp)
+        leds = deals[:, 1, 0].astype(np.intp)
+        leds[::7] = card_codes.NO_PLAY
+        codes[::3, 2] = card_codes.NO_PLAY
+        trumps = np.arange(len(codes)) % (card_codes.NO_TRUMP + 1)
+        masks = [Hand.from_codes(code for code in hand
+                                 if code != card_codes.NO_PLAY).mask
+                 for hand in codes.tolist()]
+
+        expected = [legal_mask(mask, led, card_codes.TRUMP_SUITS[index])
+                    for mask, led, index in zip(masks, leds.tolist(),
+                                                trumps.tolist())]
+        self.assertEqual(legal_masks(masks, leds, trumps).tolist(), expected)
+        flags = legal_codes(codes, leds, trumps)
+        self.assertFalse(flags[::3, 2].any())
+        self.assertEqual([Hand.from_codes(codes[row][flags[row]]).mask
+                          for row in range(len(codes))], expected)
+
+    def test_invalid_input(self):
+        """Test that invalid codes and trump suits raise ValueError."""
+        with self.assertRaises(ValueError):
+            legal_mask(1, 55, 'Spades')
+        with self.assertRaises(ValueError):
+            legal_mask(1, 0, 'Stars')
+        with self.assertRaises(ValueError):
+            legal_masks([1], [56], 'Spades')
+        with self.assertRaises(ValueError):
+            legal_codes([1, 2], [0], 'Spades')
+
+
+if __name__ == '__main__':
+    unittest.main()
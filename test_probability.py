@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+"""
+Test Module for the Probability Module
+
+This module contains unit tests for the exact probabilities of where the
+unseen cards are, checked against enumerating every deal of a few unseen
+cards and against dealing many hands.
+
+Classes:
+    TestProbability: A test class containing all unit tests for the
+                     probability module.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import unittest
+from collections import Counter
+from fractions import Fraction
+from itertools import permutations
+from card import DECK
+import card_codes
+from deck import Deck
+from hand import Hand
+from probability import OPPONENTS, PARTNER, Unseen
+from rules import Ruleset
+
+HAND = ['A♠', 'K♠', '2♠', '7♦', '8♣', '9♥']
+# Six cards left unseen, for two hands of two cards and two undealt
+UNSEEN = ['Q♠', 'J♣', '3♠', 'BJ', '5♥', '4♦']
+
+
+def enumerate_deals(unseen):
+    """
+    Returns every equally likely deal of the unseen cards of small().
+
+    Args:
+        unseen (Unseen): The unseen cards.
+
+    Returns:
+        set: The deals, as tuples of the place of each unseen card.
+    """
+    places = [1, 1, 2, 2, 3, 3]
+    return set(permutations(places, len(unseen.unseen)))
+
+
+def small():
+    """
+    Returns an Unseen whose only unseen cards are UNSEEN.
+    """
+    known = {card_codes.CODES[name] for name in HAND + UNSEEN}
+    seen = [code for code in range(len(DECK)) if code not in known]
+    return Unseen(HAND, 'Spades', seen, hands=2, cards=2)
+
+
+class TestProbability(unittest.TestCase):
+    """
+    Test class for the probability module.
+    """
+
+    def test_against_enumeration(self):
+        """Test every query against enumerating the deals."""
+        unseen = small()
+        deals = enumerate_deals(unseen)
+        codes = unseen.unseen
+
+        def chance(event):
+            return Fraction(sum(1 for deal in deals if event(dict(
+                zip(codes, deal)))), len(deals))
+
+        queen, jack, three, big = (card_codes.CODES[name]
+                                   for name in ('Q♠', 'J♣', '3♠', 'BJ'))
+        self.assertEqual(
+            unseen.probability([queen, (three, big)], 1),
+            chance(lambda deal: deal[queen] == 1 or
+                   deal[three] == deal[big] == 1))
+        self.assertEqual(
+            unseen.probability(['J♣', 'Q♠'], (1, 2)),
+            chance(lambda deal: deal[jack] != 3 or deal[queen] != 3))
+        self.assertEqual(unseen.owners(jack), (0, Fraction(1, 3),
+                                               Fraction(1, 3), Fraction(1, 3)))
+
+        trumps = [code for code in codes
+                  if card_codes.IS_TRUMP_TABLE[0, code]]
+        split = Counter(tuple(sum(1 for code in trumps if deal[code] == place)
+                              for place in (1, 2))
+                        for deal in (dict(zip(codes, deal))
+                                     for deal in deals))
+        self.assertEqual(unseen.trump_split(),
+                         {key: Fraction(count, len(deals))
+                          for key, count in split.items()})
+        self.assertEqual(unseen.trump_length(1)[2],
+                         sum(value for key, value in
+                             unseen.trump_split().items() if key[0] == 2))
+
+        # The Ace is in the hand, so high is certain; the 2 is the lowest
+        self.assertEqual(unseen.high(), (1, 0, 0, 0))
+        self.assertEqual(unseen.low(), (1, 0, 0, 0))
+
+    def test_high_and_low(self):
+        """Test the high and low trump against enumeration."""
+        unseen = Unseen(['7♦', '8♣', '9♥', '6♦', '5♣', '4♠'], 'Spades')
+        self.assertEqual(sum(unseen.high()), 1)
+        self.assertEqual(sum(unseen.low()), 1)
+        # The 4 of trump is low unless the 3 or the 2 of trump is dealt
+        self.assertEqual(unseen.low()[0], 1 - unseen.probability(
+            ['3♠', '2♠'], (1, 2, 3)))
+        # The Big Joker is high whenever it is dealt
+        self.assertGreater(unseen.high()[1], Fraction(18, 48) / 3)
+
+        ranks = {code: card_codes.RANK_TABLE[0, code] for code in unseen.unseen}
+        trumps = [code for code in unseen.unseen
+                  if card_codes.IS_TRUMP_TABLE[0, code]]
+        dealt = Deck(1).deal_remaining(sorted(unseen.hand), tables=20000)
+        holders = Counter()
+        for table in dealt.tolist():
+            place = {code: seat + 1 for seat, hand in enumerate(table)
+                     for code in hand}
+            held = [code for code in trumps if code in place]
+            holders[place[max(held, key=ranks.get)] if held else 0] += 1
+        for seat in range(1, 4):
+            self.assertAlmostEqual(holders[seat] / 20000,
+                                   float(unseen.high()[seat]), delta=0.02)
+
+    def test_against_sampling(self):
+        """Test the opponents' chances against dealing many hands."""
+        hand = Hand.from_codes(card_codes.CODES[name] for name in HAND)
+        unseen = Unseen(hand, 'Spades')
+        exact = unseen.probability(['3♠', ('BJ', 'LJ')], OPPONENTS)
+        dealt = Deck(2).deal_remaining(hand.codes(), tables=20000)
+        three, big, little = (card_codes.CODES[name]
+                              for name in ('3♠', 'BJ', 'LJ'))
+        hits = 0
+        for table in dealt.tolist():
+            opponents = set(table[0]) | set(table[2])
+            hits += three in opponents or {big, little} <= opponents
+        self.assertAlmostEqual(hits / 20000, float(exact), delta=0.02)
+        self.assertEqual(sum(unseen.trump_split().values()), 1)
+        self.assertEqual(sum(unseen.trump_length(PARTNER).values()), 1)
+
+    def test_point_cards(self):
+        """Test the point cards for a trump suit and a ruleset."""
+        unseen = Unseen(HAND, 'Spades')
+        names = {DECK[code].short_name for code in unseen.point_cards()}
+        self.assertEqual(names, {'A♠', 'J♠', 'J♣', '10♠', '3♠', '2♠', 'BJ',
+                                 'LJ'})
+        self.assertEqual(unseen.point_cards()[card_codes.CODES['A♠']][0], 1)
+
+        variant = Ruleset.variant('no jokers', jokers=False)
+        unseen = Unseen(HAND, 'Spades', ruleset=variant)
+        self.assertEqual(len(unseen.unseen), 46)
+        with self.assertRaises(ValueError):
+            unseen.owners('BJ')
+
+    def test_known_cards(self):
+        """Test cards in the hand and cards out of play."""
+        unseen = Unseen(HAND, 'Spades', seen=['3♠'])
+        self.assertEqual(unseen.probability(['A♠'], 0), 1)
+        self.assertEqual(unseen.probability(['A♠'], OPPONENTS), 0)
+        self.assertEqual(unseen.probability(['3♠'], OPPONENTS), 0)
+        self.assertEqual(unseen.probability([('A♠', 'BJ')], (0, 1)),
+                         Fraction(6, 47))
+        with self.assertRaises(ValueError):
+            unseen.owners('3♠')
+        with self.assertRaises(ValueError):
+            unseen.probability(['Z♠'], 1)
+        with self.assertRaises(ValueError):
+            Unseen(HAND, 'Spades', hands=9)
+
+
+if __name__ == '__main__':
+    unittest.main()
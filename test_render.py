@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""
+Test Module for the Render Module
+
+This module contains unit tests for rendering hands, tricks and scores in
+bulk and reading compact lines back.
+
+Classes:
+    TestRender: A test class containing all unit tests for the render module.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import io
+import unittest
+from card import Card, DECK
+from card_codes import CODES, NO_PLAY
+from deck import Deck
+from hand import Hand
+from render import Formatter, HandLine, ScoreLine, TrickLine, parse
+from score import ScoreTracker
+
+
+class CountingStream(io.StringIO):
+    """A stream that counts its write() calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+class TestRender(unittest.TestCase):
+    """
+    Test class for the render module.
+    """
+
+    def setUp(self):
+        """Set up a hand, a trick and its score."""
+        self.hand = [CODES[name] for name in ('A♠', 'J♣', '10♦', '3♠')]
+        self.trick = [CODES[name] for name in ('A♠', 'K♠', '2♣', '9♠')]
+        self.tracker = ScoreTracker('Spades')
+        self.tracker.play(self.trick, 0)
+
+    def test_readable(self):
+        """Test the readable lines against str() of the cards."""
+        formatter = Formatter()
+        formatter.hand(self.hand, 0, 'Spades')
+        formatter.hand([DECK[code] for code in self.hand], 1, descs=True)
+        formatter.trick(self.trick, 1, 0, 0)
+        formatter.score(self.tracker.state)
+        formatter.line('end')
+        self.assertEqual(formatter.getvalue().splitlines(), [
+            'Seat 0 (Spades): ' + ' '.join(str(DECK[code])
+                                           for code in self.hand),
+            'Seat 1:  A♠ (Ace)  J♣ (Jack) 10♦ (10)  3♠ (3)',
+            'Trick 1 (lead 0):  A♠  K♠  2♣  9♠ -> seat 0',
+            'Score ' + str(self.tracker), 'end'])
+
+        formatter = Formatter()
+        formatter.hand(Hand.from_codes(self.hand), 2, 'Spades', descs=True)
+        self.assertIn('J♣ (Off Jack)', formatter.getvalue())
+        with self.assertRaises(ValueError):
+            formatter.hand(self.hand, 0, 'Stars')
+
+    def test_single_write(self):
+        """Test that a whole buffer is written with one call."""
+        formatter = Formatter()
+        for number, table in enumerate(Deck(1).deal(tables=50).tolist()):
+            for seat, hand in enumerate(table):
+                formatter.hand(hand, seat)
+            formatter.trick([hand[0] for hand in table], number)
+        stream = CountingStream()
+        formatter.write(stream)
+        self.assertEqual(stream.writes, 1)
+        self.assertEqual(len(stream.getvalue().splitlines()), 250)
+        self.assertEqual(formatter.getvalue(), '')
+
+    def test_compact_round_trip(self):
+        """Test that compact lines read back to the same cards."""
+        formatter = Formatter(compact=True)
+        formatter.hand(self.hand, 0, 'Spades')
+        formatter.hand([], 3)
+        formatter.trick(self.trick, 1, 0, 0)
+        formatter.trick([Card('Big', 'Joker')], 2, 3)
+        formatter.score(self.tracker.state)
+        formatter.score(ScoreTracker(None).state)
+        self.assertEqual(formatter.getvalue().splitlines()[:3], [
+            'H 0 Spades A♠,J♣,10♦,3♠', 'H 3 - -', 'T 1 0 0 A♠,K♠,2♣,9♠'])
+
+        state = self.tracker.state
+        records = list(parse(formatter.getvalue()))
+        self.assertEqual(records, [
+            HandLine(0, 'Spades', tuple(DECK[code] for code in self.hand)),
+            HandLine(3, None, ()),
+            TrickLine(1, 0, 0, tuple(DECK[code] for code in self.trick)),
+            TrickLine(2, 3, None, (DECK[CODES['BJ']],)),
+            ScoreLine(state.points, DECK[state.high], state.high_team,
+                      DECK[state.low], state.low_team),
+            ScoreLine((0, 0), None, None, None, None)])
+        self.assertIs(records[0].cards[0], DECK[CODES['A♠']])
+
+        for card in DECK:
+            formatter = Formatter(compact=True)
+            formatter.hand([card], 0)
+            self.assertIs(next(parse(formatter.getvalue())).cards[0], card)
+
+        with self.assertRaises(ValueError):
+            list(parse('X 1 2'))
+        with self.assertRaises(ValueError):
+            list(parse('H 0 Spades Z♠'))
+
+    def test_no_play(self):
+        """Test tricks with seats that have not played."""
+        cards = [CODES['A♠'], NO_PLAY, Card('_', 'Joker'), None]
+        formatter = Formatter()
+        formatter.trick(cards, 1)
+        self.assertEqual(formatter.getvalue(),
+                         'Trick 1 (lead 0):  A♠  --  --  --\n')
+
+        formatter = Formatter(compact=True)
+        formatter.trick(cards, 1)
+        self.assertEqual(formatter.getvalue(), 'T 1 0 - A♠,--,--,--\n')
+        record = next(parse(formatter.getvalue()))
+        self.assertEqual(record.cards, (DECK[CODES['A♠']], None, None, None))
+        # What parse() reads back renders the same again
+        again = Formatter(compact=True)
+        again.trick(record.cards, 1)
+        self.assertEqual(again.getvalue(), formatter.getvalue())
+
+        with self.assertRaises(ValueError):
+            formatter.trick([NO_PLAY + 1], 2)
+        with self.assertRaises(ValueError):
+            formatter.trick([Card('X', 'Spades')], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+"""
+Test Module for the Ruleset Class
+
+This module contains unit tests for validating and compiling rule variants,
+and for playing cards, hands and tricks under them.
+
+Classes:
+    TestRuleset: A test class containing all unit tests for the Ruleset
+                 class.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import copy
+import pickle
+import unittest
+import numpy as np
+from card import Card, DECK
+import card_codes
+from evaluator import HandEvaluator
+from rules import Ruleset, STANDARD
+from score import ScoreTracker
+from solver import Solver
+
+
+class TestRuleset(unittest.TestCase):
+    """
+    Test class for the Ruleset class.
+    """
+
+    def test_standard(self):
+        """Test that the standard rules compile to the existing tables."""
+        self.assertEqual(STANDARD.trump_table, Card.trump_table)
+        self.assertEqual(STANDARD.sort_keys, Card.sort_keys)
+        for table, expected in zip(STANDARD.tables,
+                                   (card_codes.SYMBOL_TABLE,
+                                    card_codes.RANK_TABLE,
+                                    card_codes.POINTS_TABLE,
+                                    card_codes.IS_TRUMP_TABLE)):
+            self.assertTrue(np.array_equal(table, expected))
+            self.assertFalse(table.flags.writeable)
+        self.assertEqual(len(STANDARD.deck), 54)
+
+    def test_variant(self):
+        """Test changing points and ranks of a variant."""
+        variant = Ruleset.variant('3 for 1', points={'3': 1},
+                                  ranks={'X': 18}, descs={'X': 'Left Bower'})
+        three = Card('3', 'Hearts')
+        three.set_trump('Hearts', variant)
+        self.assertEqual(three.points, 1)
+        three.set_trump('Hearts')
+        self.assertEqual(three.points, 3)
+
+        off_jack = Card('Jack', 'Diamonds')
+        off_jack.set_trump('Hearts', variant)
+        self.assertEqual((off_jack.symbol, off_jack.rank), ('X', 18))
+        self.assertEqual(off_jack.desc(variant), 'Left Bower')
+        self.assertEqual(off_jack.desc(STANDARD), 'Off Jack')
+        self.assertGreater(off_jack.sort_key('Hearts', variant),
+                           Card.get('Ace', 'Hearts').sort_key('Hearts',
+                                                              variant))
+        self.assertTrue(Card.get('Jack', 'Diamonds').is_trump('Hearts',
+                                                              variant))
+        # The aliases change with their symbol, and the class is untouched
+        self.assertEqual(variant.reference['1']['rank'],
+                         variant.reference['10']['rank'])
+        self.assertEqual(Card.card_reference['3']['points'], 3)
+        self.assertEqual(Card.card_reference['X']['rank'], 13)
+
+    def test_card_keeps_ruleset(self):
+        """Test that a card trumped under a variant keeps using it."""
+        variant = Ruleset.variant('bower', ranks={'X': 18},
+                                  descs={'X': 'Left Bower'})
+        off_jack = Card('Jack', 'Diamonds')
+        off_jack.set_trump('Hearts', variant)
+        self.assertIs(off_jack.ruleset, variant)
+        self.assertEqual(off_jack.desc(), 'Left Bower')
+        self.assertEqual(off_jack.sort_key(),
+                         off_jack.sort_key('Hearts', variant))
+        self.assertEqual(off_jack.get_trump_entry('Hearts').rank, 18)
+
+        copy = pickle.loads(pickle.dumps(off_jack))
+        self.assertEqual(copy.desc(), 'Left Bower')
+        self.assertEqual(copy.state()['rank'], 18)
+        self.assertIs(pickle.loads(pickle.dumps(STANDARD)), STANDARD)
+
+        # Setting trump without a ruleset goes back to the standard rules
+        off_jack.set_trump('Hearts')
+        self.assertIsNone(off_jack.ruleset)
+        self.assertEqual(off_jack.desc(), 'Off Jack')
+        self.assertEqual(off_jack.rank, 13)
+
+    def test_no_jokers(self):
+        """Test a variant played without jokers."""
+        variant = Ruleset.variant('no jokers', jokers=False)
+        self.assertEqual(len(variant.deck), 52)
+        self.assertNotIn(' BJ', variant.trump_table)
+        with self.assertRaises(ValueError):
+            Card('Big', 'Joker').set_trump('Spades', variant)
+        index = card_codes.trump_index('Spades')
+        self.assertEqual(int(variant.tables.points[index].sum()), 8)
+        self.assertFalse(variant.tables.is_trump[:, 52:].any())
+
+    def test_variants_side_by_side(self):
+        """Test scoring the same trick under two rulesets."""
+        low_three = Ruleset.variant('3 for 1', points={'3': 1})
+        trick = [Card.get('3', 'Spades'), Card.get('2', 'Spades'),
+                 Card.get('9', 'Spades'), Card.get('4', 'Hearts')]
+        standard, variant = ScoreTracker('Spades'), ScoreTracker('Spades',
+                                                                 low_three)
+        self.assertEqual(standard.play(trick), variant.play(trick))
+        self.assertEqual(standard.state.points, (4, 0))
+        self.assertEqual(variant.state.points, (2, 0))
+
+        hand = [Card.get('3', 'Clubs'), Card.get('Ace', 'Clubs')]
+        self.assertEqual(HandEvaluator().evaluate(hand, 'Clubs').points, 4)
+        self.assertEqual(HandEvaluator(ruleset=low_three).evaluate(
+            hand, 'Clubs').points, 2)
+
+        # A♠ takes 3♠, Q♦ and A♦
+        hands = [[0], [11], [15], [13]]
+        self.assertEqual(Solver('Spades').solve(hands).points, (4, 0))
+        self.assertEqual(Solver('Spades', ruleset=low_three).solve(
+            hands).points, (2, 0))
+
+    def test_invalid(self):
+        """Test that incomplete and inconsistent rules raise ValueError."""
+        def broken(change):
+            reference = copy.deepcopy(Card.card_reference)
+            change(reference)
+            return reference
+
+        for change in (lambda ref: ref.pop('X'),
+                       lambda ref: ref.pop('Big'),
+                       lambda ref: ref['A'].update(rank='17'),
+                       lambda ref: ref['A'].update(rank=300),
+                       lambda ref: ref['K'].update(rank=17),
+                       lambda ref: ref['Ace'].update(points=2),
+                       lambda ref: ref['N'].update(rank=5),
+                       lambda ref: ref['N'].update(points=1),
+                       lambda ref: ref['Q'].update(fullname='Queenie')):
+            with self.assertRaises(ValueError):
+                Ruleset('broken', broken(change))
+        # Jokers may be left out of a deck without them
+        Ruleset('no jokers', broken(lambda ref: [ref.pop(key) for key in
+                                                 ('Big', 'B', 'Little', 'L')]),
+                jokers=False)
+        with self.assertRaises(ValueError):
+            Ruleset.variant('bad', points={'Z': 1})
+        self.assertEqual(len(DECK), 54)
+
+
+if __name__ == '__main__':
+    unittest.main()
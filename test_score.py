@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""
+Test Module for the ScoreTracker Class
+
+This module contains unit tests for the ScoreTracker class, checked against
+summing card points over the captured piles.
+
+Classes:
+    TestScoreTracker: A test class containing all unit tests for the
+                      ScoreTracker class.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import unittest
+from card import Card, SUITS
+import card_codes
+from deck import Deck
+from score import ScoreTracker
+from tricks import resolve_tricks
+
+
+class TestScoreTracker(unittest.TestCase):
+    """
+    Test class for the ScoreTracker class.
+    """
+
+    def test_take(self):
+        """Test scoring one trick."""
+        tracker = ScoreTracker('Spades')
+        state = tracker.take([Card.get('Ace', 'Spades'),
+                              Card.get('Jack', 'Clubs'),
+                              Card.get('3', 'Spades'),
+                              Card.get('King', 'Hearts')], 1)
+        self.assertEqual(state.points, (0, 5))
+        self.assertEqual(card_codes.from_code(state.high),
+                         Card.get('Ace', 'Spades'))
+        self.assertEqual(card_codes.from_code(state.low),
+                         Card.get('3', 'Spades'))
+        self.assertEqual((state.high_team, state.low_team), (1, 1))
+        self.assertEqual(tracker.captured_by('X'), 1)
+        self.assertIsNone(tracker.captured_by('J'))
+        self.assertEqual(state.tricks, 1)
+        self.assertEqual(str(tracker), "0-5 high A♠ low 3♠")
+
+    def test_play(self):
+        """Test that play() finds the winner like resolve_tricks()."""
+        tracker = ScoreTracker('Hearts')
+        trick = [Card.get('4', 'Clubs'), Card.get('Little', 'Joker'),
+                 Card.get('Jack', 'Diamonds'), Card.get('2', 'Hearts')]
+        # The off jack, third card played, wins for seat 1
+        self.assertEqual(tracker.play(trick, leader=3), 1)
+        self.assertEqual(tracker.state.points, (0, 3))
+        self.assertEqual(tracker.captured_by('L'), 1)
+        self.assertEqual(tracker.captured_by('X'), 1)
+
+    def test_matches_captured_piles(self):
+        """Test full hands against summing points over the piles."""
+        for number, hands in enumerate(Deck(16).deal(tables=50).tolist()):
+            trump = SUITS[number % len(SUITS)]
+            tricks = [list(trick) for trick in zip(*hands)]
+            winners = resolve_tricks(tricks, trump).winner.tolist()
+            tracker = ScoreTracker(trump)
+            piles = ([], [])
+            for trick, winner in zip(tricks, winners):
+                tracker.take(trick, winner)
+                piles[winner % 2].extend(card_codes.from_codes(trick))
+
+            expected = tuple(sum(card.get_trump_entry(trump).points
+                                 for card in pile) for pile in piles)
+            self.assertEqual(tracker.state.points, expected)
+            trumps = [code for trick in tricks for code in trick
+                      if card_codes.IS_TRUMP_TABLE[
+                          card_codes.trump_index(trump), code]]
+            ranks = card_codes.RANK_TABLE[card_codes.trump_index(trump)]
+            if trumps:
+                self.assertEqual(tracker.state.high,
+                                 max(trumps, key=ranks.__getitem__))
+                self.assertEqual(tracker.state.low,
+                                 min(trumps, key=ranks.__getitem__))
+            else:
+                self.assertIsNone(tracker.state.high)
+
+    def test_undo(self):
+        """Test that undo() takes back tricks one at a time."""
+        hands = Deck(17).deal().tolist()[0]
+        tracker = ScoreTracker('Diamonds')
+        states = [tracker.snapshot()]
+        for trick in zip(*hands):
+            tracker.play(list(trick))
+            states.append(tracker.snapshot())
+        for state in reversed(states[:-1]):
+            self.assertEqual(tracker.undo(), state)
+        with self.assertRaises(IndexError):
+            tracker.undo()
+
+    def test_snapshot_restore(self):
+        """Test restoring a checkpoint."""
+        hands = Deck(18).deal().tolist()[0]
+        tricks = [list(trick) for trick in zip(*hands)]
+        tracker = ScoreTracker('Clubs')
+        for trick in tricks[:3]:
+            tracker.play(trick)
+        checkpoint = tracker.snapshot()
+        for trick in tricks[3:]:
+            tracker.play(trick)
+        final = tracker.snapshot()
+
+        tracker.restore(checkpoint)
+        self.assertEqual(tracker.state, checkpoint)
+        with self.assertRaises(IndexError):
+            tracker.undo()
+        for trick in tricks[3:]:
+            tracker.play(trick)
+        self.assertEqual(tracker.state, final)
+
+    def test_invalid_input(self):
+        """Test that invalid seats, codes and symbols raise ValueError."""
+        tracker = ScoreTracker('Spades')
+        with self.assertRaises(ValueError):
+            tracker.take([0, 1, 2, 3], 4)
+        with self.assertRaises(ValueError):
+            tracker.take([0, 1, 2, 60], 0)
+        with self.assertRaises(ValueError):
+            tracker.captured_by('Q')
+        with self.assertRaises(ValueError):
+            ScoreTracker('Stars')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Test Module for Shared Hands
+
+This module contains unit tests for passing arrays of card codes to worker
+processes through shared memory.
+
+Classes:
+    TestShared: A test class containing all unit tests for the shared module.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from deck import Deck
+from shared import SharedHands, attach
+
+
+def table_total(descriptor, table):
+    """Returns the sum of the card codes of one table, read in a worker."""
+    with attach(descriptor) as codes:
+        return int(codes[table].sum())
+
+
+class TestShared(unittest.TestCase):
+    """
+    Test class for the shared module.
+    """
+
+    def test_attach(self):
+        """Test reading the shared array through its descriptor."""
+        codes = Deck(21).deal(tables=50)
+        with SharedHands(codes) as shared:
+            self.assertTrue(np.array_equal(shared.array, codes))
+            self.assertLess(len(pickle.dumps(shared.descriptor)), 200)
+            with attach(shared.descriptor) as view:
+                self.assertTrue(np.array_equal(view, codes))
+                self.assertFalse(view.flags.writeable)
+                # The owner's writes are seen by the view
+                shared.array[0, 0, 0] = 53
+                self.assertEqual(view[0, 0, 0], 53)
+
+    def test_workers(self):
+        """Test reading the shared array in worker processes."""
+        codes = Deck(22).deal(tables=40)
+        with SharedHands(codes) as shared:
+            with ProcessPoolExecutor(max_workers=2) as pool:
+                totals = list(pool.map(table_total,
+                                       [shared.descriptor] * len(codes),
+                                       range(len(codes))))
+        self.assertEqual(totals, codes.sum(axis=(1, 2)).tolist())
+
+    def test_close(self):
+        """Test that a closed block can no longer be attached."""
+        shared = SharedHands(np.arange(10, dtype=np.uint8))
+        shared.close()
+        shared.close()
+        with self.assertRaises(FileNotFoundError):
+            with attach(shared.descriptor):
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
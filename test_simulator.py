@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""
+Test Module for the Monte Carlo Simulator
+
+This module contains unit tests for playing out deals and for the Monte Carlo
+estimate of a hand's score.
+
+Classes:
+    TestSimulator: A test class containing all unit tests for the simulator.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import unittest
+from card import Card
+import card_codes
+import simulator
+
+
+def codes(*cards):
+    """Returns the codes of the given (name, suit) pairs."""
+    return [card_codes.to_code(Card.get(name, suit)) for name, suit in cards]
+
+
+class TestSimulator(unittest.TestCase):
+    """
+    Test class for the simulator module.
+    """
+
+    def setUp(self):
+        """
+        Set up test fixtures before each test method.
+        """
+        self.strong = [Card.get('Ace', 'Spades'), Card.get('Jack', 'Spades'),
+                       Card.get('Jack', 'Clubs'), Card.get('Big', 'Joker'),
+                       Card.get('3', 'Spades'), Card.get('King', 'Spades')]
+
+    def test_play_out(self):
+        """Test one fully known deal."""
+        hands = [codes(('Ace', 'Spades'), ('4', 'Hearts')),
+                 codes(('3', 'Spades'), ('King', 'Spades')),
+                 codes(('2', 'Spades'), ('Jack', 'Clubs')),
+                 codes(('Queen', 'Hearts'), ('5', 'Diamonds'))]
+        # Trick 1: A♠ wins; seat 1 cannot beat it and drops its lowest card,
+        # the 3♠, so team 0 takes A♠, 3♠ and 2♠ (1 + 3 + 1 points).
+        # Trick 2: seat 0 leads 4♥ and seat 1 wins it with K♠, taking the
+        # J♣ (off jack, 1 point) that seat 2 must play.
+        self.assertEqual(simulator.play_out(hands, 'Spades'), [5, 1])
+        self.assertEqual(hands, [[], [], [], []])
+
+    def test_play_out_follows_suit(self):
+        """Test that players must follow a trump lead."""
+        hands = [codes(('Ace', 'Spades'), ('4', 'Hearts')),
+                 codes(('2', 'Spades'), ('5', 'Diamonds')),
+                 codes(('6', 'Hearts'), ('7', 'Hearts')),
+                 codes(('8', 'Hearts'), ('9', 'Hearts'))]
+        # Seat 1 would keep the 2♠ to win the second trick, but it must
+        # follow the A♠ lead with it, so team 0 takes both points
+        self.assertEqual(simulator.play_out(hands, 'Spades'), [2, 0])
+
+    def test_simulate_is_reproducible(self):
+        """Test that results depend on the seed, not on the workers."""
+        inline = simulator.simulate(self.strong, 5, deals=600, seed=11,
+                                    workers=1, chunk_size=200)
+        pooled = simulator.simulate(self.strong, 5, deals=600, seed=11,
+                                    workers=2, chunk_size=200)
+        self.assertEqual(inline, pooled)
+
+    def test_simulate_prefers_the_long_suit(self):
+        """Test that the hand is worth most with Spades as trump."""
+        results = simulator.simulate(self.strong, 4, deals=1000, seed=3,
+                                     workers=1)
+        self.assertEqual(len(results), 4)
+        best = results[0]
+        self.assertEqual(best.trump, 'Spades')
+        self.assertEqual(best.deals, 1000)
+        self.assertLessEqual(best.low, best.mean)
+        self.assertLessEqual(best.mean, best.high)
+        self.assertGreater(best.make_rate, 0.9)
+        self.assertLessEqual(best.mean, 10)
+        self.assertLess(results[-1].mean, 0)
+
+    def test_simulate_accepts_codes(self):
+        """Test that the hand can be given as card codes."""
+        by_card = simulator.simulate(self.strong, 4, trumps=['Spades'],
+                                     deals=100, seed=1, workers=1)
+        by_code = simulator.simulate(card_codes.to_codes(self.strong), 4,
+                                     trumps=['Spades'], deals=100, seed=1,
+                                     workers=1)
+        self.assertEqual(by_card, by_code)
+
+    def test_simulate_invalid(self):
+        """Test invalid hands and deal counts."""
+        with self.assertRaises(ValueError):
+            simulator.simulate(self.strong[:1] * 2, 4, deals=10, workers=1)
+        with self.assertRaises(ValueError):
+            simulator.simulate(self.strong, 4, deals=0, workers=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""
+Test Module for the Double-Dummy Solver
+
+This module contains unit tests for the Solver class, checked against a plain
+minimax search over the legal moves without pruning or a transposition
+table.
+
+Classes:
+    TestSolver: A test class containing all unit tests for the Solver class.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import unittest
+from card import Card, SUITS
+import card_codes
+from deck import Deck
+from legal import legal_moves
+from rules import STANDARD, Ruleset
+from solver import Solver, SolverTimeout
+
+
+def minimax(hands, trump, leader=0, ruleset=STANDARD):
+    """
+    Returns the points team 0 takes with perfect play, by trying every legal
+    card of every hand.
+    """
+    index = card_codes.trump_index(trump)
+    ranks = ruleset.tables.rank[index].tolist()
+    points = ruleset.tables.points[index].tolist()
+
+    def search(hands, leader, trick):
+        if len(trick) == 4:
+            winner = max(range(4), key=lambda i: (ranks[trick[i]], -i))
+            seat = (leader + winner) % 4
+            gained = sum(points[code] for code in trick) if seat % 2 == 0 else 0
+            return gained + search(hands, seat, [])
+        seat = (leader + len(trick)) % 4
+        if not hands[seat]:
+            return 0
+        values = []
+        led = trick[0] if trick else None
+        for code in legal_moves(hands[seat], led, trump, ruleset):
+            rest = list(hands)
+            rest[seat] = [other for other in hands[seat] if other != code]
+            values.append(search(rest, leader, trick + [code]))
+        return max(values) if seat % 2 == 0 else min(values)
+
+    return search(hands, leader, [])
+
+
+class TestSolver(unittest.TestCase):
+    """
+    Test class for the Solver class.
+    """
+
+    def test_matches_minimax(self):
+        """Test small deals against a full minimax search."""
+        deals = Deck(12).deal(hands=4, cards=3, tables=12).tolist()
+        for number, hands in enumerate(deals):
+            trump = SUITS[number % len(SUITS)]
+            leader = number % 4
+            result = Solver(trump).solve(hands, leader)
+            self.assertEqual(result.points[0], minimax(hands, trump, leader))
+            total = sum(card_codes.POINTS_TABLE[card_codes.trump_index(trump),
+                                                code]
+                        for hand in hands for code in hand)
+            self.assertEqual(sum(result.points), total)
+
+    def test_known_deal(self):
+        """Test a deal whose result can be worked out by hand."""
+        hands = [[Card.get('Ace', 'Spades'), Card.get('4', 'Hearts')],
+                 [Card.get('3', 'Spades'), Card.get('King', 'Spades')],
+                 [Card.get('2', 'Spades'), Card.get('Jack', 'Clubs')],
+                 [Card.get('Queen', 'Hearts'), Card.get('5', 'Diamonds')]]
+        codes = [card_codes.to_codes(hand).tolist() for hand in hands]
+        # The 3 of trump (3 points) falls to the ace or the off jack whenever
+        # it is played, but the king can take the 2 when the 4 of Hearts is
+        # played with it: team 0 takes A, 3 and J and team 1 takes the 2.
+        result = Solver('Spades').solve(codes)
+        self.assertEqual(result.points, (5, 1))
+        self.assertEqual(minimax(codes, 'Spades'), 5)
+
+    def test_follows_suit(self):
+        """Test that a player must follow a trump lead."""
+        hands = [[Card.get('Ace', 'Spades'), Card.get('4', 'Hearts')],
+                 [Card.get('2', 'Spades'), Card.get('5', 'Diamonds')],
+                 [Card.get('6', 'Hearts'), Card.get('7', 'Hearts')],
+                 [Card.get('8', 'Hearts'), Card.get('9', 'Hearts')]]
+        codes = [card_codes.to_codes(hand).tolist() for hand in hands]
+        # Seat 1 cannot keep the 2 of trump back from the A♠ lead
+        self.assertEqual(Solver('Spades').solve(codes).points, (2, 0))
+
+    def test_ruleset(self):
+        """Test a variant without jokers against a full minimax search."""
+        no_jokers = Ruleset.variant('no jokers', points={'3': 1},
+                                    jokers=False)
+        deck = Deck(16)
+        for number in range(6):
+            hands = deck.deal_remaining([52, 53], hands=4, cards=3).tolist()[0]
+            trump = SUITS[number % len(SUITS)]
+            result = Solver(trump, ruleset=no_jokers).solve(hands)
+            self.assertEqual(result.points[0],
+                             minimax(hands, trump, ruleset=no_jokers))
+
+    def test_table_settings_do_not_change_results(self):
+        """Test that table size and replacement policy only affect speed."""
+        deals = Deck(13).deal(hands=4, cards=6, tables=4).tolist()
+        for hands in deals:
+            expected = Solver('Hearts').solve(hands).points
+            for tt_size, replacement in ((1, 'depth'), (7, 'always'),
+                                         (1 << 10, 'always')):
+                solver = Solver('Hearts', tt_size=tt_size,
+                                replacement=replacement)
+                self.assertEqual(solver.solve(hands).points, expected)
+                # Reusing the filled table gives the same answer again
+                self.assertEqual(solver.solve(hands).points, expected)
+
+    def test_time_limit(self):
+        """Test that a solve past its time limit raises SolverTimeout."""
+        hands = Deck(1).deal(hands=4, cards=6, tables=2).tolist()[1]
+        with self.assertRaises(SolverTimeout):
+            Solver('Hearts', time_limit=0, tt_size=1).solve(hands)
+
+    def test_invalid_input(self):
+        """Test that invalid deals and settings raise ValueError."""
+        with self.assertRaises(ValueError):
+            Solver('Spades').solve([[0], [1], [2]])
+        with self.assertRaises(ValueError):
+            Solver('Spades').solve([[0], [1], [2], [3, 4]])
+        with self.assertRaises(ValueError):
+            Solver('Spades').solve([[0], [1], [2], [0]])
+        with self.assertRaises(ValueError):
+            Solver('Spades', replacement='never')
+        with self.assertRaises(ValueError):
+            Solver('Spades', tt_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Test Module for Suit Symmetry
+
+This module contains unit tests for the suit permutations and the canonical
+form of hands, proving that the permutations preserve the trump rules.
+
+Classes:
+    TestSymmetry: A test class containing all unit tests for suit symmetry.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import random
+import unittest
+from card import Card, DECK, SUITS
+from hand import Hand
+from symmetry import (PERMUTATIONS, canonical, invert, permute_card,
+                      permute_hand)
+
+
+class TestSymmetry(unittest.TestCase):
+    """
+    Test class for the symmetry module.
+    """
+
+    def test_permutations(self):
+        """Test that there are eight distinct permutations of the suits."""
+        self.assertEqual(len(PERMUTATIONS), 8)
+        self.assertEqual(len({tuple(p.items()) for p in PERMUTATIONS}), 8)
+        for permutation in PERMUTATIONS:
+            self.assertEqual(sorted(permutation[suit] for suit in SUITS),
+                             sorted(SUITS))
+            self.assertEqual(permutation['Joker'], 'Joker')
+
+    def test_permutations_preserve_trump_rules(self):
+        """Test that is_trump, symbols, ranks and points are preserved."""
+        for permutation in PERMUTATIONS:
+            for trump in (None, *SUITS):
+                permuted_trump = None if trump is None else permutation[trump]
+                for card in DECK:
+                    image = permute_card(card, permutation)
+                    image = Card(image.name, image.suit)
+                    copy = Card(card.name, card.suit)
+                    copy.set_trump(trump)
+                    image.set_trump(permuted_trump)
+                    self.assertEqual(copy.is_trump(), image.is_trump())
+                    self.assertEqual(copy.symbol, image.symbol)
+                    self.assertEqual(copy.rank, image.rank)
+                    self.assertEqual(copy.points, image.points)
+
+    def test_permute_hand_matches_cards(self):
+        """Test that permuting a hand mask permutes each of its cards."""
+        rng = random.Random(1)
+        for permutation in PERMUTATIONS:
+            cards = rng.sample(DECK, 8)
+            self.assertEqual(permute_hand(Hand(cards), permutation),
+                             Hand(permute_card(card, permutation)
+                                  for card in cards))
+            self.assertEqual(permute_hand(permute_hand(Hand(cards), permutation),
+                                          invert(permutation)), Hand(cards))
+
+    def test_canonical(self):
+        """Test canonical forms and the permutation returned with them."""
+        rng = random.Random(2)
+        for _ in range(200):
+            cards = rng.sample(DECK, 6)
+            trump = rng.choice((None, *SUITS))
+            result = canonical(cards, trump)
+            self.assertEqual(result.trump, None if trump is None else 'Spades')
+            self.assertEqual(permute_hand(Hand(cards), result.permutation),
+                             result.hand)
+            if trump is not None:
+                self.assertEqual(result.hand.trump_count(result.trump),
+                                 Hand(cards).trump_count(trump))
+                self.assertEqual(result.hand.trump_points(result.trump),
+                                 Hand(cards).trump_points(trump))
+
+            # Every equivalent hand has the same canonical form
+            for permutation in PERMUTATIONS:
+                other = canonical(permute_hand(Hand(cards), permutation),
+                                  None if trump is None else permutation[trump])
+                self.assertEqual(other.hand, result.hand)
+
+    def test_canonical_invalid_trump(self):
+        """Test that an invalid trump suit raises ValueError."""
+        with self.assertRaises(ValueError):
+            canonical(Hand(), 'Joker')
+
+
+if __name__ == '__main__':
+    unittest.main()
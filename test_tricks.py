@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Test Module for Trick Resolution
+
+This module contains unit tests for resolving batches of tricks with NumPy,
+checked against resolving them one Card at a time.
+
+Classes:
+    TestTricks: A test class containing all unit tests for trick resolution.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import unittest
+import numpy as np
+from card import Card, SUITS
+import card_codes
+from deck import Deck
+from tricks import resolve_tricks, resolve_tricks_by_card
+
+
+class TestTricks(unittest.TestCase):
+    """
+    Test class for the tricks module.
+    """
+
+    def test_matches_card_comparisons(self):
+        """Test random tricks against Card.set_trump and Card.__gt__."""
+        codes = Deck(8).deal(hands=1, cards=4, tables=2000)[:, 0, :]
+        rng = np.random.default_rng(8)
+        trumps = rng.integers(0, card_codes.NO_TRUMP + 1, len(codes))
+        result = resolve_tricks(codes, trumps)
+
+        expected = resolve_tricks_by_card(
+            card_codes.from_codes(codes),
+            [card_codes.TRUMP_SUITS[trump] for trump in trumps])
+        self.assertEqual(list(zip(result.winner.tolist(),
+                                  result.points.tolist())), expected)
+
+    def test_single_trump_suit(self):
+        """Test one trump suit for every trick."""
+        tricks = [[Card.get('King', 'Hearts'), Card.get('Jack', 'Clubs'),
+                   Card.get('Jack', 'Spades'), Card.get('3', 'Spades')],
+                  [Card.get('4', 'Hearts'), Card.get('Ace', 'Diamonds'),
+                   Card.get('5', 'Clubs'), Card.get('2', 'Hearts')]]
+        codes = [card_codes.to_codes(trick) for trick in tricks]
+        result = resolve_tricks(codes, 'Spades')
+        self.assertEqual(result.winner.tolist(), [2, 0])
+        self.assertEqual(result.points.tolist(), [5, 0])
+
+    def test_no_play(self):
+        """Test tricks in which some seats played no card."""
+        no_play = card_codes.NO_PLAY
+        ace = card_codes.to_code(Card.get('Ace', 'Hearts'))
+        four = card_codes.to_code(Card.get('4', 'Clubs'))
+        codes = [[no_play, four, no_play, no_play],
+                 [no_play, no_play, no_play, no_play],
+                 [four, ace, no_play, no_play]]
+        result = resolve_tricks(codes, ['Spades', 'Spades', 'Hearts'])
+        self.assertEqual(result.winner.tolist(), [1, 0, 1])
+        self.assertEqual(result.points.tolist(), [0, 0, 1])
+
+    def test_leaders(self):
+        """Test that winners are reported as seats when leaders are given."""
+        codes = Deck(4).deal(hands=1, cards=4, tables=50)[:, 0, :]
+        leaders = np.arange(50) % 4
+        by_position = resolve_tricks(codes, 'Clubs')
+        by_seat = resolve_tricks(codes, 'Clubs', leaders=leaders)
+        np.testing.assert_array_equal(by_seat.winner,
+                                      (by_position.winner + leaders) % 4)
+
+    def test_invalid_tricks(self):
+        """Test that invalid tricks raise ValueError."""
+        with self.assertRaises(ValueError):
+            resolve_tricks([0, 1, 2, 3], 'Spades')
+        with self.assertRaises(ValueError):
+            resolve_tricks([[0, 1, 2, 60]], 'Spades')
+        for suit in SUITS:
+            self.assertEqual(resolve_tricks([[0, 1]], suit).winner.shape, (1,))
+
+
+if __name__ == '__main__':
+    unittest.main()
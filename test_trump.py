@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""
+Test Module for TrumpContext Class
+
+This module contains unit tests for the TrumpContext class, which ranks,
+scores and compares cards for a trump suit without modifying them.
+
+Classes:
+    TestTrumpContext: A test class containing all unit tests for TrumpContext.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+
+import threading
+import unittest
+from card import Card, DECK, SUITS
+from trump import TrumpContext
+
+
+class TestTrumpContext(unittest.TestCase):
+    """
+    Test class for the TrumpContext class.
+    """
+
+    def test_matches_set_trump(self):
+        """Test that the context agrees with Card.set_trump for every card."""
+        for suit in (None, *SUITS):
+            context = TrumpContext(suit)
+            for card in DECK:
+                copy = Card(card.name, card.suit)
+                copy.set_trump(suit)
+                self.assertEqual(context.symbol(card), copy.symbol)
+                self.assertEqual(context.rank(card), copy.rank)
+                self.assertEqual(context.points(card), copy.points)
+                self.assertEqual(context.is_trump(card), copy.is_trump())
+
+    def test_does_not_modify_cards(self):
+        """Test that shared cards are left untouched."""
+        jack_clubs = Card.get('Jack', 'Clubs')
+        context = TrumpContext('Spades')
+        self.assertEqual(context.symbol(jack_clubs), 'X')
+        self.assertEqual(context.rank(jack_clubs), 13)
+        self.assertEqual(jack_clubs.symbol, 'J')
+        self.assertEqual(jack_clubs.rank, 14)
+        self.assertIsNone(jack_clubs.trump_suit)
+
+    def test_invalid_suit(self):
+        """Test that invalid trump suits raise ValueError."""
+        with self.assertRaises(ValueError):
+            TrumpContext('InvalidSuit')
+
+    def test_sorting(self):
+        """Test sorting and max with the context key."""
+        hand = [Card.get('4', 'Hearts'), Card.get('Jack', 'Diamonds'),
+                Card.get('Ace', 'Hearts'), Card.get('Big', 'Joker'),
+                Card.get('King', 'Spades')]
+        context = TrumpContext('Hearts')
+        ordered = sorted(hand, key=context.key)
+        self.assertEqual([str(card) for card in ordered],
+                         [' K♠', ' 4♥', ' BJ', ' J♦', ' A♥'])
+        self.assertIs(max(hand, key=context.key), Card.get('Ace', 'Hearts'))
+
+    def test_winner(self):
+        """Test trick winners and trick points."""
+        context = TrumpContext('Spades')
+        trick = [Card.get('King', 'Hearts'), Card.get('Jack', 'Clubs'),
+                 Card.get('Jack', 'Spades'), Card.get('3', 'Spades')]
+        self.assertEqual(context.winner(trick), 2)
+        self.assertEqual(context.trick_points(trick), 5)
+        self.assertTrue(context.beats(trick[2], trick[1]))
+
+        # Non-trump cards tie, so the card played first wins
+        trick = [Card.get('4', 'Hearts'), Card.get('Ace', 'Diamonds')]
+        self.assertEqual(context.winner(trick), 0)
+        with self.assertRaises(ValueError):
+            context.winner([])
+
+    def test_private_cards(self):
+        """Test that Card() copies are handled whatever their trump state."""
+        card = Card('Jack', 'Clubs')
+        card.set_trump('Hearts')
+        self.assertEqual(TrumpContext('Spades').rank(card), 13)
+
+    def test_shared_across_threads(self):
+        """Test one shared deck used under every trump suit concurrently."""
+        results = {}
+
+        def play(suit):
+            context = TrumpContext(suit)
+            for _ in range(200):
+                ranks = [context.rank(card) for card in DECK]
+            results[suit] = ranks
+
+        threads = [threading.Thread(target=play, args=(suit,))
+                   for suit in SUITS]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for suit in SUITS:
+            expected = []
+            for card in DECK:
+                copy = Card(card.name, card.suit)
+                copy.set_trump(suit)
+                expected.append(copy.rank)
+            self.assertEqual(results[suit], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
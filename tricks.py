@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+Tricks Module
+
+This module decides the winners of many tricks at once.  Tricks are given as
+an (n_tricks x n_players) array of card codes in the order they were played,
+with one trump suit per trick, and are resolved with the card_codes lookup
+tables and NumPy instead of calling set_trump() and comparing Card objects.
+
+A trick is won by its highest ranked card.  Non-trump cards all have the rank
+of 'N' (1) and a seat that played no card (card_codes.NO_PLAY) has the rank
+of '_' (0), so when several cards tie for the highest rank, the one played
+first wins, exactly as with TrumpContext.winner().
+
+Classes:
+    TrickResults: The winners and points of a batch of tricks.
+
+Functions:
+    resolve_tricks: Returns the winners and points of a batch of tricks.
+    resolve_tricks_by_card: Resolves tricks one Card at a time (reference).
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from card import Card
+import card_codes
+
+TrickResults = namedtuple('TrickResults', ['winner', 'points'])
+
+_WIDTH = card_codes.RANK_TABLE.shape[1]
+_RANKS = card_codes.RANK_TABLE.ravel()
+_POINTS = card_codes.POINTS_TABLE.ravel()
+
+
+def resolve_tricks(codes, trumps, leaders=None):
+    """
+    Returns the winners and the points of a batch of tricks.
+
+    Args:
+        codes (array_like): The card codes of the tricks, with shape
+              (n_tricks, n_players), in the order the cards were played.
+              card_codes.NO_PLAY marks a seat that played no card.
+        trumps (str, int or array_like): The trump suit of every trick, or
+               one trump suit or trump index per trick.
+        leaders (array_like, optional): The seat that led each trick.  When
+                given, winners are returned as seats instead of positions.
+
+    Returns:
+        TrickResults: The winning position (or seat) of each trick and the
+                      points of the cards in each trick.
+    """
+    codes = np.asarray(codes, dtype=np.intp)
+    if codes.ndim != 2:
+        raise ValueError(f"Tricks must be a 2-D array, not {codes.ndim}-D")
+    if codes.size and (codes.min() < 0 or codes.max() > card_codes.NO_PLAY):
+        raise ValueError("Invalid card code in tricks")
+
+    indexes = card_codes.trump_indexes(trumps)
+    if indexes.ndim == 1:
+        indexes = indexes[:, np.newaxis]
+    # Positions in the flattened [trump index, card code] tables
+    flat = indexes * _WIDTH + codes
+    points = _POINTS.take(flat).sum(axis=1, dtype=np.int64)
+    winners = _RANKS.take(flat).argmax(axis=1)
+    if leaders is not None:
+        winners = (np.asarray(leaders) + winners) % codes.shape[1]
+    return TrickResults(winners, points)
+
+
+def resolve_tricks_by_card(tricks, trumps):
+    """
+    Resolves tricks one card at a time with Card.set_trump() and the Card
+    comparison operators.  This is the reference for resolve_tricks().
+
+    Args:
+        tricks (list): The tricks, each a list of Cards in the order played.
+        trumps (list): The trump suit of each trick.
+
+    Returns:
+        list: The (winning position, points) of each trick.
+    """
+    results = []
+    for trick, trump in zip(tricks, trumps):
+        cards = [Card(card.name, card.suit) for card in trick]
+        for card in cards:
+            card.set_trump(trump)
+        winner = 0
+        for position in range(1, len(cards)):
+            if cards[position] > cards[winner]:
+                winner = position
+        results.append((winner, sum(card.points for card in cards)))
+    return results
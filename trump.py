@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+"""
+Trump Module
+
+This module defines the TrumpContext class, which ranks, scores and compares
+cards for one trump suit without modifying them.  Card.set_trump() stores the
+trump suit on the card itself, so a card can only be used under one trump
+suit at a time; a TrumpContext lets one shared deck (see Card.get()) be used
+by any number of tables and threads at once.  A TrumpContext ranks and scores
+by the standard rules only (Card.trump_table, see rules.STANDARD); for other
+variants use Card.get_trump_entry() with a Ruleset.
+
+Classes:
+    TrumpContext: Trump attributes and comparisons of cards for one trump suit.
+
+Programmer: Michelle Talley
+Copyright (c) 2025 Michelle Talley
+"""
+from card import Card, SORT_KEY_LAST, SUITS, make_sort_key
+
+
+class TrumpContext:
+    """
+    A class to rank, score and compare cards for one trump suit
+    """
+
+    def __init__(self, suit=None):
+        """
+        Initializes a TrumpContext object.
+
+        Args:
+            suit (str, optional): The trump suit. If None, cards keep their
+                 base ranks and have no points.
+        """
+        if suit is not None and suit not in SUITS:
+            raise ValueError(f"Invalid trump suit: {suit}")
+
+        self.suit = suit
+        # Trump entries of the deck cards for this suit, keyed by short name
+        self.entries = {short_name: row[suit]
+                        for short_name, row in Card.trump_table.items()}
+        # Sort keys of the deck cards for this suit, keyed by short name
+        self.sort_keys = {short_name: row[suit]
+                          for short_name, row in Card.sort_keys.items()}
+
+    def __repr__(self):
+        """
+        Returns a string representation of the trump context.
+
+        Returns:
+            str: The trump suit of the context.
+        """
+        return f"TrumpContext({self.suit!r})"
+
+    def entry(self, card):
+        """
+        Returns the trump attributes of a card for this trump suit.
+
+        Args:
+            card (Card): The card to look up.
+
+        Returns:
+            TrumpEntry: The symbol, rank, points and trump status of the card.
+        """
+        try:
+            return self.entries[card.short_name]
+        except KeyError:
+            return card.get_trump_entry(self.suit)
+
+    def is_trump(self, card):
+        """
+        Checks if a card is a trump card.
+
+        Args:
+            card (Card): The card to check.
+
+        Returns:
+            bool: True if the card is a trump card, False otherwise.
+        """
+        return self.entry(card).is_trump
+
+    def symbol(self, card):
+        """
+        Returns the trump symbol of a card.
+
+        Args:
+            card (Card): The card to look up.
+
+        Returns:
+            str: The trump symbol if the card is a trump card, otherwise 'N'.
+        """
+        return self.entry(card).symbol
+
+    def rank(self, card):
+        """
+        Returns the rank of a card.
+
+        Args:
+            card (Card): The card to look up.
+
+        Returns:
+            int: The rank of the card for this trump suit.
+        """
+        return self.entry(card).rank
+
+    def points(self, card):
+        """
+        Returns the points of a card.
+
+        Args:
+            card (Card): The card to look up.
+
+        Returns:
+            int: The points of the card for this trump suit.
+        """
+        return self.entry(card).points
+
+    def key(self, card):
+        """
+        Returns the sort key of a card, for use with sorted(), min() and max().
+        Cards are ordered by rank, then by base rank, then by their place in
+        the deck (see Card.sort_key()).
+
+        Args:
+            card (Card): The card to look up.
+
+        Returns:
+            int: The sort key of the card for this trump suit.
+        """
+        try:
+            return self.sort_keys[card.short_name]
+        except KeyError:
+            return make_sort_key(self.entry(card).rank,
+                                 card.get_trump_entry(None).rank, SORT_KEY_LAST)
+
+    def beats(self, card, other):
+        """
+        Checks if a card ranks above another card.
+
+        Args:
+            card (Card): The card to compare.
+            other (Card): The other card to compare with.
+
+        Returns:
+            bool: True if card ranks above other, False otherwise.
+        """
+        return self.entry(card).rank > self.entry(other).rank
+
+    def winner(self, cards):
+        """
+        Returns the position of the card that wins a trick.  The highest
+        ranked card wins; when cards tie, such as two non-trump cards, the
+        one played first wins.
+
+        Args:
+            cards (list): The cards of the trick, in the order played.
+
+        Returns:
+            int: The index of the winning card in cards.
+        """
+        if not cards:
+            raise ValueError("A trick needs at least one card")
+
+        best = 0
+        best_rank = self.entry(cards[0]).rank
+        for index in range(1, len(cards)):
+            rank = self.entry(cards[index]).rank
+            if rank > best_rank:
+                best, best_rank = index, rank
+        return best
+
+    def trick_points(self, cards):
+        """
+        Returns the total points of the cards in a trick.
+
+        Args:
+            cards (list): The cards of the trick.
+
+        Returns:
+            int: The sum of the points of the cards for this trump suit.
+        """
+        return sum(self.entry(card).points for card in cards)